@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the shipped add-in component (numtowords.uno.py) headless.
+
+Loads the real NumToWords class with the stand-in UNO runtime (uno_stub)
+and converts one column of cells four ways: one numToWords() call per cell
+and one numToWordsRange() call for the column, each called directly and
+through the simulated UNO bridge (uno_stub.MarshallingProxy).  The bridge
+delays are assumptions; pass --call-us and --value-us measured on your
+LibreOffice for a real estimate.
+
+    python bench/bench_addin.py -n 100000 --distinct 5000
+    python bench/bench_addin.py --call-us 20 --value-us 0.2
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+
+import uno_stub  # noqa: E402
+
+
+def _per_cell(addin, column, fmt):
+    for row in column:
+        addin.numToWords(row[0], fmt)
+
+
+def _range(addin, column, fmt):
+    addin.numToWordsRange(column, fmt)
+
+
+def measure(make_addin, func, column, fmt, repeat):
+    """Best seconds over repeat passes, each with a fresh (cold cache) add-in."""
+    best = None
+    for _ in range(repeat):
+        addin = make_addin()
+        start = time.perf_counter()
+        func(addin, column, fmt)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", type=int, default=100000,
+                        help="cells in the column (default 100000)")
+    parser.add_argument("--distinct", type=int, default=5000,
+                        help="distinct values among them (default 5000)")
+    parser.add_argument("--format", type=int, default=2,
+                        help="format style (default 2, currency)")
+    parser.add_argument("--call-us", type=float, default=uno_stub.DEFAULT_CALL_NS / 1000,
+                        help="simulated cost of one bridged call (default %g)"
+                        % (uno_stub.DEFAULT_CALL_NS / 1000))
+    parser.add_argument("--value-us", type=float, default=uno_stub.DEFAULT_ITEM_NS / 1000,
+                        help="simulated cost per value crossing the bridge (default %g)"
+                        % (uno_stub.DEFAULT_ITEM_NS / 1000))
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed passes, best one counts (default 3)")
+    args = parser.parse_args(argv)
+
+    module = uno_stub.load_addin()
+    rng = random.Random(19)
+    pool = [round(rng.uniform(0, 10 ** 6), 2) for _ in range(args.distinct)]
+    column = tuple((rng.choice(pool),) for _ in range(args.n))
+    call_ns = int(args.call_us * 1000)
+    item_ns = int(args.value_us * 1000)
+
+    def direct():
+        return module.NumToWords(None)
+
+    def bridged():
+        return uno_stub.MarshallingProxy(module.NumToWords(None), call_ns, item_ns)
+
+    print(f"{args.n:,} cells, {args.distinct:,} distinct values, format {args.format}; "
+          f"bridge {args.call_us:g} us/call + {args.value_us:g} us/value")
+    print(f"{'entry point':<24} {'direct s':>9} {'bridged s':>10} {'cells/sec':>12} "
+          f"{'bridge share':>13}")
+    print("-" * 72)
+    for name, func in (("numToWords per cell", _per_cell),
+                       ("numToWordsRange", _range)):
+        plain = measure(direct, func, column, args.format, args.repeat)
+        over = measure(bridged, func, column, args.format, args.repeat)
+        print(f"{name:<24} {plain:>9.3f} {over:>10.3f} {args.n / over:>12,.0f} "
+              f"{1 - plain / over:>13.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for very large integers in the conversion engine.
+
+Times _cardinal() on random ints and convert() on digit strings (read as
+Decimal) of increasing length.  With groups sliced from the digit string
+the time per digit should stay roughly flat as the length grows.
+
+    python bench/bench_bigint.py --max-digits 4000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, "python", "pythonpath"))
+
+import numtowords_core as core  # noqa: E402
+
+
+def best_time(func, args, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for a in args:
+            func(a)
+        elapsed = (time.perf_counter() - start) / len(args)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-digits", type=int, default=1000,
+                        help="largest input length in digits (default 1000)")
+    parser.add_argument("--samples", type=int, default=50,
+                        help="random inputs per length (default 50)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timed passes, best one counts (default 5)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1234)
+    lengths = []
+    n = 15
+    while n < args.max_digits:
+        lengths.append(n)
+        n *= 2
+    lengths.append(args.max_digits)
+
+    print(f"{'digits':>7} {'_cardinal us':>13} {'ns/digit':>9} "
+          f"{'convert(str) us':>16} {'ns/digit':>9}")
+    for digits in lengths:
+        texts = [str(rng.randint(1, 9)) + "".join(
+            rng.choice("0123456789") for _ in range(digits - 1))
+            for _ in range(args.samples)]
+        ints = [int(t) for t in texts]
+        t_int = best_time(core._cardinal, ints, args.repeat)
+        t_str = best_time(lambda t: core.convert(t, 0), texts, args.repeat)
+        print(f"{digits:>7} {t_int * 1e6:>13.1f} {t_int * 1e9 / digits:>9.1f} "
+              f"{t_str * 1e6:>16.1f} {t_str * 1e9 / digits:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmarks for the conversion engine (numtowords_core).
+
+Times convert() in cardinal, ordinal and currency mode, and _cardinal() on
+its own, over several value distributions.  For each it reports ops/sec
+(best of --repeat passes), p50/p99 per-call latency and the mean peak of
+memory in use during a call, above what was in use before it (tracemalloc).
+That peak is a lower bound on what a call allocates: memory freed and
+allocated again within the call is not counted twice.
+
+    python bench/bench_convert.py                  # run and print
+    python bench/bench_convert.py --save --note "why"   # store as the baseline
+    python bench/bench_convert.py --compare        # exit 1 on regression
+
+--save runs the whole suite --runs times and stores, per benchmark, the
+median run and the spread of ops/sec between runs ("noise").  --compare
+fails when any benchmark's ops/sec falls more than --threshold percent plus
+that noise below the stored baseline, and warns when it is run with other
+-n/--repeat settings than the baseline was.  Re-record the baseline with
+--save when a slowdown is accepted, and say why with --note; the note is
+kept in the file and printed by --compare.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, "python", "pythonpath"))
+
+import numtowords_core as core  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+
+
+def distributions(n, seed=1234):
+    """Value sets that mirror what real sheets feed the add-in."""
+    rng = random.Random(seed)
+    return {
+        "small_int": [float(rng.randint(0, 999)) for _ in range(n)],
+        "money": [round(rng.uniform(0, 100000), 2) for _ in range(n)],
+        "near_trillion": [float(rng.randint(10 ** 12, 10 ** 15 - 1)) for _ in range(n)],
+        "negative": [-round(rng.uniform(0, 10 ** 6), 2) for _ in range(n)],
+    }
+
+
+BENCHMARKS = {
+    "cardinal": lambda v: core.convert(v, 0),
+    "ordinal": lambda v: core.convert(v, 1),
+    "currency": lambda v: core.convert(v, 2),
+    "_cardinal": core._cardinal,
+}
+
+
+def _inputs(name, values):
+    # _cardinal() takes the non-negative integer part, as convert() passes it
+    if name == "_cardinal":
+        return [int(abs(v)) for v in values]
+    return values
+
+
+def time_pass(func, values):
+    start = time.perf_counter()
+    for v in values:
+        func(v)
+    return time.perf_counter() - start
+
+
+def measure(func, values, best, samples=2000):
+    sample = values[:samples]
+    timer = time.perf_counter_ns
+    latencies = []
+    for v in sample:
+        t = timer()
+        func(v)
+        latencies.append(timer() - t)
+    latencies.sort()
+
+    tracemalloc.start()
+    peak_total = 0
+    for v in sample[:500]:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func(v)
+        peak_total += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": len(values) / best,
+        "p50_ns": latencies[len(latencies) // 2],
+        "p99_ns": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "peak_bytes_per_call": peak_total / min(len(sample), 500),
+    }
+
+
+def run(n, repeat, pattern=None):
+    cases = {}
+    for dist_name, values in distributions(n).items():
+        for bench_name, func in BENCHMARKS.items():
+            key = bench_name + "/" + dist_name
+            if pattern and pattern not in key:
+                continue
+            cases[key] = func, _inputs(bench_name, values)
+    for func, values in cases.values():
+        for v in values[:2000]:  # warm-up
+            func(v)
+    # one pass of every benchmark per round: a slow spell of the machine
+    # then spoils a pass of each benchmark, not every pass of one
+    best = dict.fromkeys(cases, float("inf"))
+    for _ in range(repeat):
+        for key, (func, values) in cases.items():
+            best[key] = min(best[key], time_pass(func, values))
+    return {key: measure(func, values, best[key])
+            for key, (func, values) in cases.items()}
+
+
+def run_many(n, repeat, runs, pattern=None):
+    """run() several times: the median run of each benchmark, with the
+    spread of its ops/sec over all runs as noise_pct."""
+    passes = [run(n, repeat, pattern) for _ in range(runs)]
+    results = {}
+    for key in passes[0]:
+        rows = sorted((p[key] for p in passes), key=lambda r: r["ops_per_sec"])
+        median = dict(rows[len(rows) // 2])
+        spread = rows[-1]["ops_per_sec"] - rows[0]["ops_per_sec"]
+        median["noise_pct"] = round(spread / median["ops_per_sec"] * 100, 1)
+        results[key] = median
+    return results
+
+
+def report(results, baseline=None):
+    noise = any("noise_pct" in r for r in results.values())
+    print(f"{'benchmark':<26} {'ops/sec':>12} {'p50 ns':>8} {'p99 ns':>8} "
+          f"{'peak B':>8}" + (f" {'noise':>6}" if noise else "")
+          + (f" {'vs base':>8}" if baseline else ""))
+    print("-" * (66 + (7 if noise else 0) + (9 if baseline else 0)))
+    for key, r in results.items():
+        line = (f"{key:<26} {r['ops_per_sec']:>12,.0f} {r['p50_ns']:>8} "
+                f"{r['p99_ns']:>8} {r['peak_bytes_per_call']:>8.0f}")
+        if noise:
+            line += f" {r['noise_pct']:>5.1f}%"
+        if baseline and key in baseline:
+            change = r["ops_per_sec"] / baseline[key]["ops_per_sec"] - 1
+            line += f" {change:>+8.1%}"
+        print(line)
+
+
+def regressions(results, baseline, threshold):
+    """Benchmarks whose throughput dropped more than threshold percent plus
+    the noise measured when the baseline was recorded."""
+    failed = []
+    for key, r in results.items():
+        if key not in baseline:
+            continue
+        allowed = threshold + baseline[key].get("noise_pct", 0)
+        floor = baseline[key]["ops_per_sec"] * (1 - allowed / 100)
+        if r["ops_per_sec"] < floor:
+            failed.append(key)
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", type=int, default=20000,
+                        help="values per distribution (default 20000)")
+    parser.add_argument("--repeat", type=int, default=9,
+                        help="timed passes, best one counts (default 9)")
+    parser.add_argument("-k", dest="pattern",
+                        help="only run benchmarks whose name contains this")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON file (default bench/baseline.json)")
+    parser.add_argument("--save", action="store_true",
+                        help="write the results as the new baseline")
+    parser.add_argument("--note", default="",
+                        help="with --save, why the baseline was re-recorded")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="with --save, runs of the suite to measure noise (default 5)")
+    parser.add_argument("--compare", action="store_true",
+                        help="compare against the baseline and fail on regression")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="allowed ops/sec drop in percent (default 10)")
+    args = parser.parse_args(argv)
+
+    if args.save:
+        results = run_many(args.n, args.repeat, args.runs, args.pattern)
+    else:
+        results = run(args.n, args.repeat, args.pattern)
+
+    baseline = None
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as f:
+            saved = json.load(f)
+        baseline = saved["results"]
+        if saved.get("note"):
+            print("Baseline note: " + saved["note"])
+        if (saved.get("n"), saved.get("repeat")) != (args.n, args.repeat):
+            print(f"Warning: baseline recorded with -n {saved.get('n')} "
+                  f"--repeat {saved.get('repeat')}, not -n {args.n} --repeat {args.repeat}")
+    report(results, baseline)
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "n": args.n,
+                "repeat": args.repeat,
+                "runs": args.runs,
+                "note": args.note,
+                "results": results,
+            }, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved baseline to {args.baseline}")
+
+    if baseline is not None:
+        failed = regressions(results, baseline, args.threshold)
+        if failed:
+            print(f"Throughput regressed by more than {args.threshold:g}% plus noise: "
+                  + ", ".join(failed))
+            return 1
+        print(f"No regression beyond {args.threshold:g}% plus noise")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+convert_many() against a plain convert() loop.
+
+Times both on a float64 array for amounts and whole numbers, with every
+value distinct and with values drawn from a few thousand, as cheque runs
+and sheets repeat amounts.  convert_many() deduplicates only when the
+values repeat; with every value distinct building one str per row is most
+of its time.
+
+    python bench/bench_many.py -n 2000000 --repeat 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, "python", "pythonpath"))
+
+import numpy as np  # noqa: E402
+
+import numtowords_core as core  # noqa: E402
+
+
+def workloads(n, rng):
+    return [
+        ("money distinct", [rng.randrange(10 ** 8) / 100 for _ in range(n)], 2),
+        ("money repeated", [rng.randrange(5000) / 100 for _ in range(n)], 2),
+        ("cardinal distinct", [float(rng.randrange(10 ** 9)) for _ in range(n)], 0),
+        ("cardinal repeated", [float(rng.randrange(5000)) for _ in range(n)], 0),
+        ("ordinal repeated", [float(rng.randrange(5000)) for _ in range(n)], 1),
+    ]
+
+
+def best_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", type=int, default=2000000,
+                        help="values per workload (default 2000000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed passes, best one counts (default 3)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(4)
+    print(f"{'workload':<18} {'loop/s':>11} {'many/s':>12} {'speedup':>8}")
+    print("-" * 52)
+    for name, values, fmt in workloads(args.n, rng):
+        arr = np.array(values)
+        assert core.convert_many(arr[:1000], fmt) == [
+            core.convert(v, fmt) for v in values[:1000]], name
+        t_loop = best_time(lambda: [core.convert(v, fmt) for v in values], 1)
+        t_many = best_time(lambda: core.convert_many(arr, fmt), args.repeat)
+        n = len(values)
+        print(f"{name:<18} {n / t_loop:>11,.0f} {n / t_many:>12,.0f} "
+              f"{t_loop / t_many:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for process-pool bulk conversion (numtowords_bulk).
+
+Converts the same money-amount column with 1, 2, 4 ... workers and reports
+throughput and speedup over a single process.
+
+    python bench/bench_parallel.py -n 5000000 --chunk-size 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, "python", "pythonpath"))
+
+from numtowords_bulk import convert_parallel  # noqa: E402
+
+
+def worker_counts(limit):
+    counts = []
+    n = 1
+    while n < limit:
+        counts.append(n)
+        n *= 2
+    counts.append(limit)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", type=int, default=2000000,
+                        help="values to convert (default 2000000)")
+    parser.add_argument("--chunk-size", type=int, default=100000,
+                        help="values per chunk (default 100000)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="largest worker count to try (default: CPU count)")
+    parser.add_argument("--format", type=int, default=2,
+                        help="format style (default 2, currency)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1234)
+    values = [round(rng.uniform(0, 10 ** 7), 2) for _ in range(args.n)]
+
+    print(f"{args.n:,} values, chunk size {args.chunk_size:,}, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'seconds':>9} {'values/sec':>14} {'speedup':>8}")
+    single = None
+    for workers in worker_counts(args.max_workers):
+        start = time.perf_counter()
+        convert_parallel(values, args.format, workers, args.chunk_size)
+        elapsed = time.perf_counter() - start
+        single = single or elapsed
+        print(f"{workers:>7} {elapsed:>9.2f} {args.n / elapsed:>14,.0f} "
+              f"{single / elapsed:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
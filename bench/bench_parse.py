@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the words-to-number parser (numtowords_parse).
+
+Generates phrases with convert() in cardinal, ordinal and currency mode and
+times words_to_number() over all of them.
+
+    python bench/bench_parse.py -n 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, "python", "pythonpath"))
+
+from numtowords_core import convert  # noqa: E402
+from numtowords_parse import words_to_number  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", type=int, default=1000000,
+                        help="phrases to parse (default 1000000)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1234)
+    phrases = []
+    for i in range(args.n):
+        value = round(rng.uniform(0, 10 ** rng.randint(1, 12)), 2)
+        phrases.append(convert(value, i % 3))
+
+    start = time.perf_counter()
+    for phrase in phrases:
+        words_to_number(phrase)
+    elapsed = time.perf_counter() - start
+
+    chars = sum(map(len, phrases))
+    print(f"{args.n:,} phrases in {elapsed:.2f} s: {args.n / elapsed:,.0f} phrases/sec, "
+          f"{elapsed / args.n * 1e6:.2f} us/phrase, {chars / elapsed / 1e6:.1f} M chars/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Soros rules (numtowords_soros, the shipped en.sor) against the hand-written
+English engine.
+
+Both word the same numbers the same way; this times each on random inputs
+for cardinals, large cardinals, ordinals and currency.  "rules cold" starts
+every pass with an empty memo cache, so each number is worked through the
+compiled rules; "rules warm" repeats the pass with the cache filled, as a
+sheet with repeated values would.  Compiling en.sor is timed on its own.
+
+    python bench/bench_soros.py -n 20000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, "python", "pythonpath"))
+
+import numtowords_core as core  # noqa: E402
+import numtowords_soros as soros  # noqa: E402
+
+
+def workloads(n, rng):
+    small = [rng.randrange(10 ** 6) for _ in range(n)]
+    large = [rng.randrange(10 ** 15) for _ in range(n)]
+    money = [rng.randrange(10 ** 8) for _ in range(n)]
+    return [
+        ("cardinal", small, lambda v: core.convert(v, 0), str),
+        ("cardinal 1e15", large, lambda v: core.convert(v, 0), str),
+        ("ordinal", small, lambda v: core.convert(v, 1), "ordinal %d".__mod__),
+        ("currency", money, lambda v: core.convert(v / 100, 2),
+         lambda v: "money USD %d.%02d" % divmod(v, 100)),
+    ]
+
+
+def best_time(func, values, repeat, before=None):
+    best = None
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        for v in values:
+            func(v)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", type=int, default=20000,
+                        help="inputs per workload (default 20000)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timed passes, best one counts (default 5)")
+    args = parser.parse_args(argv)
+
+    path = os.path.join(soros.RULES_DIR, "en.sor")
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    start = time.perf_counter()
+    program = soros.Program(source, "en.sor", cache_max=16 * args.n)
+    print(f"en.sor: {len(program.rules)} rules compiled in "
+          f"{(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    def clear():
+        for cache in program._caches:
+            cache.clear()
+
+    rng = random.Random(25)
+    print(f"{'workload':<14} {'engine/s':>11} {'rules cold/s':>13} {'rules warm/s':>13} "
+          f"{'cold vs engine':>15}")
+    print("-" * 70)
+    for name, values, engine, text in workloads(args.n, rng):
+        texts = [text(v) for v in values]
+        for v, t in zip(values[:200], texts):
+            assert program.run(t) == engine(v), (name, v)
+        t_engine = best_time(engine, values, args.repeat)
+        t_cold = best_time(program.run, texts, args.repeat, clear)
+        t_warm = best_time(program.run, texts, args.repeat)
+        n = len(values)
+        print(f"{name:<14} {n / t_engine:>11,.0f} {n / t_cold:>13,.0f} "
+              f"{n / t_warm:>13,.0f} {t_engine / t_cold:>14.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
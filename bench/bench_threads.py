@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Throughput of the add-in called from several threads at once.
+
+Calc's threaded formula calculation calls NUMTOWORDS() for the cells of a
+formula group from worker threads.  This runs one add-in instance headless
+(uno_stub) and makes the same number of numToWords() calls on 1, 2, 4, ...
+threads, each thread taking an equal share of a column with repeated
+values (so most calls are cache hits, as on a real sheet).  On a CPython
+with the GIL more threads cannot add throughput; the figure to watch there
+is how little it drops.  On a free-threaded build (python3.13t and later)
+the calls run in parallel.
+
+    python bench/bench_threads.py -n 200000 --threads 1,2,4,8
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir))
+
+import uno_stub  # noqa: E402
+
+
+def measure(addin, shares, fmt):
+    """Seconds for every thread to convert its share, all started together."""
+    barrier = threading.Barrier(len(shares) + 1)
+
+    def work(share):
+        barrier.wait()
+        for value in share:
+            addin.numToWords(value, fmt)
+
+    threads = [threading.Thread(target=work, args=(share,)) for share in shares]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", type=int, default=200000,
+                        help="calls per run, split over the threads (default 200000)")
+    parser.add_argument("--distinct", type=int, default=5000,
+                        help="distinct values among them (default 5000)")
+    parser.add_argument("--threads", default="1,2,4,8",
+                        help="comma-separated thread counts (default 1,2,4,8)")
+    parser.add_argument("--format", type=int, default=2,
+                        help="format style (default 2, currency)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per thread count, best one counts (default 3)")
+    args = parser.parse_args(argv)
+
+    module = uno_stub.load_addin()
+    rng = random.Random(21)
+    pool = [round(rng.uniform(0, 10 ** 6), 2) for _ in range(args.distinct)]
+    column = [rng.choice(pool) for _ in range(args.n)]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, "
+          f"{os.cpu_count()} CPUs; {args.n:,} calls, {args.distinct:,} distinct values, "
+          f"format {args.format}")
+    print(f"{'threads':>7} {'seconds':>9} {'calls/sec':>12} {'vs 1 thread':>12}")
+    print("-" * 43)
+    base = None
+    for count in (int(c) for c in args.threads.split(",")):
+        shares = [column[i::count] for i in range(count)]
+        best = None
+        for _ in range(args.repeat):
+            addin = module.NumToWords(None)
+            for value in pool:                 # warm cache: measure the hits
+                addin.numToWords(value, args.format)
+            elapsed = measure(addin, shares, args.format)
+            best = elapsed if best is None else min(best, elapsed)
+        rate = args.n / best
+        base = base or rate
+        print(f"{count:>7} {best:>9.3f} {rate:>12,.0f} {rate / base:>11.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Load test for the JSON-lines conversion server (numtowords_server).
+
+Opens several connections, keeps a window of requests in flight on each
+and reports throughput and latency percentiles.  Without --tcp or --unix a
+local server is started on a temporary Unix socket for the run.
+
+    python bench/load_server.py -c 50 -n 200000 --window 16
+    python bench/load_server.py --tcp 127.0.0.1:8765 --distinct 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PYTHONPATH = os.path.join(HERE, os.pardir, "python", "pythonpath")
+
+
+async def _connect(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    host, _, port = args.tcp.rpartition(":")
+    return await asyncio.open_connection(host, int(port))
+
+
+async def _client(args, requests, latencies):
+    reader, writer = await _connect(args)
+    window = asyncio.Semaphore(args.window)
+    sent = []
+
+    async def send():
+        for line in requests:
+            await window.acquire()
+            sent.append(time.perf_counter())
+            writer.write(line)
+            await writer.drain()
+
+    async def receive():
+        for i in range(len(requests)):
+            answer = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent[i])
+            window.release()
+            if answer.get("id") != i or "words" not in answer:
+                raise RuntimeError("unexpected answer %r to request %d" % (answer, i))
+
+    await asyncio.gather(send(), receive())
+    writer.close()
+
+
+async def _stats(args):
+    reader, writer = await _connect(args)
+    writer.write(b'{"stats": true}\n')
+    answer = json.loads(await reader.readline())
+    writer.close()
+    return answer["stats"]
+
+
+async def _run(args):
+    rng = random.Random(16)
+    pool = [round(rng.uniform(0, 10 ** 7), 2) for _ in range(args.distinct)]
+    per_client = args.n // args.connections
+    clients = [[(json.dumps({"id": i, "value": rng.choice(pool),
+                             "format": args.format}) + "\n").encode()
+                for i in range(per_client)]
+               for _ in range(args.connections)]
+    before = await _stats(args)
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(args, requests, latencies) for requests in clients))
+    elapsed = time.perf_counter() - start
+    after = await _stats(args)
+    return elapsed, sorted(latencies), {k: after[k] - before[k] for k in after}
+
+
+def _percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+def _start_server(args, directory):
+    args.unix = os.path.join(directory, "numtowords.sock")
+    env = dict(os.environ, PYTHONPATH=PYTHONPATH)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "numtowords_server", "--unix", args.unix,
+         "--max-delay-ms", str(args.max_delay_ms), "--max-batch", str(args.max_batch)],
+        env=env, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while not os.path.exists(args.unix):
+        if server.poll() is not None or time.monotonic() > deadline:
+            raise RuntimeError("server did not start")
+        time.sleep(0.05)
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--tcp", metavar="HOST:PORT", help="server to test")
+    where.add_argument("--unix", metavar="PATH", help="server to test")
+    parser.add_argument("-n", type=int, default=200000,
+                        help="total requests (default 200000)")
+    parser.add_argument("-c", "--connections", type=int, default=50,
+                        help="concurrent connections (default 50)")
+    parser.add_argument("--window", type=int, default=16,
+                        help="requests in flight per connection (default 16)")
+    parser.add_argument("--distinct", type=int, default=10000,
+                        help="distinct values to draw from (default 10000)")
+    parser.add_argument("--format", type=int, default=2,
+                        help="format style (default 2, currency)")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0,
+                        help="batch latency budget of a spawned server (default 2)")
+    parser.add_argument("--max-batch", type=int, default=1024,
+                        help="batch size of a spawned server (default 1024)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        server = None
+        if not args.tcp and not args.unix:
+            server = _start_server(args, directory)
+        try:
+            elapsed, latencies, stats = asyncio.run(_run(args))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    count = len(latencies)
+    print(f"{count:,} requests over {args.connections} connections, "
+          f"window {args.window}, {args.distinct:,} distinct values")
+    print(f"{count / elapsed:,.0f} requests/sec in {elapsed:.2f} s")
+    print("latency ms  p50 %.2f  p90 %.2f  p99 %.2f  p99.9 %.2f  max %.2f" % (
+        _percentile(latencies, 0.5), _percentile(latencies, 0.9),
+        _percentile(latencies, 0.99), _percentile(latencies, 0.999),
+        latencies[-1] * 1000))
+    if stats["batches"]:
+        print(f"{stats['batches']:,} batches, {stats['requests'] / stats['batches']:,.1f} "
+              f"requests and {stats['values'] / stats['batches']:,.1f} distinct values each")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
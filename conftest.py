@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The conversion engine ships in the extension's pythonpath/ directory
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "python", "pythonpath"))
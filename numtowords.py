@@ -11,6 +11,86 @@ from com.sun.star.lang import XServiceName, XLocalizable
 from com.sun.star.sheet import XAddIn
 
 
+# Word tables, built once at import rather than on every call
+_ONES = [
+    "",
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+_TEENS = [
+    "ten",
+    "eleven",
+    "twelve",
+    "thirteen",
+    "fourteen",
+    "fifteen",
+    "sixteen",
+    "seventeen",
+    "eighteen",
+    "nineteen",
+]
+_TENS = [
+    "",
+    "",
+    "twenty",
+    "thirty",
+    "forty",
+    "fifty",
+    "sixty",
+    "seventy",
+    "eighty",
+    "ninety",
+]
+
+# Large number scales
+_SCALES = [
+    (10**12, "trillion"),
+    (10**9, "billion"),
+    (10**6, "million"),
+    (10**3, "thousand"),
+    (1, ""),
+]
+
+
+def _convert_below_thousand(n):
+    """Convert numbers 0-999 to words."""
+    if n == 0:
+        return ""
+
+    result = ""
+
+    # Hundreds
+    if n >= 100:
+        result += _ONES[n // 100] + " hundred"
+        n %= 100
+        if n > 0:
+            result += " and "
+
+    # Tens and ones
+    if n >= 20:
+        result += _TENS[n // 10]
+        n %= 10
+        if n > 0:
+            result += "-" + _ONES[n]
+    elif n >= 10:
+        result += _TEENS[n - 10]
+    elif n > 0:
+        result += _ONES[n]
+
+    return result
+
+
+# Words for every 0-999 group, precomputed once
+_BELOW_THOUSAND = [_convert_below_thousand(n) for n in range(1000)]
+
+
 # Implementation of the number-to-words converter
 class NumToWordsAddIn(unohelper.Base, XServiceName, XAddIn, XLocalizable):
     def __init__(self, ctx):
@@ -127,92 +207,18 @@ class NumToWordsAddIn(unohelper.Base, XServiceName, XAddIn, XLocalizable):
         integer_part = int(num)
         decimal_part = int(round((num - integer_part) * 100))
 
-        # Basic number words
-        ones = [
-            "",
-            "one",
-            "two",
-            "three",
-            "four",
-            "five",
-            "six",
-            "seven",
-            "eight",
-            "nine",
-        ]
-        teens = [
-            "ten",
-            "eleven",
-            "twelve",
-            "thirteen",
-            "fourteen",
-            "fifteen",
-            "sixteen",
-            "seventeen",
-            "eighteen",
-            "nineteen",
-        ]
-        tens = [
-            "",
-            "",
-            "twenty",
-            "thirty",
-            "forty",
-            "fifty",
-            "sixty",
-            "seventy",
-            "eighty",
-            "ninety",
-        ]
-
-        def convert_below_thousand(n):
-            """Convert numbers 0-999 to words."""
-            if n == 0:
-                return ""
-
-            result = ""
-
-            # Hundreds
-            if n >= 100:
-                result += ones[n // 100] + " hundred"
-                n %= 100
-                if n > 0:
-                    result += " and "
-
-            # Tens and ones
-            if n >= 20:
-                result += tens[n // 10]
-                n %= 10
-                if n > 0:
-                    result += "-" + ones[n]
-            elif n >= 10:
-                result += teens[n - 10]
-            elif n > 0:
-                result += ones[n]
-
-            return result
-
-        # Large number scales
-        scales = [
-            (10**12, "trillion"),
-            (10**9, "billion"),
-            (10**6, "million"),
-            (10**3, "thousand"),
-            (1, ""),
-        ]
-
         # Convert integer part
         if integer_part == 0:
             words = "zero"
         else:
             parts = []
-            for scale_value, scale_name in scales:
+            for scale_value, scale_name in _SCALES:
                 if integer_part >= scale_value:
                     scale_part = integer_part // scale_value
                     integer_part %= scale_value
 
                     if scale_part > 0:
-                        scale_words = convert_below_thousand(scale_part)
+                        scale_words = _BELOW_THOUSAND[scale_part]
                         if scale_words:
                             if scale_name:
                                 parts.append(f"{scale_words} {scale_name}")
@@ -254,7 +260,7 @@ class NumToWordsAddIn(unohelper.Base, XServiceName, XAddIn, XLocalizable):
                 if digit == "0":
                     decimal_words.append("zero")
                 else:
-                    decimal_words.append(ones[int(digit)])
+                    decimal_words.append(_ONES[int(digit)])
             words += " point " + " ".join(decimal_words)
 
         return words.strip()
@@ -0,0 +1,61 @@
+#!/bin/bash
+# Build script for the Python UNO extension (NumToWordsPy.oxt)
+#
+#   PYTHON     interpreter used to precompile pythonpath/ — use LibreOffice's
+#              bundled Python where it has one, so the .pyc files match it
+#              (default: python3)
+#   TYPES_RDB  LibreOffice's type library, for the com::sun::star types the
+#              IDL names (default: /usr/lib/libreoffice/program/types.rdb)
+#
+# unoidl-write (LibreOffice SDK, Debian package libreoffice-dev-bin) must be
+# on PATH: NumToWords.rdb is always rebuilt from the IDL, never shipped stale.
+
+set -e
+cd "$(dirname "$0")"
+
+PYTHON="${PYTHON:-python3}"
+TYPES_RDB="${TYPES_RDB:-/usr/lib/libreoffice/program/types.rdb}"
+
+if ! command -v unoidl-write >/dev/null 2>&1; then
+    echo "error: unoidl-write not found; install the LibreOffice SDK" >&2
+    exit 1
+fi
+if [ ! -f "$TYPES_RDB" ]; then
+    echo "error: $TYPES_RDB not found; set TYPES_RDB to LibreOffice's types.rdb" >&2
+    exit 1
+fi
+
+echo "Building NumToWordsPy.oxt..."
+
+# UNO type library for the add-in interface
+rm -f NumToWords.rdb
+unoidl-write "$TYPES_RDB" ../idl/com/numbertext/converter/NumToWords.idl NumToWords.rdb
+echo "Regenerated NumToWords.rdb"
+
+# Precompile the engine; unchecked-hash .pyc files stay valid after the
+# extension manager unpacks the OXT with new timestamps
+find pythonpath -name __pycache__ -prune -exec rm -rf {} +
+"$PYTHON" -m compileall -q --invalidation-mode unchecked-hash pythonpath
+
+# Cold import time of the engine — the cost the first =NUMTOWORDS() pays
+"$PYTHON" -c "
+import sys, time
+sys.path.insert(0, 'pythonpath')
+t = time.perf_counter()
+import numtowords_core
+print('Engine import: %.1f ms' % ((time.perf_counter() - t) * 1000))
+"
+
+rm -f NumToWordsPy.oxt
+zip -r NumToWordsPy.oxt \
+    numtowords.uno.py \
+    CalcAddIns.xcu \
+    Addons.xcu \
+    NumToWords.xcs \
+    NumToWords.rdb \
+    description.xml \
+    META-INF/manifest.xml \
+    pythonpath
+
+echo "Created NumToWordsPy.oxt"
+echo "Size: $(du -h NumToWordsPy.oxt | cut -f1)"
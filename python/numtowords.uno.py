@@ -1,12 +1,27 @@
 # NumToWords LibreOffice Calc Add-In
 # Python UNO component - mirrors the pattern used by libnumbertext
-# Provides: =NUMTOWORDS(number, formatStyle)
-#   formatStyle: 0 = cardinal (default), 1 = ordinal, 2 = currency (USD)
+# Provides: =NUMTOWORDS(number, formatStyle, options, currency)
+#   formatStyle: 0 = cardinal (default), 1 = ordinal, 2 = currency
+#   options: styling, e.g. "upper only" (upper, title, noand, only)
+#   currency: ISO code for formatStyle 2 — USD (default), EUR, GBP, PHP, JPY
+# =NUMTOWORDS.FMT(number, template, currency), e.g. "*** {words:upper} ONLY ***",
+# and Tools > Add-Ons > Number to Words, which replaces the selected cells
+# with static words (ConvertSelectionJob).
+#   Wording follows the document locale: English, Spanish, French, German.
+# Thin UNO adapter; the conversion itself is in pythonpath/numtowords_core.py.
+
+import os
+import threading
+from collections import OrderedDict
+from time import perf_counter_ns
 
 import uno
 import unohelper
-from com.sun.star.lang import XServiceInfo, XLocalizable, Locale
+from com.sun.star.awt import XCallback
+from com.sun.star.beans import PropertyValue
+from com.sun.star.lang import XServiceInfo, XLocalizable, Locale, IllegalArgumentException
 from com.sun.star.sheet import XAddIn
+from com.sun.star.task import XJobExecutor
 # Import the custom UNO interface from NumToWords.rdb — this is what makes
 # numToWords() visible to LibreOffice's UNO introspection (same technique
 # libnumbertext uses with XNumberText).
@@ -14,128 +29,368 @@ from com.numbertext.converter import NumToWordsConverter
 
 IMPLEMENTATION_NAME = "com.numbertext.converter.NumToWordsPy"
 SERVICE_NAME = "com.sun.star.sheet.AddIn"
+# Menu command, triggered by service:...ConvertSelection?<formatStyle|cancel>
+JOB_IMPLEMENTATION_NAME = "com.numbertext.converter.ConvertSelectionPy"
+JOB_SERVICE_NAME = "com.numbertext.converter.ConvertSelection"
+# Function Wizard texts; keep in step with CalcAddIns.xcu
+FUNCTION_DESCRIPTIONS = {
+    "numToWords": "Converts a number to words in the document language "
+                  "(English, Spanish, French or German; others get English)",
+    "numToWordsFmt": "Fills a text template with the words of an amount in the "
+                     'document language, e.g. "*** {words:upper} ONLY ***"',
+    "numToWordsRange": "Converts every number in a range to words in the document "
+                       "language; enter as an array formula",
+    "wordsToNumber": "Converts English number words (cardinal, ordinal or an amount "
+                     "in any supported currency) back to a number",
+    "numToWordsStats": "Call counts, timings and errors of the NumToWords add-in "
+                       "in this process",
+}
+# (display name, description) of each argument, by function
+FUNCTION_ARGUMENTS = {
+    "numToWords": (
+        ("Number", "The number to convert to words"),
+        ("FormatStyle", "0=cardinal (default), 1=ordinal, "
+                        "2=currency (USD unless Currency is given)"),
+        ("Options", 'Styling, any of: upper, title, noand, only (e.g. "upper only")'),
+        ("Currency", "ISO currency code for FormatStyle 2: "
+                     "USD (default), EUR, GBP, PHP, JPY"),
+    ),
+    "numToWordsFmt": (
+        ("Number", "The amount to put in words"),
+        ("Template", "Text with fields {words} {cardinal} {ordinal} {sign} {int} "
+                     "{unit} {minor} {minorunit} {cents}, each optionally "
+                     ":upper, :lower or :title"),
+        ("Currency", "ISO currency code: USD (default), EUR, GBP, PHP, JPY"),
+    ),
+    "numToWordsRange": (
+        ("Numbers", "The range of numbers to convert to words"),
+        ("FormatStyle", "0=cardinal (default), 1=ordinal, 2=currency (USD)"),
+    ),
+    "wordsToNumber": (
+        ("Text", "The number in words, e.g. as produced by NUMTOWORDS"),
+    ),
+    "numToWordsStats": (
+        ("Item", 'Optional: counter name, e.g. "calls", "errors", '
+                 '"max_ms.currency", "p99_us"; omit for a summary'),
+    ),
+}
+# Extension configuration (schema in NumToWords.xcs)
+CONFIG_NODE = "/com.numbertext.converter.NumToWords/Settings"
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_SETTINGS = {
+    "CacheSize": DEFAULT_CACHE_SIZE,
+    "ProfileEvery": 0,          # profile every Nth call; 0 = off
+    "ProfileDumpEvery": 100,    # write results every N sampled calls
+    "ProfileDir": "",           # "" = <tempdir>/numtowords-profile
+}
+# Environment variables override the profiling settings
+PROFILE_ENV = {
+    "ProfileEvery": "NUMTOWORDS_PROFILE_EVERY",
+    "ProfileDumpEvery": "NUMTOWORDS_PROFILE_DUMP_EVERY",
+    "ProfileDir": "NUMTOWORDS_PROFILE_DIR",
+}
 
 
-def _ones():
-    return ["", "one", "two", "three", "four", "five", "six", "seven",
-            "eight", "nine", "ten", "eleven", "twelve", "thirteen",
-            "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-
-
-def _tens():
-    return ["", "", "twenty", "thirty", "forty", "fifty",
-            "sixty", "seventy", "eighty", "ninety"]
-
-
-def _below_thousand(n):
-    ones = _ones()
-    tens = _tens()
-    if n == 0:
-        return ""
-    elif n < 20:
-        return ones[n]
-    elif n < 100:
-        t = tens[n // 10]
-        o = ones[n % 10]
-        return t + ("-" + o if o else "")
-    else:
-        h = ones[n // 100] + " hundred"
-        rest = n % 100
-        if rest:
-            return h + " and " + _below_thousand(rest)
-        return h
-
-
-def _cardinal(n):
-    """Convert integer part to cardinal words."""
-    if n == 0:
-        return "zero"
-    parts = []
-    scales = [
-        (10 ** 12, "trillion"),
-        (10 ** 9,  "billion"),
-        (10 ** 6,  "million"),
-        (10 ** 3,  "thousand"),
-    ]
-    for scale, name in scales:
-        if n >= scale:
-            parts.append(_below_thousand(n // scale) + " " + name)
-            n %= scale
-    if n > 0:
-        parts.append(_below_thousand(n))
-    return " ".join(parts)
-
-
-_ORDINAL_MAP = {
-    "one": "first", "two": "second", "three": "third", "five": "fifth",
-    "eight": "eighth", "nine": "ninth", "twelve": "twelfth",
-}
+# The conversion engine lives in pythonpath/numtowords_core.py and is imported
+# on first use, so registering the add-in when Calc starts stays cheap.
+_core = None
+_parser = None
+_TOKENS = "tokens"   # cache key marker: English token ids, shared by all styles
+_TEMPLATE = "template"   # cache key marker: NUMTOWORDS.FMT results
+
+
+def _engine():
+    global _core
+    if _core is None:
+        import numtowords_core
+        _core = numtowords_core
+    return _core
 
 
-def _to_ordinal(cardinal):
-    words = cardinal.split()
-    last = words[-1]
-    # handle hyphenated tens: "twenty-one" -> "twenty-first"
-    if "-" in last:
-        prefix, unit = last.rsplit("-", 1)
-        words[-1] = prefix + "-" + _ordinal_suffix(unit)
-    else:
-        words[-1] = _ordinal_suffix(last)
-    return " ".join(words)
-
-
-def _ordinal_suffix(word):
-    if word in _ORDINAL_MAP:
-        return _ORDINAL_MAP[word]
-    if word.endswith("t"):
-        return word + "h"
-    if word.endswith("e"):
-        return word[:-1] + "th"
-    if word.endswith("y"):
-        return word[:-1] + "ieth"
-    return word + "th"
-
-
-def convert(number, fmt):
-    """Core conversion. fmt: 0=cardinal, 1=ordinal, 2=currency."""
-    negative = number < 0
-    number = abs(number)
-    int_part = int(number)
-    frac_cents = round((number - int_part) * 100)
-
-    words = _cardinal(int_part)
-
-    if fmt == 1:
-        words = _to_ordinal(words)
-    elif fmt == 2:
-        words += " dollar" + ("" if int_part == 1 else "s")
-        if frac_cents:
-            cent_words = _cardinal(frac_cents)
-            words += " and " + cent_words + " cent" + ("" if frac_cents == 1 else "s")
-    else:
-        if frac_cents:
-            # spell out decimal digits individually
-            cent_str = f"{frac_cents:02d}"
-            digit_words = " ".join(_ones()[int(d)] for d in cent_str)
-            words += " point " + digit_words
-
-    return ("minus " if negative else "") + words
+def _format_style(formatStyle):
+    # formatStyle arrives as void any when omitted — treat as 0 (cardinal)
+    if formatStyle is None:
+        return 0
+    try:
+        return int(formatStyle)
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
+
+def _style_spec(options):
+    # options is void any when omitted — the plain style
+    return "" if options is None else str(options).strip()
+
+
+def _currency_code(currency):
+    # currency is void any (or an empty cell) when omitted — USD
+    if currency is None or currency == "":
+        return "USD"
+    return str(currency).strip().upper()
+
+
+class _LRUCache:
+    """Size-bounded result cache with least-recently-used eviction.
+
+    A maxsize of 0 disables caching.  Hit, miss and eviction counters are
+    kept so cache effectiveness can be checked on real sheets.
+
+    Calc may evaluate formula groups on several threads, so the entries are
+    spread by key hash over independently locked shards, each evicting its
+    own least recently used entry: concurrent calls only wait for each other
+    when their keys land in the same shard, never on one global lock.
+    """
+
+    SHARDS = 16
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = max(0, int(maxsize))
+        count = max(1, min(self.SHARDS, self.maxsize))
+        self._shards = tuple(_CacheShard(self.maxsize // count + (i < self.maxsize % count))
+                             for i in range(count))
+        self._count = count
+
+    def get(self, key):
+        # the shard's get() inlined: this is every call's hot path
+        # (and acquire/release costs half of a with block)
+        shard = self._shards[hash(key) % self._count]
+        shard.lock.acquire()
+        try:
+            value = shard.data[key]
+        except KeyError:
+            shard.misses += 1
+            return None
+        else:
+            shard.data.move_to_end(key)
+            shard.hits += 1
+            return value
+        finally:
+            shard.lock.release()
+
+    def put(self, key, value):
+        if self.maxsize:
+            self._shards[hash(key) % self._count].put(key, value)
+
+    def clear(self):
+        for shard in self._shards:
+            shard.clear()
+
+    def stats(self):
+        totals = {"size": 0, "maxsize": self.maxsize, "hits": 0, "misses": 0,
+                  "evictions": 0}
+        for shard in self._shards:
+            with shard.lock:
+                totals["size"] += len(shard.data)
+                totals["hits"] += shard.hits
+                totals["misses"] += shard.misses
+                totals["evictions"] += shard.evictions
+        return totals
+
+
+class _CacheShard:
+    """One lock-protected LRU partition of an _LRUCache."""
+
+    __slots__ = ("maxsize", "data", "lock", "hits", "misses", "evictions")
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# recorded format -> counter name; NUMTOWORDS.FMT calls count as "template"
+_STYLE_NAMES = {0: "cardinal", 1: "ordinal", 2: "currency", _TEMPLATE: "template"}
+
+
+class _Counters:
+    """One thread's share of the _CallStats counters."""
+
+    __slots__ = ("styles", "errors", "histogram")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.styles = {}      # style name -> [calls, total_ns, max_ns]
+        self.errors = {}      # exception type name -> count
+        self.histogram = [0] * _CallStats.BUCKETS
+
+
+class _CallStats:
+    """Per-process call counters behind =NUMTOWORDSSTATS().
+
+    Calls, total and max time per format style, errors by exception type
+    and a latency histogram (bucket i counts calls under 2**i microseconds).
+    Each thread counts into its own _Counters, so recording takes no lock
+    and loses no update when Calc calls the add-in from several threads;
+    snapshot() adds the threads' counters up.
+    """
+
+    BUCKETS = 24
+
+    def __init__(self):
+        self._local = threading.local()
+        self._threads = []           # every thread's _Counters, ever
+        self._threads_lock = threading.Lock()
+
+    def _counters(self):
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = self._local.counters = _Counters()
+            with self._threads_lock:
+                self._threads.append(counters)
+            return counters
+
+    def reset(self):
+        # a call being recorded on another thread meanwhile may survive it
+        with self._threads_lock:
+            for counters in self._threads:
+                counters.reset()
+
+    def record(self, fmt, elapsed_ns):
+        try:
+            own = self._local.counters
+        except AttributeError:
+            own = self._counters()
+        name = _STYLE_NAMES.get(fmt, "other")
+        counters = own.styles.get(name)
+        if counters is None:
+            counters = own.styles[name] = [0, 0, 0]
+        counters[0] += 1
+        counters[1] += elapsed_ns
+        if elapsed_ns > counters[2]:
+            counters[2] = elapsed_ns
+        own.histogram[min((elapsed_ns // 1000).bit_length(), self.BUCKETS - 1)] += 1
+
+    def error(self, exc):
+        errors = self._counters().errors
+        name = type(exc).__name__
+        errors[name] = errors.get(name, 0) + 1
+
+    def _merged(self):
+        styles, errors, histogram = {}, {}, [0] * self.BUCKETS
+        with self._threads_lock:
+            threads = list(self._threads)
+        for own in threads:
+            for name, (n, t, m) in list(own.styles.items()):
+                total = styles.setdefault(name, [0, 0, 0])
+                total[0] += n
+                total[1] += t
+                total[2] = max(total[2], m)
+            for name, n in list(own.errors.items()):
+                errors[name] = errors.get(name, 0) + n
+            histogram = [a + b for a, b in zip(histogram, own.histogram)]
+        return styles, errors, histogram
+
+    def percentile_us(self, q, histogram=None):
+        """Upper bound, in microseconds, of the bucket holding quantile q."""
+        if histogram is None:
+            histogram = self._merged()[2]
+        total = sum(histogram)
+        if not total:
+            return 0
+        seen = 0
+        for i, count in enumerate(histogram):
+            seen += count
+            if seen >= q * total:
+                return 2 ** i
+        return 2 ** (self.BUCKETS - 1)
+
+    def snapshot(self):
+        """Flat name -> number mapping of every counter."""
+        styles, errors, histogram = self._merged()
+        calls = total_ns = max_ns = 0
+        result = {}
+        for name, (n, t, m) in styles.items():
+            result["calls." + name] = n
+            result["total_ms." + name] = t / 1e6
+            result["max_ms." + name] = m / 1e6
+            calls += n
+            total_ns += t
+            max_ns = max(max_ns, m)
+        for name, n in errors.items():
+            result["errors." + name] = n
+        result.update({
+            "calls": calls,
+            "errors": sum(errors.values()),
+            "total_ms": total_ns / 1e6,
+            "max_ms": max_ns / 1e6,
+            "avg_us": total_ns / calls / 1e3 if calls else 0.0,
+            "p50_us": self.percentile_us(0.5, histogram),
+            "p99_us": self.percentile_us(0.99, histogram),
+        })
+        return result
+
+    def summary(self):
+        s = self.snapshot()
+        return ("calls=%d errors=%d total=%.1fms avg=%.1fus max=%.3fms "
+                "p50<%dus p99<%dus" % (s["calls"], s["errors"], s["total_ms"],
+                                       s["avg_us"], s["max_ms"],
+                                       s["p50_us"], s["p99_us"]))
+
+
+_stats = _CallStats()
+
+
+def _read_settings(ctx):
+    """Read the extension settings; defaults for anything unavailable."""
+    settings = dict(DEFAULT_SETTINGS)
+    try:
+        provider = ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.configuration.ConfigurationProvider", ctx)
+        node = PropertyValue()
+        node.Name = "nodepath"
+        node.Value = CONFIG_NODE
+        access = provider.createInstanceWithArguments(
+            "com.sun.star.configuration.ConfigurationAccess", (node,))
+        for name, default in DEFAULT_SETTINGS.items():
+            if access.hasByName(name):
+                settings[name] = type(default)(access.getByName(name))
+    except Exception:
+        pass
+    for name, var in PROFILE_ENV.items():
+        if os.environ.get(var):
+            settings[name] = type(DEFAULT_SETTINGS[name])(os.environ[var])
+    return settings
 
 
 class NumToWords(unohelper.Base, NumToWordsConverter, XAddIn, XServiceInfo, XLocalizable):
     """
-    LibreOffice Calc Add-In exposing =NUMTOWORDS(number [, formatStyle]).
+    LibreOffice Calc Add-In exposing
+    =NUMTOWORDS(number [, formatStyle [, options [, currency]]]).
     Registered via XAddIn so Calc can find it without a custom IDL interface.
     """
 
     def __init__(self, ctx):
         self.ctx = ctx
         self.locale = Locale("en", "US", "")
+        self._locale_key = ("en", "US", "")
+        settings = _read_settings(ctx)
+        self._cache = _LRUCache(settings["CacheSize"])
+        self._profiler = None
+        if settings["ProfileEvery"] > 0:
+            self._start_profiler(settings)
 
     # ── XLocalizable ─────────────────────────────────────────────────────────
 
     def setLocale(self, locale):
         self.locale = locale
+        self._locale_key = (locale.Language, locale.Country, locale.Variant)
 
     def getLocale(self):
         return self.locale
@@ -155,17 +410,15 @@ class NumToWords(unohelper.Base, NumToWordsConverter, XAddIn, XServiceInfo, XLoc
         return prog_name.upper()
 
     def getFunctionDescription(self, name):
-        return "Converts a number to its English word representation"
+        return FUNCTION_DESCRIPTIONS.get(name, FUNCTION_DESCRIPTIONS["numToWords"])
 
     def getDisplayArgumentName(self, name, idx):
-        return ["Number", "FormatStyle"][idx] if idx < 2 else ""
+        args = FUNCTION_ARGUMENTS.get(name, ())
+        return args[idx][0] if 0 <= idx < len(args) else ""
 
     def getArgumentDescription(self, name, idx):
-        descs = [
-            "The number to convert to words",
-            "Optional: 0=cardinal (default), 1=ordinal, 2=currency (USD)",
-        ]
-        return descs[idx] if idx < 2 else ""
+        args = FUNCTION_ARGUMENTS.get(name, ())
+        return args[idx][1] if 0 <= idx < len(args) else ""
 
     # ── XServiceInfo ─────────────────────────────────────────────────────────
 
@@ -183,19 +436,308 @@ class NumToWords(unohelper.Base, NumToWordsConverter, XAddIn, XServiceInfo, XLoc
     # argument (same pattern as libnumbertext's numbertext(self, prop, num, loc)).
     # This is NOT listed in the CalcAddIns XCU — it's injected transparently.
 
-    def numToWords(self, number, formatStyle=None):
+    def numToWords(self, number, formatStyle=None, options=None, currency=None):
+        start = perf_counter_ns()
+        fmt = 0
         try:
-            # formatStyle arrives as void any when omitted — treat as 0 (cardinal)
-            fmt = 0
-            if formatStyle is not None:
-                try:
-                    fmt = int(formatStyle)
-                except (TypeError, ValueError):
-                    fmt = 0
-            return convert(float(number), fmt)
+            fmt = _format_style(formatStyle)
+            code = _currency_code(currency) if fmt == 2 else "USD"
+            style = _style_spec(options)
+            if style:
+                return self._convert_styled(float(number), fmt, style, code)
+            return self._convert_cached(float(number), fmt, code)
         except Exception as e:
+            _stats.error(e)
+            return "Error: " + str(e)
+        finally:
+            _stats.record(fmt, perf_counter_ns() - start)
+
+    def numToWordsFmt(self, number, template, currency=None):
+        """=NUMTOWORDS.FMT(number; template [; currency]).
+
+        Fills a template such as "*** {words:upper} ONLY ***" in one call,
+        instead of wrapping NUMTOWORDS() in UPPER() and concatenations.
+        Templates are compiled once (numtowords_core.compile_template) and
+        results are cached like NUMTOWORDS() results.
+        """
+        start = perf_counter_ns()
+        try:
+            number = float(number)
+            template = str(template)
+            code = _currency_code(currency)
+            locale_key = self._locale_key
+            key = (number, _TEMPLATE, template, locale_key, code)
+            words = self._cache.get(key)
+            if words is None:
+                words = _engine().format_words(number, template, locale_key[0], code)
+                self._cache.put(key, words)
+            return words
+        except Exception as e:
+            _stats.error(e)
+            return "Error: " + str(e)
+        finally:
+            _stats.record(_TEMPLATE, perf_counter_ns() - start)
+
+    def numToWordsRange(self, numbers, formatStyle=None):
+        """Array form, =NUMTOWORDS.RANGE(range; formatStyle).
+
+        The whole range crosses the UNO bridge once as a sequence of rows.
+        Each distinct cell value is converted once; empty cells stay empty.
+        """
+        start = perf_counter_ns()
+        fmt = _format_style(formatStyle)
+        words = {}
+        for row in numbers:
+            for value in row:
+                if value not in words:
+                    words[value] = self._convert_cell(value, fmt)
+        result = tuple(tuple(words[value] for value in row) for row in numbers)
+        _stats.record(fmt, perf_counter_ns() - start)
+        return result
+
+    def numToWordsStats(self, item=None):
+        """=NUMTOWORDSSTATS([item]): call counters for this process.
+
+        Without an argument returns a one-line summary; with a counter name
+        ("calls", "errors", "max_ms.currency", "p99_us", ...) returns its
+        value.
+        """
+        if item is None:
+            return _stats.summary()
+        try:
+            return float(_stats.snapshot()[str(item)])
+        except KeyError:
+            raise IllegalArgumentException(
+                "unknown counter %r" % (item,), self, 0) from None
+
+    def wordsToNumber(self, text):
+        """=WORDSTONUMBER(text), the inverse of NUMTOWORDS."""
+        global _parser
+        if _parser is None:
+            import numtowords_parse
+            _parser = numtowords_parse
+        try:
+            return float(_parser.words_to_number(text))
+        except ValueError as e:
+            raise IllegalArgumentException(str(e), self, 0)
+
+    def _convert_cell(self, value, fmt):
+        if value is None or value == "":
+            return ""
+        try:
+            return self._convert_cached(float(value), fmt)
+        except Exception as e:
+            _stats.error(e)
             return "Error: " + str(e)
 
+    def _convert_cached(self, number, fmt, currency="USD"):
+        key = (number, fmt, self._locale_key)
+        if currency != "USD":
+            key += (currency,)
+        words = self._cache.get(key)
+        if words is None:
+            # language pack follows the locale Calc passes in setLocale()
+            words = _engine().convert(number, fmt, self._locale_key[0], "", currency)
+            self._cache.put(key, words)
+        return words
+
+    def _convert_styled(self, number, fmt, style, currency="USD"):
+        core = _engine()
+        locale_key = self._locale_key     # read once: setLocale() may run meanwhile
+        lang = locale_key[0]
+        if core.language_pack(lang).code != "en":
+            key = (number, fmt, locale_key, style, currency)
+            words = self._cache.get(key)
+            if words is None:
+                words = core.convert(number, fmt, lang, style, currency)
+                self._cache.put(key, words)
+            return words
+        # English: one cached token tuple per value, spelled for each style
+        key = (number, fmt, _TOKENS, currency)
+        ids = self._cache.get(key)
+        if ids is None:
+            ids = core.tokens(number, fmt, currency)
+            self._cache.put(key, ids)
+        return core.render(ids, style)
+
+    # ── Result cache ─────────────────────────────────────────────────────────
+
+    def clearCache(self):
+        """Drop all cached results and reset the counters."""
+        self._cache.clear()
+
+    def getCacheStats(self):
+        """Cache size, hits, misses and evictions, as a PropertyValue sequence."""
+        values = []
+        for name, value in self._cache.stats().items():
+            prop = PropertyValue()
+            prop.Name = name
+            prop.Value = value
+            values.append(prop)
+        return tuple(values)
+
+    def resetStats(self):
+        """Zero the =NUMTOWORDSSTATS() counters."""
+        _stats.reset()
+
+    # ── Sampling profiler (opt-in) ───────────────────────────────────────────
+    # When off, nothing is wrapped and the Calc functions run untouched.
+
+    def _start_profiler(self, settings):
+        import tempfile
+        from numtowords_profile import SamplingProfiler
+        directory = settings["ProfileDir"] or os.path.join(
+            tempfile.gettempdir(), "numtowords-profile")
+        self._profiler = SamplingProfiler(
+            directory, settings["ProfileEvery"], settings["ProfileDumpEvery"])
+        self.numToWords = self._profiler.wrap(self.numToWords)
+        self.numToWordsRange = self._profiler.wrap(self.numToWordsRange)
+
+
+# ── Convert Selection to Words ───────────────────────────────────────────────
+# Reads each selected range with one getDataArray(), converts it on a
+# worker thread in chunks (numtowords_selection) and writes it back with one
+# setDataArray(), as a single undo step.  Calc stays responsive meanwhile:
+# the status bar shows progress and the "Cancel" menu entry stops the run
+# before anything is written.  Only the conversion runs on the worker: the
+# document and the status bar are used on the main thread alone, the worker
+# reaching it through AsyncCallback.  A range edited while the worker ran is
+# read again before writing, and if any differs nothing is written.
+
+PROGRESS_STEPS = 1000
+_running = None   # threading.Event that cancels the conversion in progress
+_running_lock = threading.Lock()
+
+
+def _selected_ranges(selection):
+    # a single range, or each range of a multi-selection
+    if hasattr(selection, "getDataArray"):
+        return [selection]
+    if hasattr(selection, "getCount"):
+        return [selection.getByIndex(i) for i in range(selection.getCount())]
+    return []
+
+
+def _document_language(doc):
+    try:
+        return doc.CharLocale.Language or "en"
+    except Exception:
+        return "en"
+
+
+class _MainThreadCall(unohelper.Base, XCallback):
+    """An AsyncCallback that runs func() on the main thread."""
+
+    def __init__(self, func):
+        self.func = func
+
+    def notify(self, data):
+        self.func()
+
+
+def _on_main_thread(ctx, func):
+    callback = ctx.ServiceManager.createInstanceWithContext(
+        "com.sun.star.awt.AsyncCallback", ctx)
+    callback.addCallback(_MainThreadCall(func), None)
+
+
+class ConvertSelectionJob(unohelper.Base, XJobExecutor, XServiceInfo):
+    """Replaces the numbers in the current Calc selection with static words."""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+
+    def trigger(self, args):
+        global _running
+        if args == "cancel":
+            cancel = _running
+            if cancel is not None:
+                cancel.set()
+            return
+        desktop = self.ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", self.ctx)
+        doc = desktop.getCurrentComponent()
+        if doc is None or not hasattr(doc, "getSheets"):
+            return
+        ranges = _selected_ranges(doc.getCurrentSelection())
+        if not ranges:
+            return
+        with _running_lock:
+            if _running is not None:
+                return           # one conversion at a time
+            cancel = _running = threading.Event()
+        try:
+            blocks = [rng.getDataArray() for rng in ranges]
+            lang = _document_language(doc)
+        except BaseException:
+            with _running_lock:
+                _running = None
+            raise
+        indicator = None
+        try:
+            indicator = doc.getCurrentController().getFrame().createStatusIndicator()
+            indicator.start("Converting to words", PROGRESS_STEPS)
+        except Exception:
+            indicator = None
+        threading.Thread(target=self._convert, name="numtowords-selection", daemon=True,
+                         args=(doc, ranges, blocks, _format_style(args), lang,
+                               indicator, cancel)).start()
+
+    def _convert(self, doc, ranges, blocks, fmt, lang, indicator, cancel):
+        # worker thread: pure Python only, the document is left alone
+        from numtowords_selection import Cancelled, convert_block
+        shown = [0]
+
+        def show(value):
+            if indicator is not None and value > shown[0]:
+                shown[0] = value
+                _on_main_thread(self.ctx, lambda: indicator.setValue(value))
+
+        converted = None
+        try:
+            converted = []
+            for index, rows in enumerate(blocks):
+                def progress(done, total, index=index):
+                    show(int(PROGRESS_STEPS * (index + done / total) / len(blocks)))
+                converted.append(convert_block(rows, fmt, lang,
+                                               progress=progress, cancel=cancel))
+        except Cancelled:
+            converted = None
+        finally:
+            _on_main_thread(self.ctx, lambda: self._write(
+                doc, ranges, blocks, converted, indicator, cancel))
+
+    def _write(self, doc, ranges, blocks, converted, indicator, cancel):
+        # main thread: write back only what is still as it was read
+        global _running
+        try:
+            if (converted is not None and not cancel.is_set()
+                    and all(rng.getDataArray() == rows
+                            for rng, rows in zip(ranges, blocks))):
+                undo = doc.getUndoManager()
+                undo.enterUndoContext("Convert to Words")
+                doc.lockControllers()
+                try:
+                    for rng, rows in zip(ranges, converted):
+                        rng.setDataArray(rows)
+                finally:
+                    doc.unlockControllers()
+                    undo.leaveUndoContext()
+        finally:
+            if indicator is not None:
+                indicator.end()
+            with _running_lock:
+                _running = None
+
+    def getImplementationName(self):
+        return JOB_IMPLEMENTATION_NAME
+
+    def supportsService(self, name):
+        return name == JOB_SERVICE_NAME
+
+    def getSupportedServiceNames(self):
+        return (JOB_SERVICE_NAME,)
+
 
 # ── UNO component factory boilerplate ────────────────────────────────────────
 
@@ -209,3 +751,8 @@ g_ImplementationHelper.addImplementation(
     IMPLEMENTATION_NAME,
     (SERVICE_NAME,),
 )
+g_ImplementationHelper.addImplementation(
+    ConvertSelectionJob,
+    JOB_IMPLEMENTATION_NAME,
+    (JOB_SERVICE_NAME,),
+)
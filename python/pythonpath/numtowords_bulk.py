@@ -0,0 +1,348 @@
+# NumToWords bulk conversion over a process pool
+# Splits the input into chunks and converts them on several cores with
+# numtowords_core.convert_many(), keeping the output in input order.
+#   convert_parallel(values, fmt, workers, chunk_size)  -> list of str
+#   iter_parallel(values, fmt, workers, chunk_size)     -> iterator of chunks
+#   convert_file(source, output, fmt, ...)  -> float64 file to words blob + offsets index
+#   WordsColumn(output)[n]                  -> words of row n, read in O(1)
+#
+#   python3 -m numtowords_bulk column.f64 out -f currency --workers 4 [--resume]
+
+import math
+import os
+from array import array
+from collections import deque
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, chain, islice
+
+import numtowords_core
+
+DEFAULT_CHUNK_SIZE = 100000
+
+
+def _init_worker():
+    # Build the group tables (and NumPy vector tables, if available) once per
+    # worker process instead of on the first chunk of every call.
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    numtowords_core.convert_many(np.zeros(1), 0)
+
+
+def _convert_chunk(chunk, fmt):
+    return numtowords_core.convert_many(chunk, fmt)
+
+
+def _convert_finite(chunk, fmt):
+    # column files keep going past NaN and infinite rows: their words are ""
+    try:
+        return numtowords_core.convert_many(chunk, fmt)
+    except ValueError:
+        pass
+    words = [""] * len(chunk)
+    rows = [i for i in range(len(chunk)) if math.isfinite(chunk[i])]
+    values = [float(chunk[i]) for i in rows]
+    for i, w in zip(rows, numtowords_core.convert_many(values, fmt)):
+        words[i] = w
+    return words
+
+
+def _chunks(values, chunk_size):
+    # raw float64 buffers become arrays, which slice and pickle cheaply
+    values = numtowords_core._as_floats(values)
+    if isinstance(values, memoryview):
+        # one chunk at a time: the view may be a mapped file of any size
+        for start in range(0, len(values), chunk_size):
+            yield array("d", values[start:start + chunk_size].tobytes())
+        return
+    # slice sequences and arrays directly; consume other iterables lazily
+    if hasattr(values, "__getitem__") and hasattr(values, "__len__"):
+        for start in range(0, len(values), chunk_size):
+            yield values[start:start + chunk_size]
+    else:
+        it = iter(values)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def iter_parallel(values, fmt=0, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the converted chunks of values, in order.
+
+    At most two chunks per worker are in flight, so an iterable input is
+    consumed as the results are used rather than all up front.
+    workers=1 converts in the calling process.
+    """
+    return _iter_chunks(_chunks(values, chunk_size), fmt, workers)
+
+
+def _iter_chunks(chunks, fmt, workers, convert=_convert_chunk):
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield convert(chunk, fmt)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(convert, chunk, fmt))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def convert_parallel(values, fmt=0, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Convert values on a process pool; returns a list in input order.
+
+    Output matches convert_many(values, fmt).  workers defaults to the CPU
+    count.
+    """
+    return list(chain.from_iterable(iter_parallel(values, fmt, workers, chunk_size)))
+
+
+# ── Column files ──────────────────────────────────────────────────────────────
+# convert_file() turns a raw little-endian float64 file (a warehouse column
+# export) into two files: <output>.words, the UTF-8 words of every row back
+# to back, and <output>.idx, a header and a uint64 offset per row, so the
+# words of row n are words[idx[n]:idx[n + 1]] and can be read in O(1).  The
+# input is memory-mapped and converted chunk_size rows at a time, so memory
+# use does not grow with the file.  A chunk's offsets are only written once
+# its words are on disk, so an interrupted run can be resumed from the last
+# completed chunk.  NaN and infinite rows have no words: their entry is empty.
+
+COLUMN_MAGIC = b"N2WI"
+COLUMN_VERSION = 1
+# magic, version, format style, rows in the input
+COLUMN_HEADER = "<4sIIQ"
+
+
+def _column_paths(output):
+    return output + ".words", output + ".idx"
+
+
+def _float_chunks(buf, start, chunk_size):
+    """Chunks of the float64 rows of a mapped file, from row start on.
+
+    Once the next chunk is asked for, the pages of the previous one are
+    handed back to the OS (they are clean and can be read again), so the
+    mapping does not grow the resident set as it is walked.
+    """
+    import mmap
+    import sys
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    rows = len(buf) // 8
+    page = mmap.PAGESIZE
+    release = getattr(buf, "madvise", None) if hasattr(mmap, "MADV_DONTNEED") else None
+    for first in range(start, rows, chunk_size):
+        last = min(first + chunk_size, rows)
+        if np is not None:
+            yield np.frombuffer(buf, dtype="<f8", count=last - first, offset=8 * first)
+        else:
+            chunk = array("d", buf[8 * first:8 * last])
+            if sys.byteorder != "little":
+                chunk.byteswap()
+            yield chunk
+        if release is not None:
+            begin = 8 * first // page * page
+            release(mmap.MADV_DONTNEED, begin, 8 * last - begin)
+
+
+def _resume_point(idx, header, fmt, rows):
+    """(offset entries, words bytes) recorded in an existing index;
+    ValueError if it belongs to another input or format."""
+    import struct
+    data = idx.read(header.size)
+    if len(data) < header.size:
+        raise ValueError("index has no header; run without resume")
+    magic, version, old_fmt, old_rows = header.unpack(data)
+    if magic != COLUMN_MAGIC or version != COLUMN_VERSION:
+        raise ValueError("not a numtowords column index")
+    if (old_fmt, old_rows) != (fmt, rows):
+        raise ValueError("index is for format %d, %d rows; this run is format %d, %d rows"
+                         % (old_fmt, old_rows, fmt, rows))
+    entries = (os.fstat(idx.fileno()).st_size - header.size) // 8
+    if not entries:
+        return 0, 0
+    idx.seek(header.size + 8 * (entries - 1))
+    return entries, struct.unpack("<Q", idx.read(8))[0]
+
+
+def convert_file(source, output, fmt=0, workers=1, chunk_size=DEFAULT_CHUNK_SIZE,
+                 resume=False, progress=None):
+    """Convert a raw float64 file to <output>.words and <output>.idx.
+
+    workers > 1 converts on a process pool, as iter_parallel().  With
+    resume, an earlier interrupted run's output is kept and conversion
+    continues after its last completed chunk.  progress(done, total) is
+    called after each chunk.  NaN and infinite rows get empty words.
+    Returns the number of rows converted by this call.
+    """
+    import mmap
+    with open(source, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size % 8:
+            raise ValueError("%s is %d bytes, not a whole number of float64 values"
+                             % (source, size))
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+    try:
+        return _convert_mapped(buf, output, fmt, workers, chunk_size, resume, progress)
+    finally:
+        if size:
+            buf.close()
+
+
+def _convert_mapped(buf, output, fmt, workers, chunk_size, resume, progress):
+    import struct
+    import sys
+    rows = len(buf) // 8
+    header = struct.Struct(COLUMN_HEADER)
+    words_path, idx_path = _column_paths(output)
+    done = offset = 0
+    if resume and os.path.exists(idx_path):
+        words = open(words_path, "r+b" if os.path.exists(words_path) else "w+b")
+        idx = open(idx_path, "r+b")
+        try:
+            entries, offset = _resume_point(idx, header, fmt, rows)
+            if os.fstat(words.fileno()).st_size < offset:
+                raise ValueError("words file is shorter than its index")
+        except BaseException:
+            words.close()
+            idx.close()
+            raise
+        # drop whatever an interrupted chunk left after the last complete one
+        idx.truncate(header.size + 8 * entries)
+        words.truncate(offset)
+        if entries:
+            done = entries - 1
+        else:
+            idx.seek(header.size)
+            idx.write(struct.pack("<Q", 0))
+    else:
+        words = open(words_path, "wb")
+        idx = open(idx_path, "wb")
+        idx.write(header.pack(COLUMN_MAGIC, COLUMN_VERSION, fmt, rows))
+        idx.write(struct.pack("<Q", 0))
+    with words, idx:
+        words.seek(0, os.SEEK_END)
+        idx.seek(0, os.SEEK_END)
+        start = done
+        converted = _iter_chunks(_float_chunks(buf, done, chunk_size), fmt, workers,
+                                 _convert_finite)
+        # closed before returning, so no chunk still holds a view of buf
+        with closing(converted):
+            for chunk in converted:
+                text = "".join(chunk)
+                data = text.encode("utf-8")
+                lengths = (map(len, chunk) if len(data) == len(text)
+                           else (len(w.encode("utf-8")) for w in chunk))
+                ends = array("Q", accumulate(lengths, initial=offset))[1:]
+                if sys.byteorder != "little":
+                    ends.byteswap()
+                words.write(data)
+                words.flush()
+                os.fsync(words.fileno())      # the words before the offsets that cover them
+                idx.write(ends.tobytes())
+                idx.flush()
+                os.fsync(idx.fileno())
+                offset += len(data)
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, rows)
+    return done - start
+
+
+class WordsColumn:
+    """Read-only view of convert_file() output: column[n] is the words of row n.
+
+    Both files are memory-mapped; a lookup reads two offsets and the words.
+    len() counts the rows converted so far.
+    """
+
+    def __init__(self, output):
+        import mmap
+        import struct
+        words_path, idx_path = _column_paths(output)
+        header = struct.Struct(COLUMN_HEADER)
+        with open(idx_path, "rb") as f:
+            self._idx = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.fmt, self.rows = header.unpack_from(self._idx)
+        if magic != COLUMN_MAGIC or version != COLUMN_VERSION:
+            self._idx.close()
+            raise ValueError("%s is not a numtowords column index" % idx_path)
+        self._base = header.size
+        self._offset = struct.Struct("<QQ").unpack_from
+        self._len = max(0, (len(self._idx) - header.size) // 8 - 1)
+        with open(words_path, "rb") as f:
+            self._words = (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                           if os.fstat(f.fileno()).st_size else b"")
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, n):
+        if n < 0:
+            n += self._len
+        if not 0 <= n < self._len:
+            raise IndexError("row %d out of range" % n)
+        start, end = self._offset(self._idx, self._base + 8 * n)
+        return self._words[start:end].decode("utf-8")
+
+    def close(self):
+        self._idx.close()
+        if self._words:
+            self._words.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    import argparse
+    import sys
+    from numtowords_cli import FORMAT_STYLES, ProgressReporter, _format_style
+    parser = argparse.ArgumentParser(
+        description="Convert a raw little-endian float64 file to a words blob "
+                    "and an offsets index (<output>.words, <output>.idx).")
+    parser.add_argument("input", help="raw float64 file, e.g. a warehouse column export")
+    parser.add_argument("output", help="output path prefix")
+    parser.add_argument("-f", "--format", type=_format_style, default=0,
+                        help="0/1/2 or %s (default 0)" % "/".join(FORMAT_STYLES))
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="worker processes (default 1)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="rows per chunk (default %d)" % DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted run from its last completed chunk")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+    args = parser.parse_args(argv)
+
+    reporter = ProgressReporter(None if args.quiet else sys.stderr)
+    last = [0]
+
+    def progress(done, total):
+        reporter.update(done - last[0])
+        last[0] = done
+
+    try:
+        convert_file(args.input, args.output, args.format, args.workers,
+                     args.chunk_size, args.resume, progress)
+    except (OSError, ValueError) as e:
+        parser.exit(1, "numtowords_bulk: %s\n" % e)
+    reporter.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
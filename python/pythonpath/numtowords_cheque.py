@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Cheque batch mode: fixed-width amount-in-words lines for printers.
+
+Each (amount, currency) pair becomes --lines lines of exactly --width
+characters.  The words (by default upper case, ending in "ONLY") are
+wrapped at spaces and padded with the fill character, so nothing can be
+written in after them.  Input is CSV with the amount in the first column
+and an optional ISO currency code in the second (default USD); output is
+the lines of each cheque in input order.  Amounts are read as decimals and
+converted exactly; one that is not a finite number stops the run with its
+line number.
+
+    python3 -m numtowords_cheque payments.csv --width 56 --lines 2 > cheques.txt
+
+Run with python/pythonpath on PYTHONPATH.
+"""
+
+import argparse
+import csv
+import sys
+from decimal import Decimal, InvalidOperation
+
+from numtowords_core import convert, convert_many
+
+DEFAULT_WIDTH = 60
+DEFAULT_LINES = 2
+DEFAULT_FILL = "*"
+DEFAULT_STYLE = "upper only"
+_EXACT_FLOAT = 2 ** 53
+_FLOAT_DIGITS = 15          # amounts a float holds to the cent take the vector path
+
+
+def _wrap(words, width, lines, fill):
+    """words on `lines` lines of `width`, padded with fill; None if too long."""
+    out = []
+    while len(words) > width:
+        cut = words.rfind(" ", 0, width + 1)
+        if cut <= 0 or len(out) == lines - 1:
+            return None
+        out.append(words[:cut].ljust(width, fill))
+        words = words[cut + 1:]
+    out.append(words.ljust(width, fill))
+    return tuple(out) + (fill * width,) * (lines - len(out))
+
+
+def _words(amounts, currency, style, lang):
+    # floats (and ints a float holds exactly) go through the vector path
+    if all(type(a) is float or (type(a) is int and -_EXACT_FLOAT < a < _EXACT_FLOAT)
+           for a in amounts):
+        return convert_many(amounts, 2, lang, style, currency)
+    return [convert(a, 2, lang, style, currency) for a in amounts]
+
+
+def cheque_lines(pairs, width=DEFAULT_WIDTH, lines=DEFAULT_LINES,
+                 fill=DEFAULT_FILL, style=DEFAULT_STYLE, lang="en"):
+    """Padded amount lines for each (amount, currency) pair; list of tuples.
+
+    Amounts are anything convert() takes; numeric strings are converted
+    exactly.  The amounts of each currency are converted in one
+    convert_many() call, and each distinct amount is converted and wrapped
+    once.  Raises ValueError for an unknown currency or
+    an amount whose words do not fit in lines x width.
+    """
+    if width < 1 or lines < 1 or len(fill) != 1:
+        raise ValueError("width and lines must be positive and fill one character")
+    groups = {}              # currency -> (positions, amounts)
+    count = 0
+    for count, (amount, currency) in enumerate(pairs, 1):
+        group = groups.get(currency)
+        if group is None:
+            group = groups[currency] = ([], [])
+        group[0].append(count - 1)
+        group[1].append(amount)
+    out = [None] * count
+    for currency, (positions, amounts) in groups.items():
+        wrapped = {}
+        for position, amount, words in zip(positions, amounts,
+                                           _words(amounts, currency, style, lang)):
+            result = wrapped.get(words)
+            if result is None:
+                result = wrapped[words] = _wrap(words, width, lines, fill)
+                if result is None:
+                    raise ValueError("%s %s does not fit in %d lines of %d characters"
+                                     % (amount, currency, lines, width))
+            out[position] = result
+    return out
+
+
+def _amount(text):
+    """A CSV amount as a float when that is exact to the cent, else a Decimal."""
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError("%r is not an amount" % text) from None
+    if not amount.is_finite():
+        raise ValueError("%r is not an amount" % text)
+    sign, digits, exponent = amount.as_tuple()
+    if exponent >= -2 and len(digits) + max(exponent, 0) <= _FLOAT_DIGITS:
+        return float(amount)
+    return amount
+
+
+def _read_pairs(infile):
+    for line, row in enumerate(csv.reader(infile), 1):
+        if not row or not row[0].strip():
+            continue
+        currency = row[1].strip() if len(row) > 1 and row[1].strip() else "USD"
+        try:
+            yield _amount(row[0].strip()), currency
+        except ValueError as e:
+            raise ValueError("line %d: %s" % (line, e)) from None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Print fixed-width amount-in-words lines for cheques.")
+    parser.add_argument("input", nargs="?", help="CSV of amount[,currency] (default stdin)")
+    parser.add_argument("-w", "--width", type=int, default=DEFAULT_WIDTH,
+                        help="characters per line (default %d)" % DEFAULT_WIDTH)
+    parser.add_argument("-l", "--lines", type=int, default=DEFAULT_LINES,
+                        help="lines per cheque (default %d)" % DEFAULT_LINES)
+    parser.add_argument("--fill", default=DEFAULT_FILL,
+                        help="padding character (default %r)" % DEFAULT_FILL)
+    parser.add_argument("--style", default=DEFAULT_STYLE,
+                        help="styling options (default %r)" % DEFAULT_STYLE)
+    parser.add_argument("--lang", default="en", help="language (default en)")
+    args = parser.parse_args(argv)
+
+    infile = open(args.input, newline="", encoding="utf-8") if args.input else sys.stdin
+    try:
+        cheques = cheque_lines(list(_read_pairs(infile)), args.width, args.lines,
+                               args.fill, args.style, args.lang)
+    except ValueError as e:
+        parser.exit(1, "numtowords_cheque: %s\n" % e)
+    finally:
+        if args.input:
+            infile.close()
+    write = sys.stdout.write
+    for cheque in cheques:
+        write("\n".join(cheque) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Command-line converter: adds an "in words" column to CSV/TSV data.
+
+Rows are streamed from a file or stdin and written out chunk by chunk, so
+memory use does not depend on the input size.  Conversion goes through
+numtowords_core.convert_many(), giving exactly the wording of the add-in.
+
+    python3 -m numtowords_cli amounts.csv -c Amount -f 2 -o out.csv
+    zcat export.tsv.gz | python3 -m numtowords_cli --tsv -c 3 > out.tsv
+
+Run with python/pythonpath on PYTHONPATH.
+"""
+
+import argparse
+import csv
+import math
+import sys
+import time
+
+from numtowords_core import convert_many
+
+FORMAT_STYLES = {"cardinal": 0, "ordinal": 1, "currency": 2}
+BUFFER_SIZE = 1 << 20
+
+
+class ProgressReporter:
+    """Writes a rows/sec line to a stream at most once per interval."""
+
+    def __init__(self, stream, interval=1.0):
+        self.stream = stream
+        self.interval = interval
+        self.start = self.last = time.perf_counter()
+        self.rows = 0
+
+    def update(self, rows):
+        self.rows += rows
+        now = time.perf_counter()
+        if self.stream is not None and now - self.last >= self.interval:
+            self.last = now
+            self._write(now, "\r")
+
+    def finish(self):
+        if self.stream is not None:
+            self._write(time.perf_counter(), "\n")
+
+    def _write(self, now, end):
+        elapsed = max(now - self.start, 1e-9)
+        self.stream.write(f"{self.rows:,} rows, {self.rows / elapsed:,.0f} rows/sec{end}")
+        self.stream.flush()
+
+
+def _format_style(value):
+    if value in FORMAT_STYLES:
+        return FORMAT_STYLES[value]
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "expected 0/1/2 or cardinal/ordinal/currency, got %r" % value)
+
+
+def _column_index(column, header):
+    """Resolve a header name, or a 1-based column number, to an index."""
+    if header is not None and column in header:
+        return header.index(column)
+    try:
+        index = int(column) - 1
+    except ValueError:
+        raise ValueError("column %r not found in header" % column) from None
+    if index < 0:
+        raise ValueError("column numbers start at 1")
+    return index
+
+
+def _convert_chunk(rows, index, fmt, width=0):
+    """Append the words for rows[i][index] to each row; returns error count.
+
+    Rows shorter than width are padded with empty cells first, so the words
+    always land in the same column.
+    """
+    numbers = []
+    positions = []
+    errors = 0
+    for i, row in enumerate(rows):
+        cell = row[index].strip() if index < len(row) else ""
+        if not cell:
+            continue
+        try:
+            number = float(cell)
+        except ValueError:
+            errors += 1
+            continue
+        if not math.isfinite(number):
+            errors += 1
+            continue
+        numbers.append(number)
+        positions.append(i)
+    words = [""] * len(rows)
+    for i, w in zip(positions, convert_many(numbers, fmt)):
+        words[i] = w
+    for row, w in zip(rows, words):
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        row.append(w)
+    return errors
+
+
+def convert_stream(infile, outfile, column, fmt=0, delimiter=",",
+                   header=True, output_column=None, chunk_size=10000,
+                   progress=None):
+    """Copy CSV rows from infile to outfile with a words column appended.
+
+    Returns (rows, errors) where errors counts non-numeric cells (NaN and
+    infinities included), which are left empty in the output.  Short rows
+    are padded to the header's width before the words are appended.
+    """
+    reader = csv.reader(infile, delimiter=delimiter)
+    writer = csv.writer(outfile, delimiter=delimiter, lineterminator="\n")
+    reporter = ProgressReporter(progress)
+
+    names = next(reader, None) if header else None
+    index = _column_index(column, names)
+    width = index + 1
+    if names is not None:
+        width = max(width, len(names))
+        writer.writerow(names + [""] * (width - len(names))
+                        + [output_column or names[index] + " in words"])
+
+    total = errors = 0
+    chunk = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            errors += _convert_chunk(chunk, index, fmt, width)
+            writer.writerows(chunk)
+            total += len(chunk)
+            reporter.update(len(chunk))
+            chunk = []
+    if chunk:
+        errors += _convert_chunk(chunk, index, fmt, width)
+        writer.writerows(chunk)
+        total += len(chunk)
+        reporter.update(len(chunk))
+    reporter.finish()
+    return total, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Add a numbers-in-words column to CSV/TSV data.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="input file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file (default: stdout)")
+    parser.add_argument("-c", "--column", required=True,
+                        help="column to convert: header name or 1-based number")
+    parser.add_argument("-f", "--format", type=_format_style, default=0,
+                        help="0/cardinal (default), 1/ordinal, 2/currency")
+    parser.add_argument("--tsv", action="store_true",
+                        help="tab-separated input and output")
+    parser.add_argument("-d", "--delimiter", help="field delimiter (default ,)")
+    parser.add_argument("--no-header", action="store_true",
+                        help="input has no header row")
+    parser.add_argument("--output-column",
+                        help='header of the new column (default "<column> in words")')
+    parser.add_argument("--chunk-size", type=int, default=10000,
+                        help="rows converted and written per chunk (default 10000)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="no progress report on stderr")
+    args = parser.parse_args(argv)
+
+    delimiter = args.delimiter or ("\t" if args.tsv else ",")
+    if args.input == "-":
+        sys.stdin.reconfigure(newline="")
+    infile = (open(args.input, newline="", encoding="utf-8-sig",
+                   buffering=BUFFER_SIZE)
+              if args.input != "-" else sys.stdin)
+    outfile = (open(args.output, "w", newline="", encoding="utf-8",
+                    buffering=BUFFER_SIZE)
+               if args.output != "-" else sys.stdout)
+    try:
+        rows, errors = convert_stream(
+            infile, outfile, args.column, args.format, delimiter,
+            header=not args.no_header, output_column=args.output_column,
+            chunk_size=args.chunk_size,
+            progress=None if args.quiet else sys.stderr)
+    except ValueError as e:
+        parser.exit(2, "%s: error: %s\n" % (parser.prog, e))
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    if errors and not args.quiet:
+        sys.stderr.write(f"{errors:,} non-numeric cells left empty\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1085 @@
+# NumToWords conversion engine
+# Pure Python, no UNO imports: shared by the Calc add-in (numtowords.uno.py)
+# and usable on its own.  Ships in the extension's pythonpath/ directory,
+# which LibreOffice puts on sys.path for the component.
+#   convert(number, fmt, lang)       -> str   (number: int, float, Decimal or str)
+#   convert_many(values, fmt, lang)  -> list of str
+#   tokens(number, fmt), render(tokens, style) -> token ids, styled str
+#   iter_words(start, stop, fmt)     -> words of each int in range(start, stop)
+#   format_words(number, template)   -> str, e.g. "*** {words:upper} ONLY ***"
+#   fmt: 0 = cardinal (default), 1 = ordinal, 2 = currency (USD, or see CURRENCIES)
+#   lang: "en" (default), "es", "fr", "de", or a .sor rule file — see language_pack()
+
+import operator
+import threading
+
+_ONES = ("", "one", "two", "three", "four", "five", "six", "seven",
+         "eight", "nine", "ten", "eleven", "twelve", "thirteen",
+         "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen")
+
+_TENS = ("", "", "twenty", "thirty", "forty", "fifty",
+         "sixty", "seventy", "eighty", "ninety")
+
+_SCALES = (
+    (10 ** 12, " trillion"),
+    (10 ** 9,  " billion"),
+    (10 ** 6,  " million"),
+    (10 ** 3,  " thousand"),
+)
+
+# Short-scale names by 3-digit group index.  Past nonillion the names repeat
+# with " decillion" appended once per 33 digits: 10**36 is
+# "one thousand decillion", 10**66 "one decillion decillion".
+_SCALE_NAMES = ("", " thousand", " million", " billion", " trillion",
+                " quadrillion", " quintillion", " sextillion", " septillion",
+                " octillion", " nonillion")
+_DECILLION = " decillion"
+
+
+def _below_thousand(n):
+    if n == 0:
+        return ""
+    elif n < 20:
+        return _ONES[n]
+    elif n < 100:
+        t = _TENS[n // 10]
+        o = _ONES[n % 10]
+        return t + ("-" + o if o else "")
+    else:
+        h = _ONES[n // 100] + " hundred"
+        rest = n % 100
+        if rest:
+            return h + " and " + _below_thousand(rest)
+        return h
+
+
+_ORDINAL_MAP = {
+    "one": "first", "two": "second", "three": "third", "five": "fifth",
+    "eight": "eighth", "nine": "ninth", "twelve": "twelfth",
+}
+
+
+def _to_ordinal(cardinal):
+    words = cardinal.split()
+    last = words[-1]
+    # handle hyphenated tens: "twenty-one" -> "twenty-first"
+    if "-" in last:
+        prefix, unit = last.rsplit("-", 1)
+        words[-1] = prefix + "-" + _ordinal_suffix(unit)
+    else:
+        words[-1] = _ordinal_suffix(last)
+    return " ".join(words)
+
+
+def _ordinal_suffix(word):
+    if word in _ORDINAL_MAP:
+        return _ORDINAL_MAP[word]
+    if word.endswith("t"):
+        return word + "h"
+    if word.endswith("e"):
+        return word[:-1] + "th"
+    if word.endswith("y"):
+        return word[:-1] + "ieth"
+    return word + "th"
+
+
+# ── Precomputed group tables ──────────────────────────────────────────────────
+# Built once at import: every 0-999 group in cardinal and ordinal form, plus
+# the " point ..." tail for each cent value 0-99 (a value that rounds to 100
+# cents is carried into the integer part).  Conversion is then a few divmods and table lookups.
+
+_CARDINAL_GROUPS = tuple(_below_thousand(n) for n in range(1000))
+_ORDINAL_GROUPS = ("zeroth",) + tuple(
+    _to_ordinal(_CARDINAL_GROUPS[n]) for n in range(1, 1000))
+_POINT_DIGITS = tuple(
+    " point " + " ".join(_ONES[int(d)] for d in f"{c:02d}") for c in range(100))
+
+
+_FAST_LIMIT = 10 ** 15   # below this, _cardinal() uses divmod on the int
+
+
+def _cardinal(n):
+    """Convert integer part to cardinal words."""
+    if n < 1000:
+        return _CARDINAL_GROUPS[n] or "zero"
+    if n >= _FAST_LIMIT:
+        return _cardinal_digits(str(n))
+    parts = []
+    for scale, name in _SCALES:
+        if n >= scale:
+            group, n = divmod(n, scale)
+            parts.append(_CARDINAL_GROUPS[group] + name)
+    if n > 0:
+        parts.append(_CARDINAL_GROUPS[n])
+    return " ".join(parts)
+
+
+def _cardinal_digits(digits):
+    """Cardinal words for a string of decimal digits, of any length.
+
+    Groups are sliced straight from the string, so the cost is linear in
+    the number of digits (no repeated division of a large int).
+    """
+    digits = digits.lstrip("0")
+    if not digits:
+        return "zero"
+    parts = []
+    segment = False   # a non-zero group since the last decillion boundary
+    end = len(digits) % 3 or 3
+    start = 0
+    for index in range((len(digits) + 2) // 3 - 1, -1, -1):
+        group = int(digits[start:end])
+        start, end = end, end + 3
+        rank = index % 11
+        if group:
+            parts.append(_CARDINAL_GROUPS[group] + _SCALE_NAMES[rank])
+            segment = True
+        if rank == 0 and segment:
+            if index:
+                parts[-1] += _DECILLION * (index // 11)
+            segment = False
+    return " ".join(parts)
+
+
+def _ordinal(n):
+    """Convert integer part to ordinal words."""
+    head, low = divmod(n, 1000)
+    if not head:
+        return _ORDINAL_GROUPS[low]
+    if low:
+        return _cardinal(head * 1000) + " " + _ORDINAL_GROUPS[low]
+    # ends on a scale word: "thousand" -> "thousandth"
+    return _cardinal(n) + "th"
+
+
+def _ordinal_digits(digits):
+    """_ordinal() for a digit string past _FAST_LIMIT (see _exact_parts())."""
+    low = int(digits[-3:])
+    if low:
+        return _cardinal_digits(digits[:-3] + "000") + " " + _ORDINAL_GROUPS[low]
+    return _cardinal_digits(digits) + "th"
+
+
+def _to_decimal(text):
+    from decimal import Decimal, InvalidOperation
+    try:
+        return Decimal(text.strip())
+    except InvalidOperation:
+        raise ValueError("could not convert string to number: %r" % text) from None
+
+
+# Exact input (numeric strings and Decimals) is split from its digits and
+# never goes through int(), whose conversion to and from str is quadratic
+# (and refused past 4300 digits).  Longer input is refused outright:
+# "1e1000000" is nine characters but a million digits of words.
+EXACT_DIGITS_MAX = 100000  # digits and exponent of a str/Decimal input
+_PACK_DIGITS = 1000        # language packs take ints; their scale words run out first
+
+
+def _exact_parts(number, fmt, currency):
+    """(negative, int_part, frac_cents, money) of any input but int and float.
+
+    A Decimal's integer part is an int below _FAST_LIMIT and otherwise the
+    string of its digits, which _cardinal_digits() splits into groups
+    directly.  Raises ValueError for NaN, infinities and too many digits.
+    """
+    if isinstance(number, str):
+        number = _to_decimal(number)
+    money = None
+    if fmt == 2:
+        money = _currencies.get(currency) or currency_table(currency)
+    if hasattr(number, "as_tuple"):
+        if not number.is_finite():
+            raise ValueError("cannot convert %s to words" % number)
+        negative = number < 0
+        _, digits, exponent = number.as_tuple()
+        if len(digits) > EXACT_DIGITS_MAX or abs(exponent) > EXACT_DIGITS_MAX:
+            raise ValueError("too many digits to convert (at most %d)" % EXACT_DIGITS_MAX)
+        point = max(len(digits) + exponent, 0)
+        whole = ("".join(map(str, digits[:point])) + "0" * max(exponent, 0)).lstrip("0")
+        int_part = int(whole or "0") if len(whole) <= 15 else whole
+        frac = type(number)((0, digits[point:], min(exponent, 0)))
+    else:
+        negative = number < 0
+        number = abs(number)
+        try:
+            int_part = int(number)
+        except OverflowError:
+            raise ValueError("cannot convert %s to words" % number) from None
+        frac = number - int_part
+    scale = money.scale if money is not None else 100
+    frac_cents = round(frac * scale)
+    if frac_cents == scale and fmt != 1:
+        # "1.995" is "two", not "one point one hundred"
+        int_part, frac_cents = _add_units(int_part, 1), 0
+    return negative, int_part, frac_cents, money
+
+
+def _add_units(int_part, n):
+    # int_part + n, where n is 0 or 1 (rounding to a whole unit)
+    if type(int_part) is not str:
+        return int_part + n
+    if not n:
+        return int_part
+    head = int_part.rstrip("9")
+    nines = len(int_part) - len(head)
+    return (head[:-1] + str(int(head[-1]) + 1) if head else "1") + "0" * nines
+
+
+def _pack_int(int_part, pack):
+    if type(int_part) is str:
+        if len(int_part) > _PACK_DIGITS:
+            raise ValueError("number too large for %s words" % pack.code)
+        return int(int_part)
+    return int_part
+
+
+# ── Currencies ────────────────────────────────────────────────────────────────
+# Currency mode (fmt=2) names the amount in the currency given by its ISO
+# code.  Each entry is compiled the first time its code is used: the major
+# unit suffixes and the words for every minor amount (" and fifty cents"),
+# so an amount is one cardinal plus two lookups.
+
+# ISO code -> (major singular, major plural, minor singular, minor plural,
+#              minor-unit digits)
+CURRENCIES = {
+    "USD": ("dollar", "dollars", "cent", "cents", 2),
+    "EUR": ("euro", "euros", "cent", "cents", 2),
+    "GBP": ("pound", "pounds", "penny", "pence", 2),
+    "PHP": ("peso", "pesos", "centavo", "centavos", 2),
+    "JPY": ("yen", "yen", "", "", 0),
+}
+_currencies = {}
+
+
+class Currency:
+    """A CURRENCIES entry compiled into lookup tables."""
+
+    def __init__(self, code, major_one, major_many, minor_one, minor_many, digits):
+        self.code = code
+        self.digits = digits
+        self.scale = 10 ** digits
+        self.names = ((major_one, major_many), (minor_one, minor_many))
+        self.major = (" " + major_many, " " + major_one)   # indexed by amount == 1
+        self.minor = ("",) + tuple(
+            " and " + _cardinal(n) + " " + (minor_one if n == 1 else minor_many)
+            for n in range(1, self.scale))
+        # the words after the major amount, by [amount == 1][minor amount]
+        self.tail = tuple(tuple(major + minor for minor in self.minor)
+                          for major in self.major)
+        self.tokens = None         # see _money_tokens()
+
+    def split(self, number):
+        """(major, minor) amounts of a non-negative number.
+
+        A minor amount that rounds to a whole major unit is carried into it:
+        0.995 is one dollar, not no dollars and one hundred cents.
+        """
+        int_part = int(number)
+        carry, minor = divmod(round((number - int_part) * self.scale), self.scale)
+        return int_part + carry, minor
+
+
+def currency_table(code):
+    """Compiled Currency for an ISO 4217 code ("EUR", "jpy").
+
+    Raises ValueError for a code missing from CURRENCIES.
+    """
+    money = _currencies.get(code)
+    if money is None:
+        key = code.strip().upper() if isinstance(code, str) else code
+        entry = CURRENCIES.get(key)
+        if entry is None:
+            raise ValueError("unknown currency %r (expected one of %s)"
+                             % (code, ", ".join(CURRENCIES)))
+        money = _currencies.get(key) or Currency(key, *entry)
+        _currencies[key] = _currencies[code] = money
+    return money
+
+
+# ── Language packs ────────────────────────────────────────────────────────────
+# English is built into this module.  Other languages live in the
+# numtowords_lang package; each is imported and its tables compiled the first
+# time its code is used, then kept for the life of the process.
+
+class LanguagePack:
+    """Word tables and rules for one language.
+
+    Subclasses build their 0-999 group tables in __init__ and implement
+    cardinal() and ordinal(); the class attributes give the words used
+    around them.
+    """
+
+    code = ""
+    minus = ""
+    point = ""                 # decimal separator word
+    digits = ()                # words for 0-9 after the decimal separator
+    conjunction = ""           # joins the major and minor currency amounts
+    major = ("", "")           # USD unit, singular and plural
+    minor = ("", "")
+    currencies = {}            # other ISO code -> (major, minor) as above
+
+    def cardinal(self, n):
+        raise NotImplementedError
+
+    def ordinal(self, n):
+        raise NotImplementedError
+
+    def cardinal_before_noun(self, n):
+        """Cardinal form used directly before a noun ("un dólar", "ein Dollar")."""
+        return self.cardinal(n)
+
+    def amount(self, n, unit):
+        return self.cardinal_before_noun(n) + " " + unit[n != 1]
+
+    def currency_names(self, money):
+        """(major, minor) unit names for a Currency; ValueError if unknown."""
+        if money is None or money.code == "USD":
+            return self.major, self.minor
+        names = self.currencies.get(money.code)
+        if names is None:
+            raise ValueError("no %s wording for currency %s" % (self.code, money.code))
+        return names
+
+    def words(self, negative, int_part, frac_cents, fmt, money=None):
+        if fmt == 1:
+            words = self.ordinal(int_part)
+        elif fmt == 2:
+            major, minor = self.currency_names(money)
+            words = self.amount(int_part, major)
+            if frac_cents:
+                words += " " + self.conjunction + " " + self.amount(frac_cents, minor)
+        else:
+            words = self.cardinal(int_part)
+            if frac_cents:
+                decimals = ("%02d" % frac_cents).rstrip("0")
+                words += " " + self.point + " " + " ".join(
+                    self.digits[int(d)] for d in decimals)
+        return (self.minus + " " if negative else "") + words
+
+
+class _English(LanguagePack):
+    code = "en"
+    minus = "minus"
+    point = "point"
+    conjunction = "and"
+    major = ("dollar", "dollars")
+    minor = ("cent", "cents")
+
+    # n may also be a digit string past _FAST_LIMIT (see _exact_parts())
+    def cardinal(self, n):
+        return _cardinal_digits(n) if type(n) is str else _cardinal(n)
+
+    def ordinal(self, n):
+        return _ordinal_digits(n) if type(n) is str else _ordinal(n)
+
+    def currency_names(self, money):
+        return money.names if money is not None else (self.major, self.minor)
+
+
+_ENGLISH = _English()
+
+# language code -> "module:class" of its pack
+LANGUAGE_PACKS = {
+    "es": "numtowords_lang.es:Spanish",
+    "fr": "numtowords_lang.fr:French",
+    "de": "numtowords_lang.de:German",
+}
+_packs = {"en": _ENGLISH, "": _ENGLISH}
+
+
+def language_pack(lang):
+    """Pack for a language code or locale tag ("es", "fr-CA", "de_AT").
+
+    A language without a pack module uses the Soros rules in
+    numtowords_lang/<code>.sor if there are any (see numtowords_soros);
+    other languages fall back to English.
+    """
+    pack = _packs.get(lang)
+    if pack is None:
+        code = lang.replace("_", "-").split("-")[0].lower()
+        pack = _packs.get(code)
+        if pack is None:
+            pack = _ENGLISH
+            if code in LANGUAGE_PACKS:
+                import importlib
+                module, cls = LANGUAGE_PACKS[code].split(":")
+                pack = getattr(importlib.import_module(module), cls)()
+            elif code.isalpha():
+                import numtowords_soros
+                pack = numtowords_soros.rule_pack(code) or _ENGLISH
+            _packs[code] = pack
+        _packs[lang] = pack
+    return pack
+
+
+def convert(number, fmt, lang="en", style="", currency="USD"):
+    """Core conversion. fmt: 0=cardinal, 1=ordinal, 2=currency.
+
+    int and Decimal inputs (and numeric strings, read as Decimal) are
+    converted exactly, without going through float; see _exact_parts().
+    lang selects the language pack; English is built in.  style takes the
+    options of parse_style(), e.g. "upper only" for cheques.  currency is
+    an ISO code from CURRENCIES, used by fmt 2.  Raises ValueError for NaN
+    and infinities.
+    """
+    kind = type(number)
+    if kind is float or kind is int:
+        negative = number < 0
+        if negative:
+            number = -number
+        try:
+            int_part = int(number)
+        except (OverflowError, ValueError):
+            raise ValueError("cannot convert %s to words" % number) from None
+        frac_cents = round((number - int_part) * 100) if kind is float else 0
+        if frac_cents == 100 and fmt != 1:
+            int_part, frac_cents = int_part + 1, 0
+        if lang == "en" and not style:
+            # the common call, plain English for a float or int, skips the
+            # pack, style and exact-digit checks below
+            if fmt == 1:
+                words = _ordinal(int_part)
+            elif fmt == 2:
+                money = _currencies.get(currency) or currency_table(currency)
+                if money.digits != 2:
+                    int_part, frac_cents = money.split(number)
+                words = _cardinal(int_part) + money.tail[int_part == 1][frac_cents]
+            else:
+                words = _cardinal(int_part)
+                if frac_cents:
+                    words += _POINT_DIGITS[frac_cents]
+            return "minus " + words if negative else words
+        money = None
+        if fmt == 2:
+            money = _currencies.get(currency) or currency_table(currency)
+            if money.digits != 2:
+                int_part, frac_cents = money.split(number)
+    else:
+        negative, int_part, frac_cents, money = _exact_parts(number, fmt, currency)
+
+    if lang != "en":
+        pack = language_pack(lang)
+        if pack is not _ENGLISH:
+            words = pack.words(negative, _pack_int(int_part, pack), frac_cents, fmt, money)
+            if style:
+                words = _restyle(words, parse_style(style), pack.conjunction)
+            return words
+    if style:
+        return render(_tokens(negative, int_part, frac_cents, fmt, money), style)
+
+    if fmt == 1:
+        words = _ENGLISH.ordinal(int_part) if type(int_part) is str else _ordinal(int_part)
+    elif fmt == 2:
+        words = _ENGLISH.cardinal(int_part) if type(int_part) is str else _cardinal(int_part)
+        words += money.tail[int_part == 1][frac_cents]
+    else:
+        words = _ENGLISH.cardinal(int_part) if type(int_part) is str else _cardinal(int_part)
+        if frac_cents:
+            # spell out decimal digits individually
+            words += _POINT_DIGITS[frac_cents]
+
+    return ("minus " if negative else "") + words
+
+
+# ── Token stream and styles ───────────────────────────────────────────────────
+# tokens() gives the English words of a number as a tuple of interned token
+# ids (words, scale words, hyphens, conjunctions; a word token carries the
+# space before it); render() spells the tuple in one pass from a per-style
+# spelling table.  UPPER CASE, Title Case, no "and" after hundred and a
+# trailing "only" are just other spelling tables, so a styled result costs
+# the same as the plain one and one cached token tuple serves every style.
+# Rendered plain, tokens() is convert().  The vocabulary is built on first use.
+# Threads: the tables are tuples, never changed once published.  Interning a
+# token and storing a spelling table take _token_lock; lookups take no lock,
+# and a spelling table is only stored if it spells every interned token.
+
+WORD, SCALE, HYPHEN, CONJUNCTION, SUFFIX = range(5)   # token kinds
+STYLE_OPTIONS = ("upper", "title", "noand", "only")
+
+_vocabulary = []     # token id -> (kind, plain spelling)
+_token_ids = {}
+_token_tables = None
+_token_lock = threading.RLock()
+_spellings = {}      # option set or spec string -> spelling of each token id
+_SPELLINGS_MAX = 64
+
+
+def _token(kind, text):
+    key = (kind, text)
+    tid = _token_ids.get(key)
+    if tid is None:
+        with _token_lock:
+            tid = _token_ids.get(key)
+            if tid is None:
+                tid = len(_vocabulary)
+                # both before the id can be looked up: a thread holding the
+                # id must not find a spelling table built without it
+                _vocabulary.append(key)
+                _spellings.clear()
+                _token_ids[key] = tid
+    return tid
+
+
+def _build_token_tables():
+    token = _token
+    hyphen = token(HYPHEN, "-")
+    hundred_and = token(CONJUNCTION, " and")   # the one "noand" drops
+
+    def words(text, lead=""):
+        out = []
+        for word in text.split():
+            if word == "and":
+                out.append(hundred_and)
+                continue
+            for i, part in enumerate(word.split("-")):
+                if i:
+                    out.append(hyphen)
+                elif out or lead:
+                    part = " " + part
+                out.append(token(SCALE if part.endswith("hundred") else WORD, part))
+        return tuple(out)
+
+    def variants(groups):
+        # (first, following): a group at the start, and after other words
+        return (tuple(words(g) for g in groups), tuple(words(g, " ") for g in groups))
+
+    digits = tuple(token(WORD, " " + w) for w in _ONES[:10])
+    point = token(WORD, " point")
+    tables = {
+        "cardinal": variants(_CARDINAL_GROUPS),
+        "ordinal": variants(_ORDINAL_GROUPS),
+        "scales": tuple((token(SCALE, name),) if name else () for name in _SCALE_NAMES),
+        "decillion": (token(SCALE, _DECILLION),),
+        "zero": (token(WORD, "zero"),),
+        "th": (token(SUFFIX, "th"),),
+        "minus": (token(WORD, "minus "),),
+        # the digit 0 is spelled "", as in _POINT_DIGITS
+        "point": tuple((point,) + tuple(digits[int(d)] for d in f"{c:02d}")
+                       for c in range(100)),
+        "and": (token(CONJUNCTION, " and "),),
+        "only": (token(SUFFIX, ""),),             # " only" with that option
+        "hundred_and": hundred_and,
+    }
+    return tables
+
+
+def _money_tokens(money):
+    # (major, minor) word tokens of a Currency, indexed by amount == 1
+    if money.tokens is None:
+        money.tokens = tuple(((_token(WORD, " " + many),), (_token(WORD, " " + one),))
+                             for one, many in money.names)
+    return money.tokens
+
+
+def _tables():
+    global _token_tables
+    if _token_tables is None:
+        with _token_lock:
+            if _token_tables is None:
+                _token_tables = _build_token_tables()
+    return _token_tables
+
+
+def _cardinal_tokens(n, t, following=False):
+    first, rest = t["cardinal"]
+    scales = t["scales"]
+    if type(n) is str:       # digits past _FAST_LIMIT, see _exact_parts()
+        digits = n
+    elif n < 1000:
+        return (rest if following else first)[n] or t["zero"]
+    elif n < _FAST_LIMIT:
+        out = ()
+        groups = rest if following else first
+        for rank, (scale, _) in zip((4, 3, 2, 1), _SCALES):
+            if n >= scale:
+                group, n = divmod(n, scale)
+                if group:
+                    out += groups[group] + scales[rank]
+                    groups = rest
+        return out + groups[n] if n else out
+    else:
+        digits = str(n)
+    # the group split of _cardinal_digits()
+    out = []
+    groups = rest if following else first
+    segment = False
+    end = len(digits) % 3 or 3
+    start = 0
+    for index in range((len(digits) + 2) // 3 - 1, -1, -1):
+        group = int(digits[start:end])
+        start, end = end, end + 3
+        rank = index % 11
+        if group:
+            out += groups[group]
+            out += scales[rank]
+            groups = rest
+            segment = True
+        if rank == 0 and segment:
+            out += t["decillion"] * (index // 11)
+            segment = False
+    return tuple(out)
+
+
+def _ordinal_tokens(n, t):
+    first, rest = t["ordinal"]
+    if type(n) is str:
+        low = int(n[-3:])
+        if low:
+            return _cardinal_tokens(n[:-3] + "000", t) + rest[low]
+        return _cardinal_tokens(n, t) + t["th"]
+    head, low = divmod(n, 1000)
+    if not head:
+        return first[low]
+    if low:
+        return _cardinal_tokens(head * 1000, t) + rest[low]
+    return _cardinal_tokens(n, t) + t["th"]
+
+
+def tokens(number, fmt=0, currency="USD"):
+    """English words of number as a tuple of token ids; see render().
+
+    Takes the same arguments as convert(), and
+    render(tokens(number, fmt, currency)) == convert(number, fmt, currency=currency).
+    """
+    negative, int_part, frac_cents, money = _exact_parts(number, fmt, currency)
+    return _tokens(negative, int_part, frac_cents, fmt, money)
+
+
+def _tokens(negative, int_part, frac_cents, fmt, money=None):
+    t = _token_tables or _tables()
+    if fmt == 1:
+        out = _ordinal_tokens(int_part, t)
+    elif fmt == 2:
+        major, minor = _money_tokens(money or currency_table("USD"))
+        out = _cardinal_tokens(int_part, t) + major[int_part == 1]
+        if frac_cents:
+            out += t["and"] + _cardinal_tokens(frac_cents, t) + minor[frac_cents == 1]
+        out += t["only"]
+    else:
+        out = _cardinal_tokens(int_part, t)
+        if frac_cents:
+            out += t["point"][frac_cents]
+    return t["minus"] + out if negative else out
+
+
+def parse_style(spec):
+    """Set of style options in a spec such as "upper only" or "Title, noand".
+
+    Options are separated by spaces, commas or "+" and are case-insensitive;
+    "" is the plain style.  Raises ValueError for an unknown option.
+    """
+    options = frozenset(spec.lower().replace(",", " ").replace("+", " ").split())
+    for option in options:
+        if option not in STYLE_OPTIONS:
+            raise ValueError("unknown style option %r (expected %s)"
+                             % (option, ", ".join(STYLE_OPTIONS)))
+    return options
+
+
+def _spelling(options):
+    spell = _spellings.get(options)
+    if spell is None:
+        t = _tables()
+        hundred_and, only = t["hundred_and"], t["only"][0]
+        with _token_lock:
+            spell = []
+            for tid, (kind, text) in enumerate(_vocabulary):
+                if tid == hundred_and and "noand" in options:
+                    text = ""
+                elif tid == only and "only" in options:
+                    text = " only"
+                if "upper" in options:
+                    text = text.upper()
+                elif "title" in options and (kind in (WORD, SCALE) or tid == only):
+                    text = text.title()
+                spell.append(text)
+            spell = _spellings[options] = tuple(spell)
+    return spell
+
+
+def render(token_ids, style=""):
+    """Spell a tokens() tuple; style is a parse_style() spec or option set."""
+    spell = _spellings.get(style)
+    if spell is None:
+        spell = _spelling(parse_style(style) if isinstance(style, str) else style)
+        with _token_lock:
+            # spec strings seen so far, too, unless a token came in meanwhile
+            if len(_spellings) < _SPELLINGS_MAX and len(spell) == len(_vocabulary):
+                _spellings[style] = spell
+    return "".join([spell[tid] for tid in token_ids])
+
+
+def _restyle(words, options, conjunction):
+    # language packs take the case options; "noand" and "only" are English
+    if "upper" in options:
+        return words.upper()
+    if "title" in options:
+        return " ".join(w if w == conjunction else w[:1].upper() + w[1:]
+                        for w in words.split(" "))
+    return words
+
+
+# ── Output templates ──────────────────────────────────────────────────────────
+# NUMTOWORDS.FMT fills a template such as "*** {words:upper} ONLY ***" or
+# "{int:title} and {cents}/100 {unit}" with the pieces of an amount.  Each
+# template is parsed once into a Template (literal text and the fields to
+# fill, with their case) and kept in a bounded cache; rendering computes
+# only the fields the template uses and joins everything in one pass.
+
+TEMPLATE_FIELDS = {
+    "words": "the amount in words, as NUMTOWORDS(x; 2)",
+    "cardinal": "the number in words, as NUMTOWORDS(x; 0)",
+    "ordinal": "the whole part as an ordinal, as NUMTOWORDS(x; 1)",
+    "sign": '"minus " for a negative number, else nothing',
+    "int": "the whole (major unit) amount in words",
+    "unit": "the major unit name, singular or plural",
+    "minor": "the minor unit amount in words",
+    "minorunit": "the minor unit name, singular or plural",
+    "cents": "the minor unit amount in digits, e.g. 05",
+}
+TEMPLATE_CASES = ("upper", "lower", "title")
+TEMPLATES_MAX = 256
+_templates = {}      # template string -> Template, oldest first
+_template_lock = threading.Lock()
+
+
+class Template:
+    """A parsed NUMTOWORDS.FMT template; see compile_template()."""
+
+    __slots__ = ("source", "fields", "_parts")
+
+    def __init__(self, source):
+        from string import Formatter
+        parts = []
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as e:
+            raise ValueError("bad template %r: %s" % (source, e)) from None
+        for literal, field, case, conversion in parsed:
+            if field is None:
+                parts.append((literal, None, None))
+                continue
+            if conversion:
+                raise ValueError("{%s!%s}: conversions are not supported in templates"
+                                 % (field, conversion))
+            if field not in TEMPLATE_FIELDS:
+                raise ValueError("unknown template field {%s} (expected %s)"
+                                 % (field, ", ".join(TEMPLATE_FIELDS)))
+            case = case.strip().lower()
+            if case and case not in TEMPLATE_CASES:
+                raise ValueError("unknown case %r in {%s} (expected %s)"
+                                 % (case, field, ", ".join(TEMPLATE_CASES)))
+            parts.append((literal, field, case))
+        self.source = source
+        self.fields = tuple(dict.fromkeys(f for _, f, _ in parts if f))
+        self._parts = tuple(parts)
+
+    def render(self, number, lang="en", currency="USD"):
+        """The template filled in for number; ValueError as convert() raises it."""
+        pack = language_pack(lang)
+        values = _template_values(number, pack, currency, self.fields)
+        out = []
+        for literal, field, case in self._parts:
+            out.append(literal)
+            if field:
+                text = values[field]
+                out.append(_case(text, case, pack) if case else text)
+        return "".join(out)
+
+
+def compile_template(template):
+    """The Template for a template string, parsed once and cached.
+
+    Raises ValueError for an unknown field or case.
+    """
+    compiled = _templates.get(template)
+    if compiled is None:
+        compiled = Template(template)
+        with _template_lock:
+            if len(_templates) >= TEMPLATES_MAX:
+                del _templates[next(iter(_templates))]
+            _templates[template] = compiled
+    return compiled
+
+
+def format_words(number, template, lang="en", currency="USD"):
+    """number rendered through a template, e.g. "*** {words:upper} ONLY ***"."""
+    return compile_template(template).render(number, lang, currency)
+
+
+_WHOLE_FIELDS = {"words": 2, "cardinal": 0, "ordinal": 1}   # -> convert() fmt
+
+
+def _template_values(number, pack, currency, fields):
+    if isinstance(number, str):
+        number = _to_decimal(number)
+    money = _currencies.get(currency) or currency_table(currency)
+    int_part = minor = None
+    values = {}
+    for field in fields:
+        fmt = _WHOLE_FIELDS.get(field)
+        if fmt is not None:
+            values[field] = convert(number, fmt, pack.code, "", money.code)
+            continue
+        if field == "sign":
+            values[field] = pack.minus + " " if number < 0 else ""
+            continue
+        if int_part is None:
+            _, int_part, minor, _ = _exact_parts(number, 2, money.code)
+            int_part = _pack_int(int_part, pack) if pack is not _ENGLISH else int_part
+        if field == "int":
+            value = pack.cardinal_before_noun(int_part)
+        elif field == "minor":
+            value = pack.cardinal_before_noun(minor)
+        elif field == "unit":
+            value = pack.currency_names(money)[0][int_part != 1]
+        elif field == "minorunit":
+            value = pack.currency_names(money)[1][minor != 1]
+        else:
+            value = "%0*d" % (money.digits, minor) if money.digits else ""
+        values[field] = value
+    return values
+
+
+def _case(text, case, pack):
+    if case == "upper":
+        return text.upper()
+    if case == "lower":
+        return text.lower()
+    if pack is _ENGLISH:
+        # as the "title" style: every word and hyphenated part, but not "and"
+        return " ".join(w if w == "and" else w.title() for w in text.split(" "))
+    return _restyle(text, ("title",), pack.conjunction)
+
+
+# ── Batch conversion ──────────────────────────────────────────────────────────
+
+_VECTOR_LIMIT = 10 ** 15   # beyond this convert() leaves the group tables
+_vector_tables = {}        # (style options, currency code) -> tables
+_DEDUPE_SAMPLE = 4096      # values looked at to decide whether np.unique pays
+
+
+def convert_many(values, fmt, lang="en", style="", currency="USD"):
+    """Convert a sequence or float64 buffer of numbers; returns a list of str.
+
+    Output matches calling convert() on each value.  With NumPy available the
+    group split runs as whole-array operations and each string is one join
+    of a few pieces from tables spelled once per style and currency; values
+    that repeat are deduplicated with np.unique first.  Otherwise a
+    pure-Python loop over the distinct values is used.
+    """
+    values = _as_floats(values)
+    if language_pack(lang) is not _ENGLISH:
+        return _convert_many_py(values, fmt, lang, style, currency)
+    try:
+        import numpy as np
+    except ImportError:
+        return _convert_many_py(values, fmt, "en", style, currency)
+    return _convert_many_np(np, values, fmt, style, currency)
+
+
+def _as_floats(values):
+    # raw bytes are read as native float64, like array.array("d")
+    if isinstance(values, (bytes, bytearray)):
+        return memoryview(values).cast("d")
+    if isinstance(values, memoryview) and values.format != "d":
+        return values.cast("B").cast("d")
+    return values
+
+
+def _convert_many_py(values, fmt, lang="en", style="", currency="USD"):
+    words = {}
+    out = []
+    for value in values:
+        value = float(value)
+        w = words.get(value)
+        if w is None:
+            w = words[value] = convert(value, fmt, lang, style, currency)
+        out.append(w)
+    return out
+
+
+def _build_vector_tables(np, options, money):
+    t = _tables()
+    major, minor = _money_tokens(money)
+    spelling = _spelling(options)
+
+    def spell(ids):
+        return "".join([spelling[tid] for tid in ids])
+
+    def table(items):
+        t = np.empty(len(items), dtype=object)
+        t[:] = items
+        return t
+
+    # Group tables are indexed by group + 1000 * (a higher group is non-zero),
+    # i.e. the second half holds the words that follow other words.
+    first, rest = t["cardinal"]
+    scaled = [table([spell(first[g] + scale) if g else "" for g in range(1000)]
+                    + [spell(rest[g] + scale) if g else "" for g in range(1000)])
+              for scale in t["scales"][4:0:-1]]
+    cardinal_units = table([spell(t["zero"])] + [spell(first[g]) for g in range(1, 1000)]
+                           + [spell(g) for g in rest])
+    # a zero units group after a scale word takes "th": "one thousandth"
+    first, rest = t["ordinal"]
+    ordinal_units = table([spell(g) for g in first] + [spell(t["th"])]
+                          + [spell(g) for g in rest[1:]])
+    # everything after the units group of an amount, indexed by
+    # (major amount == 1) * len(minor) + minor amount
+    cents = [""] + [spell(t["and"] + _cardinal_tokens(c, t) + minor[c == 1])
+                    for c in range(1, len(money.minor))]
+    only = spell(t["only"])
+    money_tail = table([spell(major[one]) + c + only for one in (0, 1) for c in cents])
+    point = table([""] + [spell(ids) for ids in t["point"][1:]])
+    sign = table(("", spell(t["minus"])))
+    return scaled, cardinal_units, ordinal_units, money_tail, point, sign
+
+
+def _convert_many_np(np, values, fmt, style="", currency="USD"):
+    options = parse_style(style) if style else frozenset()
+    money = currency_table(currency) if fmt == 2 else currency_table("USD")
+    tables = _vector_tables.get((options, money.code))
+    if tables is None:
+        tables = _vector_tables[options, money.code] = _build_vector_tables(
+            np, options, money)
+
+    if isinstance(values, memoryview):
+        arr = np.frombuffer(values, dtype=np.float64)
+    else:
+        arr = np.asarray(values, dtype=np.float64).ravel()
+    # np.unique only pays for itself when there are fewer distinct values
+    # than about half the rows; a sample of s values from d distinct ones
+    # holds about s*s/(2*d) repeats
+    if len(arr) > 2 * _DEDUPE_SAMPLE:
+        sample = arr[::len(arr) // _DEDUPE_SAMPLE]
+        repeats = len(sample) - len(np.unique(sample))
+        if repeats * len(arr) <= len(sample) ** 2:
+            return _vector_words(np, arr, fmt, style, currency, money, tables)
+    uniq, inverse = np.unique(arr, return_inverse=True)
+    words = np.empty(len(uniq), dtype=object)
+    words[:] = _vector_words(np, uniq, fmt, style, currency, money, tables)
+    return words[inverse.ravel()].tolist()
+
+
+def _vector_words(np, arr, fmt, style, currency, money, tables):
+    """convert() of each float64 in arr, as a list."""
+    scaled, cardinal_units, ordinal_units, money_tail, point_words, sign_words = tables
+    # nan, inf and values past the tables take the scalar path (and raise
+    # exactly as convert() does)
+    a = np.abs(arr)
+    fast = a < _VECTOR_LIMIT
+    slow = None if fast.all() else {
+        i: convert(float(arr[i]), fmt, "en", style, currency)
+        for i in np.flatnonzero(~fast).tolist()}
+    if slow is not None:
+        a = a[fast]
+        arr = arr[fast]
+    negative = arr < 0
+    whole = np.trunc(a)
+    int_part = whole.astype(np.int64)
+    scale = money.scale if fmt == 2 else 100
+    frac_cents = np.rint((a - whole) * scale).astype(np.int64)
+    if fmt != 1:
+        carry = frac_cents == scale  # rounds to a whole unit, as in convert()
+        int_part += carry
+        frac_cents[carry] = 0
+
+    # one column of word pieces per group and suffix, joined row-wise at the
+    # end; columns that are empty for every value are skipped
+    pieces = []
+    if negative.any():
+        pieces.append(sign_words[negative.view(np.int8)])
+    higher = np.zeros(len(a), dtype=np.int64)
+    rest = int_part
+    top = int(int_part.max()) if len(a) else 0
+    for (scale, _), table in zip(_SCALES, scaled):
+        if scale > top:
+            continue
+        group, rest = np.divmod(rest, scale)
+        if group.any():
+            pieces.append(table[group + higher])
+            higher[group > 0] = 1000
+    units = ordinal_units if fmt == 1 else cardinal_units
+    pieces.append(units[rest + higher])
+    if fmt == 2:
+        tail = frac_cents
+        tail += (int_part == 1) * (len(money_tail) // 2)
+        pieces.append(money_tail[tail])
+    elif fmt != 1 and frac_cents.any():
+        pieces.append(point_words[frac_cents])
+    if len(pieces) == 1:
+        words = pieces[0].tolist()
+    else:
+        words = list(map("".join, zip(*[p.tolist() for p in pieces])))
+    if slow is None:
+        return words
+    words.reverse()
+    return [slow[i] if i in slow else words.pop() for i in range(len(fast))]
+
+
+# ── Consecutive numbers ───────────────────────────────────────────────────────
+# iter_words() counts like an odometer: within each block of a thousand
+# numbers only the lowest group changes, so each number is its block's
+# prefix (the words of the higher groups, built once per block) plus one
+# group table lookup.  A run of n numbers costs n lookups and n/1000
+# _cardinal() calls, whatever their size.
+
+def iter_words(start, stop, fmt=0, lang="en", currency="USD"):
+    """Yield convert(n, fmt, lang, currency=currency) for n in range(start, stop).
+
+    start and stop are integers.  English runs of non-negative numbers are
+    built incrementally; negative numbers and other languages are converted
+    one at a time.
+    """
+    start, stop = operator.index(start), operator.index(stop)
+    money = None
+    if fmt == 2:
+        money = _currencies.get(currency) or currency_table(currency)
+    if language_pack(lang) is not _ENGLISH:
+        for n in range(start, stop):
+            yield convert(n, fmt, lang, "", currency)
+        return
+    for n in range(start, min(stop, 0)):
+        yield convert(n, fmt, "en", "", currency)
+    n = max(start, 0)
+    while n < stop:
+        head, low = divmod(n, 1000)
+        end = min(stop - head * 1000, 1000)   # stop, or the end of the block
+        yield from _odometer_block(head, low, end, fmt, money)
+        n = head * 1000 + end
+
+
+def _odometer_block(head, low, end, fmt, money):
+    # the words of head * 1000 + g for g in range(low, end)
+    groups = _ORDINAL_GROUPS if fmt == 1 else _CARDINAL_GROUPS
+    if fmt == 2:
+        one, many = money.major[1], money.major[0]
+    if not head:
+        if fmt == 1:
+            yield from groups[low:end]
+            return
+        if low == 0:
+            yield "zero" + many if fmt == 2 else "zero"
+            low = 1
+        if fmt == 2:
+            if low == 1 < end:
+                yield "one" + one
+                low = 2
+            for words in groups[low:end]:
+                yield words + many
+        else:
+            yield from groups[low:end]
+        return
+    prefix = _cardinal(head * 1000)
+    if low == 0:
+        # a round thousand ends on its scale word
+        yield prefix + ("th" if fmt == 1 else many if fmt == 2 else "")
+        low = 1
+    prefix += " "
+    if fmt == 2:
+        for words in groups[low:end]:
+            yield prefix + words + many
+    else:
+        for words in groups[low:end]:
+            yield prefix + words
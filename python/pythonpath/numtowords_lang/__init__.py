@@ -0,0 +1,2 @@
+# Language packs for numtowords_core, one module per language.  Loaded on
+# demand by numtowords_core.language_pack(); see LANGUAGE_PACKS there.
@@ -0,0 +1,125 @@
+# German language pack
+# Numbers below a million are written as one word
+# ("zweitausenddreihundertvierundzwanzig"); Million, Milliarde ... are nouns
+# and stand apart.  "eins" shortens to "ein" inside a compound and before a
+# noun ("einhundert", "ein Dollar").
+
+from numtowords_core import LanguagePack
+
+_UNITS = ("null", "eins", "zwei", "drei", "vier", "fünf", "sechs", "sieben",
+          "acht", "neun", "zehn", "elf", "zwölf", "dreizehn", "vierzehn",
+          "fünfzehn", "sechzehn", "siebzehn", "achtzehn", "neunzehn")
+
+_TENS = ("", "", "zwanzig", "dreißig", "vierzig", "fünfzig", "sechzig",
+         "siebzig", "achtzig", "neunzig")
+
+# 3-digit groups from 10**6 up, (singular, plural); 10**3 is "tausend"
+_SCALES = (None, None,
+           ("Million", "Millionen"), ("Milliarde", "Milliarden"),
+           ("Billion", "Billionen"), ("Billiarde", "Billiarden"),
+           ("Trillion", "Trillionen"), ("Trilliarde", "Trilliarden"),
+           ("Quadrillion", "Quadrillionen"), ("Quadrilliarde", "Quadrilliarden"),
+           ("Quintillion", "Quintillionen"), ("Quintilliarde", "Quintilliarden"))
+
+_ORDINAL_UNITS = {1: "erste", 3: "dritte", 7: "siebte", 8: "achte"}
+
+
+def _below_hundred(n):
+    if n < 20:
+        return _UNITS[n]
+    tens, unit = divmod(n, 10)
+    if not unit:
+        return _TENS[tens]
+    return ("ein" if unit == 1 else _UNITS[unit]) + "und" + _TENS[tens]
+
+
+def _group(n):
+    hundreds, rest = divmod(n, 100)
+    words = ("ein" if hundreds == 1 else _UNITS[hundreds]) + "hundert" if hundreds else ""
+    return words + (_below_hundred(rest) if rest else "")
+
+
+def _compound(words):
+    return words[:-1] if words.endswith("eins") else words
+
+
+def _ordinal_group(n, words):
+    rest = n % 100
+    if rest == 0 or rest >= 20:
+        return words + "ste"
+    stem = words[:len(words) - len(_UNITS[rest])]
+    return stem + _ORDINAL_UNITS.get(rest, _UNITS[rest] + "te")
+
+
+class German(LanguagePack):
+    code = "de"
+    minus = "minus"
+    point = "Komma"
+    digits = _UNITS[:10]
+    conjunction = "und"
+    major = ("Dollar", "Dollar")
+    minor = ("Cent", "Cent")
+    currencies = {
+        "EUR": (("Euro", "Euro"), ("Cent", "Cent")),
+        "GBP": (("Pfund", "Pfund"), ("Penny", "Pence")),
+        "PHP": (("Peso", "Pesos"), ("Centavo", "Centavos")),
+        "JPY": (("Yen", "Yen"), ("", "")),
+    }
+
+    def __init__(self):
+        self.groups = ("",) + tuple(_group(n) for n in range(1, 1000))
+        self.groups_compound = tuple(_compound(g) for g in self.groups)
+        self.ordinal_groups = ("",) + tuple(
+            _ordinal_group(n, self.groups[n]) for n in range(1, 1000))
+
+    def _words(self, n, compound):
+        if n == 0:
+            return "null"
+        n, low = divmod(n, 1000)
+        n, thousands = divmod(n, 1000)
+        words = (self.groups_compound if compound else self.groups)[low]
+        if thousands:
+            words = self.groups_compound[thousands] + "tausend" + words
+        parts = [words] if words else []
+        rank = 2
+        while n:
+            n, group = divmod(n, 1000)
+            if group:
+                if rank >= len(_SCALES):
+                    raise ValueError("number too large for German words")
+                if group == 1:
+                    parts.append("eine " + _SCALES[rank][0])
+                else:
+                    parts.append(self.groups_compound[group] + " " + _SCALES[rank][1])
+            rank += 1
+        return " ".join(reversed(parts))
+
+    def cardinal(self, n):
+        return self._words(n, False)
+
+    def cardinal_before_noun(self, n):
+        return self._words(n, True)
+
+    def ordinal(self, n):
+        if n < 1000:
+            return self.ordinal_groups[n] or "nullte"
+        low = n % 1000
+        if low:
+            head = self.cardinal(n - low)
+            joined = (n // 1000) % 1000
+            return head + ("" if joined else " ") + self.ordinal_groups[low]
+        if (n // 1000) % 1000:
+            return self.cardinal(n) + "ste"
+        # whole millions, milliards ...: "zweimillionste", "millionste"
+        rank = 2
+        while not (n // 1000 ** rank) % 1000:
+            rank += 1
+        if rank >= len(_SCALES):
+            raise ValueError("number too large for German words")
+        group = (n // 1000 ** rank) % 1000
+        rest = n - group * 1000 ** rank
+        noun = _SCALES[rank][0].lower()
+        if noun.endswith("e"):
+            noun = noun[:-1]
+        words = ("" if group == 1 else self.groups_compound[group]) + noun + "ste"
+        return (self.cardinal(rest) + " " + words) if rest else words
@@ -0,0 +1,160 @@
+# Spanish language pack
+# Long scale: millón (10**6), billón (10**12), trillón (10**18) ...  Numbers
+# are read in 6-digit periods; below a million thousands are counted with
+# "mil".  Before a noun "uno" shortens to "un" ("veintiún mil", "un dólar").
+
+from numtowords_core import LanguagePack
+
+_UNITS = ("cero", "uno", "dos", "tres", "cuatro", "cinco", "seis", "siete",
+          "ocho", "nueve", "diez", "once", "doce", "trece", "catorce",
+          "quince", "dieciséis", "diecisiete", "dieciocho", "diecinueve",
+          "veinte", "veintiuno", "veintidós", "veintitrés", "veinticuatro",
+          "veinticinco", "veintiséis", "veintisiete", "veintiocho", "veintinueve")
+
+_TENS = ("", "", "", "treinta", "cuarenta", "cincuenta",
+         "sesenta", "setenta", "ochenta", "noventa")
+
+_HUNDREDS = ("", "ciento", "doscientos", "trescientos", "cuatrocientos",
+             "quinientos", "seiscientos", "setecientos", "ochocientos",
+             "novecientos")
+
+# 6-digit periods: 10**6, 10**12, 10**18 ...
+_PERIODS = ("", "millón", "billón", "trillón", "cuatrillón", "quintillón",
+            "sextillón", "septillón", "octillón", "nonillón", "decillón")
+
+_ORDINAL_UNITS = ("", "primero", "segundo", "tercero", "cuarto", "quinto",
+                  "sexto", "séptimo", "octavo", "noveno")
+
+_ORDINAL_TEENS = ("décimo", "undécimo", "duodécimo", "decimotercero",
+                  "decimocuarto", "decimoquinto", "decimosexto",
+                  "decimoséptimo", "decimoctavo", "decimonoveno")
+
+_ORDINAL_TENS = ("", "décimo", "vigésimo", "trigésimo", "cuadragésimo",
+                 "quincuagésimo", "sexagésimo", "septuagésimo", "octogésimo",
+                 "nonagésimo")
+
+_ORDINAL_HUNDREDS = ("", "centésimo", "ducentésimo", "tricentésimo",
+                     "cuadringentésimo", "quingentésimo", "sexcentésimo",
+                     "septingentésimo", "octingentésimo", "noningentésimo")
+
+
+def _group(n):
+    hundreds, rest = divmod(n, 100)
+    parts = []
+    if hundreds:
+        parts.append("cien" if n == 100 else _HUNDREDS[hundreds])
+    if rest:
+        if rest < 30:
+            parts.append(_UNITS[rest])
+        else:
+            tens, unit = divmod(rest, 10)
+            parts.append(_TENS[tens] + (" y " + _UNITS[unit] if unit else ""))
+    return " ".join(parts)
+
+
+def _apocope(words):
+    if words.endswith("veintiuno"):
+        return words[:-3] + "ún"
+    if words.endswith("uno"):
+        return words[:-1]
+    return words
+
+
+def _ordinal_group(n):
+    hundreds, rest = divmod(n, 100)
+    parts = [_ORDINAL_HUNDREDS[hundreds]] if hundreds else []
+    if 10 <= rest < 20:
+        parts.append(_ORDINAL_TEENS[rest - 10])
+    elif rest:
+        tens, unit = divmod(rest, 10)
+        if tens:
+            parts.append(_ORDINAL_TENS[tens])
+        if unit:
+            parts.append(_ORDINAL_UNITS[unit])
+    return " ".join(parts)
+
+
+def _plural(period):
+    # "millón" -> "millones"
+    return period[:-2] + "ones"
+
+
+class Spanish(LanguagePack):
+    code = "es"
+    minus = "menos"
+    point = "coma"
+    digits = _UNITS[:10]
+    conjunction = "con"
+    major = ("dólar", "dólares")
+    minor = ("centavo", "centavos")
+    # libra (GBP) is feminine and would need "una libra"; not covered yet
+    currencies = {
+        "EUR": (("euro", "euros"), ("céntimo", "céntimos")),
+        "PHP": (("peso", "pesos"), ("centavo", "centavos")),
+        "JPY": (("yen", "yenes"), ("", "")),
+    }
+
+    def __init__(self):
+        self.groups = ("",) + tuple(_group(n) for n in range(1, 1000))
+        self.groups_apocope = tuple(_apocope(g) for g in self.groups)
+        self.ordinal_groups = ("",) + tuple(_ordinal_group(n) for n in range(1, 1000))
+
+    def _below_million(self, n, apocope):
+        thousands, low = divmod(n, 1000)
+        parts = []
+        if thousands:
+            parts.append("mil" if thousands == 1
+                         else self.groups_apocope[thousands] + " mil")
+        if low:
+            parts.append((self.groups_apocope if apocope else self.groups)[low])
+        return " ".join(parts)
+
+    def _cardinal(self, n, apocope):
+        if n == 0:
+            return "cero"
+        parts = []
+        rank = 0
+        while n:
+            n, period = divmod(n, 10 ** 6)
+            if period:
+                if rank == 0:
+                    parts.append(self._below_million(period, apocope))
+                elif rank >= len(_PERIODS):
+                    raise ValueError("number too large for Spanish words")
+                elif period == 1:
+                    parts.append("un " + _PERIODS[rank])
+                else:
+                    parts.append(self._below_million(period, True) + " "
+                                 + _plural(_PERIODS[rank]))
+            rank += 1
+        return " ".join(reversed(parts))
+
+    def cardinal(self, n):
+        return self._cardinal(n, False)
+
+    def cardinal_before_noun(self, n):
+        return self._cardinal(n, True)
+
+    def amount(self, n, unit):
+        # whole millions take "de": "un millón de dólares"
+        if n >= 10 ** 6 and n % 10 ** 6 == 0:
+            return self.cardinal_before_noun(n) + " de " + unit[1]
+        return LanguagePack.amount(self, n, unit)
+
+    def ordinal(self, n):
+        if n < 1000:
+            return self.ordinal_groups[n] or "cero"
+        low = n % 1000
+        # the scale word of the rest becomes ordinal: "mil" -> "milésimo",
+        # "millón"/"millones" -> "millonésimo"; a lone "un" is dropped
+        words = self.cardinal(n - low).split(" ")
+        last = words.pop()
+        if last == "mil":
+            words.append("milésimo")
+        else:
+            words.append(last[:-4 if last.endswith("ones") else -2] + "onésimo")
+        if words[0] == "un" and len(words) == 2:
+            words.pop(0)
+        if low:
+            words.append(self.ordinal_groups[low])
+        return " ".join(words)
@@ -0,0 +1,135 @@
+# French language pack
+# Long scale: million (10**6), milliard (10**9), billion (10**12) ...
+# "vingt" and "cent" take an -s only when they end the number and are
+# multiplied ("quatre-vingts", "deux cents"); "mille" never does.
+
+from numtowords_core import LanguagePack
+
+_UNITS = ("zéro", "un", "deux", "trois", "quatre", "cinq", "six", "sept",
+          "huit", "neuf", "dix", "onze", "douze", "treize", "quatorze",
+          "quinze", "seize", "dix-sept", "dix-huit", "dix-neuf")
+
+_TENS = ("", "dix", "vingt", "trente", "quarante", "cinquante", "soixante")
+
+# 3-digit groups from 10**6 up; 10**3 is "mille"
+_SCALES = ("", "", "million", "milliard", "billion", "billiard", "trillion",
+           "trilliard", "quadrillion", "quadrilliard", "quintillion",
+           "quintilliard")
+
+
+def _below_hundred(n):
+    if n < 20:
+        return _UNITS[n]
+    tens, unit = divmod(n, 10)
+    if tens == 7 or tens == 9:
+        # soixante-dix ... quatre-vingt-dix-neuf count on from ten
+        base = "soixante" if tens == 7 else "quatre-vingt"
+        if n == 71:
+            return "soixante et onze"
+        return base + "-" + _UNITS[10 + unit]
+    if tens == 8:
+        return "quatre-vingt-" + _UNITS[unit] if unit else "quatre-vingts"
+    if unit == 1:
+        return _TENS[tens] + " et un"
+    return _TENS[tens] + ("-" + _UNITS[unit] if unit else "")
+
+
+def _group(n):
+    hundreds, rest = divmod(n, 100)
+    if not hundreds:
+        return _below_hundred(rest)
+    if hundreds == 1:
+        words = "cent"
+    else:
+        words = _UNITS[hundreds] + (" cents" if not rest else " cent")
+    return words + (" " + _below_hundred(rest) if rest else "")
+
+
+def _before_mille(words):
+    # "quatre-vingt mille", "deux cent mille"
+    if words.endswith(("vingts", "cents")):
+        return words[:-1]
+    return words
+
+
+def _ordinal_word(word):
+    if word == "un":
+        return "unième"
+    if word == "cinq":
+        return "cinquième"
+    if word == "neuf":
+        return "neuvième"
+    if word.endswith(("vingts", "cents")) or word[:-1] in _SCALES:
+        word = word[:-1]
+    if word.endswith("e"):
+        word = word[:-1]
+    return word + "ième"
+
+
+def _ordinal(words):
+    cut = max(words.rfind(" "), words.rfind("-")) + 1
+    return words[:cut] + _ordinal_word(words[cut:])
+
+
+class French(LanguagePack):
+    code = "fr"
+    minus = "moins"
+    point = "virgule"
+    digits = _UNITS[:10]
+    conjunction = "et"
+    major = ("dollar", "dollars")
+    minor = ("cent", "cents")
+    # livre (GBP) is feminine and would need "une livre"; not covered yet
+    currencies = {
+        "EUR": (("euro", "euros"), ("centime", "centimes")),
+        "PHP": (("peso", "pesos"), ("centavo", "centavos")),
+        "JPY": (("yen", "yens"), ("", "")),
+    }
+
+    def __init__(self):
+        self.groups = ("",) + tuple(_group(n) for n in range(1, 1000))
+        self.groups_mille = tuple(_before_mille(g) for g in self.groups)
+        self.ordinal_groups = ("",) + tuple(_ordinal(g) for g in self.groups[1:])
+
+    def cardinal(self, n):
+        if n == 0:
+            return "zéro"
+        parts = []
+        rank = 0
+        while n:
+            n, group = divmod(n, 1000)
+            if group:
+                if rank == 0:
+                    parts.append(self.groups[group])
+                elif rank == 1:
+                    parts.append("mille" if group == 1
+                                 else self.groups_mille[group] + " mille")
+                elif rank >= len(_SCALES):
+                    raise ValueError("number too large for French words")
+                elif group == 1:
+                    parts.append("un " + _SCALES[rank])
+                else:
+                    parts.append(self.groups[group] + " " + _SCALES[rank] + "s")
+            rank += 1
+        return " ".join(reversed(parts))
+
+    def amount(self, n, unit):
+        # whole millions take "de": "un million de dollars", "d'euros"
+        if n >= 10 ** 6 and n % 10 ** 6 == 0:
+            return self.cardinal(n) + (" d'" if unit[1][:1] in "aeiouy" else " de ") + unit[1]
+        # French keeps zero singular: "zéro dollar"
+        return self.cardinal(n) + " " + unit[n > 1]
+
+    def ordinal(self, n):
+        if n == 1:
+            return "premier"
+        if n < 1000:
+            return self.ordinal_groups[n] or "zéroième"
+        low = n % 1000
+        if low:
+            return self.cardinal(n - low) + " " + self.ordinal_groups[low]
+        words = self.cardinal(n)
+        # "un million" -> "millionième"
+        if words.startswith("un ") and words.count(" ") == 1:
+            words = words[3:]
+        return _ordinal(words)
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Adds an "in words" column to one sheet of an OpenDocument spreadsheet
+(.ods) without starting LibreOffice.
+
+content.xml is streamed through expat twice: once to find the last column
+of the sheet that holds anything, and once to copy it byte for byte into
+the new file with the words written in the column after that one.  Memory
+use depends on the widest row, not on the number of rows.  No existing
+cell moves, so formulas, named ranges, validations and charts that refer
+to the sheet stay correct; everything else in the document is copied
+unchanged.
+
+    python3 -m numtowords_ods amounts.ods out.ods -c B -f 2
+    python3 -m numtowords_ods export.ods out.ods -c 3 --sheet Invoices --no-header
+
+Run with python/pythonpath on PYTHONPATH.
+"""
+
+import argparse
+import html
+import re
+import shutil
+import sys
+import zipfile
+from xml.parsers import expat
+
+from numtowords_cli import ProgressReporter, _format_style
+from numtowords_core import convert
+
+CONTENT = "content.xml"
+MIMETYPE = "mimetype"
+READ_SIZE = 1 << 16
+REPORT_EVERY = 1000      # rows between progress updates
+
+_TABLE_NS = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+_OFFICE_NS = "urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+_TEXT_NS = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+_NUMERIC_TYPES = ("float", "currency", "percentage")
+# a start or empty-element tag; attribute values may contain ">"
+_TAG = re.compile(rb"""<[^\s/>]+(?:\s+[^\s=]+\s*=\s*(?:"[^"]*"|'[^']*'))*\s*(/?)>""")
+_MARKUP = re.compile(rb"<[^>]*>")
+
+
+def column_index(column):
+    """0-based index of a column given as letters ("B", "AA") or a 1-based number."""
+    column = column.strip().upper()
+    if column.isdigit():
+        index = int(column) - 1
+    elif column.isalpha() and column.isascii():
+        index = 0
+        for letter in column:
+            index = index * 26 + ord(letter) - ord("A") + 1
+        index -= 1
+    else:
+        raise ValueError("column must be letters or a number, got %r" % column)
+    if index < 0:
+        raise ValueError("column numbers start at 1")
+    return index
+
+
+def _escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _quote(value):
+    return '"%s"' % (_escape(value).replace('"', "&quot;").replace("\n", "&#10;")
+                     .replace("\r", "&#13;").replace("\t", "&#9;"))
+
+
+def _start_tag(name, attrs):
+    # expat passes attributes in document order
+    return "<" + name + "".join(
+        " %s=%s" % (key, _quote(value)) for key, value in attrs.items())
+
+
+def _element_names(attrs):
+    """Element names and cell names for the prefixes a document declares."""
+    prefixes = {}
+    for key, value in attrs.items():
+        if key.startswith("xmlns:"):
+            prefixes[value] = key[6:] + ":"
+    table = prefixes.get(_TABLE_NS, "table:")
+    office = prefixes.get(_OFFICE_NS, "office:")
+    text = prefixes.get(_TEXT_NS, "text:")
+    names = {
+        "table": table + "table",
+        "name": table + "name",
+        "row": table + "table-row",
+        "cell": table + "table-cell",
+        "column": table + "table-column",
+        "columns_repeated": table + "number-columns-repeated",
+        "style": table + "style-name",
+        "value": office + "value",
+        "value_type": office + "value-type",
+        "p": text + "p",
+    }
+    # elements that may hold or follow column definitions before the rows
+    names["columns"] = (names["column"], table + "table-columns",
+                        table + "table-column-group", table + "table-header-columns")
+    return names, (table + "table-cell", table + "covered-table-cell")
+
+
+def _with(attrs, name, value):
+    """attrs with name set to value, or removed when value is None."""
+    attrs = dict(attrs)
+    attrs.pop(name, None)
+    if value is not None:
+        attrs[name] = value
+    return attrs
+
+
+class _UsedColumns:
+    """First pass: the last column of a sheet with anything in it.
+
+    A cell counts unless it is empty and carries no attribute but its
+    style and repeat count, which is how the unused end of a row is
+    written.
+    """
+
+    def __init__(self, sheet):
+        self.sheet = sheet
+        self.parser = parser = expat.ParserCreate()
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+        self.names = None
+        self.cells = ()
+        self.tables = 0
+        self.table_depth = 0
+        self.active = False
+        self.col = 0
+        self.cell_depth = 0        # inside a cell: its element depth
+        self.cell_last = 0         # last column the open cell covers
+        self.cell_used = False
+        self.last = -1             # last used column so far
+
+    def scan(self, stream):
+        for chunk in iter(lambda: stream.read(READ_SIZE), b""):
+            self.parser.Parse(chunk, False)
+        self.parser.Parse(b"", True)
+        return self.last
+
+    def start(self, name, attrs):
+        if self.names is None:
+            self.names, self.cells = _element_names(attrs)
+        if self.cell_depth:
+            self.cell_depth += 1
+            self.cell_used = True
+        elif name == self.names["table"]:
+            self.table_depth += 1
+            if self.table_depth == 1:
+                self.tables += 1
+                self.active = (attrs.get(self.names["name"]) == self.sheet
+                               if self.sheet is not None else self.tables == 1)
+        elif self.active and self.table_depth == 1:
+            if name == self.names["row"]:
+                self.col = 0
+            elif name in self.cells:
+                repeat_name = self.names["columns_repeated"]
+                self.col += int(attrs.get(repeat_name, 1))
+                self.cell_depth = 1
+                self.cell_last = self.col - 1
+                self.cell_used = name != self.names["cell"] or any(
+                    key not in (repeat_name, self.names["style"]) for key in attrs)
+
+    def end(self, name):
+        if self.cell_depth:
+            self.cell_depth -= 1
+            if not self.cell_depth and self.cell_used:
+                self.last = max(self.last, self.cell_last)
+        elif name == self.names["table"]:
+            self.table_depth -= 1
+            if self.table_depth == 0:
+                self.active = False
+
+
+class _Cell:
+    """A cell covering the source or the words column, held back until it ends."""
+
+    __slots__ = ("name", "attrs", "first", "start", "depth")
+
+    def __init__(self, name, attrs, first, start):
+        self.name = name
+        self.attrs = attrs
+        self.first = first     # column index of its first (repeated) copy
+        self.start = start     # input offset of its start tag
+        self.depth = 0         # open child elements
+
+
+class _ContentRewriter:
+    """Copies content.xml byte for byte, inserting the words cells.
+
+    expat only reports where things are: the input is written out
+    unchanged up to each edit, so the cost per row is the parse plus the
+    inserted cell.
+    """
+
+    def __init__(self, write, column, target, fmt, sheet, header, output_column,
+                 lang, reporter):
+        self.output = write
+        self.buffer = []           # output pieces, written once per chunk
+        self.write = self.buffer.append
+        self.column = column
+        self.target = target       # column the words go in
+        self.fmt = fmt
+        self.sheet = sheet
+        self.header = header
+        self.output_column = output_column
+        self.lang = lang
+        self.reporter = reporter
+        self.parser = parser = expat.ParserCreate()
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+        self.data = bytearray()    # input from offset on
+        self.offset = 0
+        self.copied = 0            # input offset written out so far
+        self.mark = 0              # input offset of the latest event
+        self.names = None          # element names, once the prefixes are known
+        self.cells = ()
+        self.tables = 0            # top-level tables seen
+        self.table_depth = 0
+        self.active = False        # inside the sheet being rewritten
+        self.found = False
+        self.cell_depth = 0        # inside a cell that is copied as is
+        self.col = 0               # next column index in the row
+        self.defined = 0           # columns defined so far
+        self.columns_end = None    # input offset after the latest column definition
+        self.cell = None           # _Cell being held back
+        self.row_words = None      # words of the current row, once its source is read
+        self.rows = 0
+        self.errors = 0
+        self.pending = 0           # rows not yet reported
+
+    def feed(self, chunk):
+        self.data += chunk
+        self.parser.Parse(chunk, False)
+        # nothing before the latest event (or a held-back cell or the place
+        # for more column definitions) changes again
+        hold = self.mark if self.cell is None else self.cell.start
+        if self.columns_end is not None:
+            hold = min(hold, self.columns_end)
+        self._copy(hold)
+        del self.data[:self.copied - self.offset]
+        self.offset = self.copied
+        self._flush()
+
+    def close(self):
+        self.parser.Parse(b"", True)
+        self._copy(self.offset + len(self.data))
+        self._flush()
+        if self.pending:
+            self.reporter.update(self.pending)
+
+    # ── output ──
+
+    def _flush(self):
+        self.output(b"".join(self.buffer))
+        self.buffer.clear()
+
+    def _copy(self, end):
+        if end > self.copied:
+            self.write(self.data[self.copied - self.offset:end - self.offset])
+            self.copied = end
+
+    def _replace(self, start, end, text):
+        self._copy(start)
+        self.write(text)
+        self.copied = end
+
+    def _tag_end(self, start):
+        """Input offset just past the start tag at start, and whether it is empty."""
+        match = _TAG.match(self.data, start - self.offset)
+        return match.end() + self.offset, bool(match.group(1))
+
+    # ── expat handlers ──
+
+    def start(self, name, attrs):
+        self.mark = self.parser.CurrentByteIndex
+        if self.names is None:
+            self.names, self.cells = _element_names(attrs)
+        if self.cell is not None:
+            self.cell.depth += 1
+        elif self.cell_depth:
+            if name in self.cells:
+                self.cell_depth += 1
+        elif name == self.names["table"]:
+            self.table_depth += 1
+            if self.table_depth == 1:
+                self.tables += 1
+                self.active = (attrs.get(self.names["name"]) == self.sheet
+                               if self.sheet is not None else self.tables == 1)
+                self.found = self.found or self.active
+                self.defined = 0
+        elif self.active and self.table_depth == 1:
+            if name == self.names["column"]:
+                self._column(attrs)
+            elif self.columns_end is not None and name not in self.names["columns"]:
+                self._add_columns()
+            if name == self.names["row"]:
+                self.col = 0
+                self.row_words = None
+            elif name in self.cells:
+                repeat = int(attrs.get(self.names["columns_repeated"], 1))
+                first = self.col
+                self.col += repeat
+                if first <= self.column < self.col or first <= self.target < self.col:
+                    self.cell = _Cell(name, attrs, first, self.mark)
+                else:
+                    self.cell_depth = 1
+
+    def end(self, name):
+        position = self.mark = self.parser.CurrentByteIndex
+        cell = self.cell
+        if cell is not None:
+            if cell.depth:
+                cell.depth -= 1
+            else:
+                self.cell = None
+                self._cell_end(cell, position)
+        elif self.cell_depth:
+            if name in self.cells:
+                self.cell_depth -= 1
+        elif name == self.names["table"]:
+            self.table_depth -= 1
+            if self.table_depth == 0:
+                if self.active and self.columns_end is not None:
+                    self._add_columns()
+                self.active = False
+        elif self.active and name == self.names["row"]:
+            self._row_end(position)
+            self.rows += 1
+            self.pending += 1
+            if self.pending >= REPORT_EVERY:
+                self.reporter.update(self.pending)
+                self.pending = 0
+
+    # ── edits ──
+
+    def _column(self, attrs):
+        # column definitions are always empty elements
+        self.defined += int(attrs.get(self.names["columns_repeated"], 1))
+        self.columns_end, _ = self._tag_end(self.mark)
+
+    def _add_columns(self):
+        # define columns up to the words column if the sheet stops short of it
+        missing = self.target + 1 - self.defined
+        if missing > 0:
+            tag = _start_tag(self.names["column"], {} if missing == 1 else {
+                self.names["columns_repeated"]: str(missing)}) + "/>"
+            self._replace(self.columns_end, self.columns_end, tag.encode("utf-8"))
+        self.columns_end = None
+
+    def _cell_end(self, cell, position):
+        tag_end, empty = self._tag_end(cell.start)
+        if empty:
+            end = tag_end
+            inner = b""
+        else:
+            end = self.data.index(b">", position - self.offset) + 1 + self.offset
+            inner = bytes(self.data[tag_end - self.offset:position - self.offset])
+        last = cell.first + int(cell.attrs.get(self.names["columns_repeated"], 1))
+        if cell.first <= self.column < last:
+            self.row_words = self._row_words(cell, inner)
+        if not self.row_words or not cell.first <= self.target < last:
+            return
+        # an unused cell: the words take its place, splitting a repeated one
+        pieces = []
+        if self.target > cell.first:
+            pieces.append(self._repeated(cell, self.target - cell.first, inner, empty))
+        pieces.append(self._words_cell(self.row_words))
+        if last > self.target + 1:
+            pieces.append(self._repeated(cell, last - self.target - 1, inner, empty))
+        self._replace(cell.start, end, b"".join(pieces))
+        self.row_words = None
+
+    def _row_end(self, position):
+        # a row that stops before the words column is padded out to it
+        if not self.row_words or self.col > self.target:
+            return
+        pad = self.target - self.col
+        text = b""
+        if pad:
+            text = (_start_tag(self.names["cell"], {} if pad == 1 else {
+                self.names["columns_repeated"]: str(pad)}) + "/>").encode("utf-8")
+        self._replace(position, position, text + self._words_cell(self.row_words))
+
+    def _repeated(self, cell, repeat, inner, empty):
+        attrs = _with(cell.attrs, self.names["columns_repeated"],
+                      str(repeat) if repeat > 1 else None)
+        tag = _start_tag(cell.name, attrs).encode("utf-8")
+        if empty:
+            return tag + b"/>"
+        return tag + b">" + inner + b"</" + cell.name.encode("utf-8") + b">"
+
+    def _row_words(self, cell, inner):
+        if self.header and self.rows == 0:
+            return self.output_column or _text(inner) + " in words"
+        return self._words(cell, inner)
+
+    def _words_cell(self, words):
+        if not words:
+            return ("<%s/>" % self.names["cell"]).encode("utf-8")
+        return ('<%s %s="string"><%s>%s</%s></%s>' % (
+            self.names["cell"], self.names["value_type"], self.names["p"],
+            _escape(words), self.names["p"], self.names["cell"])).encode("utf-8")
+
+    def _words(self, cell, inner):
+        value_type = cell.attrs.get(self.names["value_type"])
+        if value_type in _NUMERIC_TYPES:
+            value = cell.attrs.get(self.names["value"])
+        elif value_type in (None, "string"):
+            value = _text(inner).strip()
+            if not value:
+                return ""
+        else:
+            value = None           # dates, times, booleans
+        try:
+            return convert(float(value), self.fmt, self.lang)
+        except (TypeError, ValueError, OverflowError):
+            self.errors += 1
+            return ""
+
+
+def _text(inner):
+    """Text content of serialized cell content."""
+    return html.unescape(_MARKUP.sub(b"", inner).decode("utf-8"))
+
+
+def rewrite(src, dst, column, fmt=0, sheet=None, header=True,
+            output_column=None, lang="en", progress=None):
+    """Copy the .ods at src to dst with the words of column in a new column.
+
+    column is a 0-based index; sheet is a sheet name (default: the first
+    sheet).  The words go in the first column after every used one (and
+    after column).  Returns (rows, errors) where errors counts cells that
+    could not be read as numbers, which get no words.
+    """
+    reporter = ProgressReporter(progress)
+    rewriter = None
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(dst, "w") as zout:
+        try:
+            with zin.open(CONTENT) as fin:
+                target = max(_UsedColumns(sheet).scan(fin), column) + 1
+        except KeyError:
+            raise ValueError("%s has no %s" % (src, CONTENT)) from None
+        # ODF wants "mimetype" first, stored and with no extra field, so
+        # that its text sits at offset 38 for file-type detection
+        if MIMETYPE in zin.namelist():
+            info = zin.getinfo(MIMETYPE)
+            info.extra = b""
+            zout.writestr(info, zin.read(info))
+        # the other entries keep their order and compression; only
+        # content.xml, whose size is unknown until written, needs zip64
+        for info in zin.infolist():
+            if info.filename == MIMETYPE:
+                continue
+            with zin.open(info) as fin:
+                if info.filename == CONTENT:
+                    out_info = zipfile.ZipInfo(CONTENT, info.date_time)
+                    out_info.compress_type = zipfile.ZIP_DEFLATED
+                    with zout.open(out_info, "w", force_zip64=True) as fout:
+                        rewriter = _ContentRewriter(
+                            fout.write, column, target, fmt, sheet, header,
+                            output_column, lang, reporter)
+                        for chunk in iter(lambda: fin.read(READ_SIZE), b""):
+                            rewriter.feed(chunk)
+                        rewriter.close()
+                else:
+                    with zout.open(info, "w") as fout:
+                        shutil.copyfileobj(fin, fout, READ_SIZE)
+    reporter.finish()
+    if rewriter is None:
+        raise ValueError("%s has no %s" % (src, CONTENT))
+    if not rewriter.found:
+        raise ValueError("sheet %r not found" % sheet if sheet is not None
+                         else "no sheet in document")
+    return rewriter.rows, rewriter.errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Add a numbers-in-words column to an .ods spreadsheet.")
+    parser.add_argument("input", help="input .ods file")
+    parser.add_argument("output", help="output .ods file")
+    parser.add_argument("-c", "--column", required=True,
+                        help="column to convert: letters (B) or 1-based number")
+    parser.add_argument("-f", "--format", type=_format_style, default=0,
+                        help="0/cardinal (default), 1/ordinal, 2/currency")
+    parser.add_argument("-s", "--sheet", help="sheet name (default: first sheet)")
+    parser.add_argument("--lang", default="en",
+                        help="language of the words: en (default), es, fr, de")
+    parser.add_argument("--no-header", action="store_true",
+                        help="first row is data, not a header")
+    parser.add_argument("--output-column",
+                        help='header of the new column (default "<header> in words")')
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="no progress report on stderr")
+    args = parser.parse_args(argv)
+
+    try:
+        rows, errors = rewrite(
+            args.input, args.output, column_index(args.column), args.format,
+            args.sheet, header=not args.no_header,
+            output_column=args.output_column, lang=args.lang,
+            progress=None if args.quiet else sys.stderr)
+    except (ValueError, OSError, zipfile.BadZipFile, expat.ExpatError) as e:
+        parser.exit(2, "%s: error: %s\n" % (parser.prog, e))
+    if errors and not args.quiet:
+        sys.stderr.write(f"{errors:,} non-numeric cells left empty\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
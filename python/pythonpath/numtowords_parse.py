@@ -0,0 +1,198 @@
+# NumToWords reverse parser: words back to numbers
+# Inverse of numtowords_core.convert() for cardinal, ordinal and currency
+# wording.  Every word the engine can emit is indexed once at import, built
+# from the engine's own tables, so parsing is one pass of dict lookups.
+# Words must come in the order convert() writes them.  Currency names are
+# those of numtowords_core.CURRENCIES.
+#   words_to_number(text) -> int, or float when there is a fractional part
+
+from numtowords_core import (
+    CURRENCIES, _DECILLION, _ONES, _SCALE_NAMES, _TENS, _ordinal_suffix,
+)
+
+# Token kinds
+_UNIT, _HUNDRED, _SCALE, _DECILLIONS, _ZERO, _AND, _MINUS, _DOLLAR, _CENT = range(9)
+
+_DECILLION_VALUE = 10 ** 33
+
+
+def _build_index():
+    """Map each word to (kind, value), and the set of ordinal-only words.
+
+    Ordinal forms share their cardinal's entry.
+    """
+    index = {}
+    for n, word in enumerate(_ONES):
+        if word:
+            index[word] = (_UNIT, n)
+    for n, word in enumerate(_TENS):
+        if word:
+            index[word] = (_UNIT, n * 10)
+    index["hundred"] = (_HUNDRED, 100)
+    for rank, name in enumerate(_SCALE_NAMES):
+        if name:
+            index[name.strip()] = (_SCALE, 10 ** (3 * rank))
+    index[_DECILLION.strip()] = (_DECILLIONS, _DECILLION_VALUE)
+    index["zero"] = (_ZERO, 0)
+
+    ordinals = set()
+    for word, entry in list(index.items()):
+        ordinal = _ordinal_suffix(word)
+        index[ordinal] = entry
+        ordinals.add(ordinal)
+
+    index["and"] = (_AND, 0)
+    index["minus"] = (_MINUS, 0)
+    # a minor unit's value is the number of them in a major unit
+    for major_one, major_many, minor_one, minor_many, digits in CURRENCIES.values():
+        for name in (major_one, major_many):
+            index.setdefault(name, (_DOLLAR, 1))
+        for name in (minor_one, minor_many):
+            if name:
+                index.setdefault(name, (_CENT, 10 ** digits))
+    return index, frozenset(ordinals)
+
+
+_INDEX, _ORDINALS = _build_index()
+
+# convert() spells a zero decimal digit as an empty word ("twelve point  five")
+_DIGITS = {word: str(n) for n, word in enumerate(_ONES[:10])}
+_DIGITS["zero"] = "0"
+
+
+def _parse_integer(tokens, text, ordinal=True):
+    """Value of a run of cardinal/ordinal tokens (no sign, dollars or cents).
+
+    Raises ValueError for words out of the order convert() writes them in,
+    such as "five five", "one hundred hundred" or "one million thousand",
+    for an ordinal word anywhere but last (or at all, unless ordinal), and
+    for tokens with no number word.
+    """
+    if not any(_INDEX.get(word, (_AND,))[0] != _AND for word in tokens):
+        raise ValueError("no number words in %r" % text)
+    total = 0      # completed decillion segments
+    segment = 0    # completed groups below decillion
+    group = 0      # current 0-999 group
+    pending = 0    # value waiting for further "decillion" multipliers
+    chain = 0      # "decillion" words in a row so far
+    last_chain = None    # each decillion segment must be smaller than the last
+    last_scale = None    # and so must each scale word within a segment
+    last = len(tokens) - 1
+    for i, word in enumerate(tokens):
+        try:
+            kind, value = _INDEX[word]
+        except KeyError:
+            raise ValueError("unknown number word %r in %r" % (word, text)) from None
+        if word in _ORDINALS and (not ordinal or i != last):
+            raise ValueError("ordinal %r out of place in %r" % (word, text))
+        if kind == _DECILLIONS:
+            if chain:
+                pending *= value
+            else:
+                if not segment + group:
+                    raise ValueError("%r with no number before it in %r" % (word, text))
+                pending = (segment + group) * value
+                segment = group = 0
+                last_scale = None
+            chain += 1
+            continue
+        if chain:
+            if last_chain is not None and chain >= last_chain:
+                raise ValueError("%r out of order in %r" % (_DECILLION.strip(), text))
+            total += pending
+            pending = 0
+            last_chain, chain = chain, 0
+        low = group % 100
+        if kind == _UNIT:
+            # tens and teens start the last two digits, units end them
+            taken = low if value >= 10 else low % 10 or 10 <= low < 20
+            if taken:
+                raise ValueError("%r out of order in %r" % (word, text))
+            group += value
+        elif kind == _HUNDRED:
+            if not 0 < group < 10:
+                raise ValueError("%r out of order in %r" % (word, text))
+            group *= value
+        elif kind == _SCALE:
+            if not group or last_scale is not None and value >= last_scale:
+                raise ValueError("%r out of order in %r" % (word, text))
+            segment += group * value
+            group = 0
+            last_scale = value
+        elif kind == _ZERO:
+            if len(tokens) != 1:
+                raise ValueError("%r out of order in %r" % (word, text))
+        elif kind != _AND:
+            raise ValueError("unexpected word %r in %r" % (word, text))
+    if chain and last_chain is not None and chain >= last_chain:
+        raise ValueError("%r out of order in %r" % (_DECILLION.strip(), text))
+    return total + pending + segment + group
+
+
+def _tokens(text):
+    return text.replace("-", " ").split()
+
+
+def words_to_number(text):
+    """Parse words produced by convert() (any format style) into a number.
+
+    Returns an int for whole numbers and a float when the words carry a
+    decimal part or a minor amount.  Raises ValueError for text it cannot
+    read.
+    """
+    words = text.strip().lower()
+    negative = words.startswith("minus ")
+    if negative:
+        words = words[6:]
+
+    if " point " in words or words.startswith("point "):
+        words, _, digits = (" " + words).partition(" point ")
+        try:
+            digits = "".join(_DIGITS[d] for d in digits.split(" "))
+        except KeyError:
+            raise ValueError("bad decimal digits in %r" % text) from None
+        whole = _parse_integer(_tokens(words), text)
+        # built from the digits, so "point five five five" is .555 exactly
+        number = float("%d.%s" % (whole, digits)) if int(digits) else whole
+    else:
+        tokens = _tokens(words)
+        if not tokens:
+            raise ValueError("no number words in %r" % text)
+        if any(_INDEX.get(word, (None,))[0] in (_DOLLAR, _CENT) for word in tokens):
+            number = _parse_currency(tokens, text)
+        else:
+            number = _parse_integer(tokens, text)
+    return -number if negative else number
+
+
+def _parse_currency(tokens, text):
+    """Amount of currency words; a minor amount of a whole major unit or more
+    ("five dollars and one hundred cents") carries into it.
+    """
+    major = minor = None
+    scale = 100
+    start = 0
+    for i, word in enumerate(tokens):
+        kind, value = _INDEX.get(word, (None, None))
+        if kind == _DOLLAR:
+            if major is not None or minor is not None:
+                raise ValueError("%r out of order in %r" % (word, text))
+            major = _parse_integer(tokens[start:i], text, ordinal=False)
+            start = i + 1
+            # "and" joins the major and minor amounts
+            if start < len(tokens) and tokens[start] == "and":
+                start += 1
+        elif kind == _CENT:
+            if minor is not None:
+                raise ValueError("%r out of order in %r" % (word, text))
+            minor = _parse_integer(tokens[start:i], text, ordinal=False)
+            scale = value
+            start = i + 1
+    if start < len(tokens):
+        raise ValueError("unexpected words after amount in %r" % text)
+    if not minor:
+        return major or 0
+    whole, rest = divmod((major or 0) * scale + minor, scale)
+    if not rest:
+        return float(whole)
+    return float("%d.%0*d" % (whole, len(str(scale)) - 1, rest))
@@ -0,0 +1,90 @@
+# NumToWords sampling profiler
+# Opt-in profiling of the add-in inside a real LibreOffice process.  Every
+# Nth call of a wrapped function runs under cProfile and tracemalloc; every
+# dump_every samples the accumulated pstats and the allocation totals are
+# written to a directory.  Only imported when profiling is switched on, so
+# the normal path carries no cost.
+
+import cProfile
+import itertools
+import os
+import threading
+import time
+import tracemalloc
+from functools import wraps
+
+
+# keep the profiler's own bookkeeping out of the allocation figures
+_OWN_FRAMES = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+)
+
+
+class SamplingProfiler:
+    """Profiles one call in every `every` of the functions it wraps."""
+
+    def __init__(self, directory, every=100, dump_every=100, top=50):
+        self.directory = directory
+        self.every = max(1, int(every))
+        self.dump_every = max(1, int(dump_every))
+        self.top = top
+        self.samples = 0
+        self.dumps = 0
+        self._profile = cProfile.Profile()
+        self._allocations = {}   # "file:line" -> [size, count]
+        self._counter = itertools.count(1)
+        # one sampled call at a time; concurrent calls just run unprofiled
+        self._busy = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def wrap(self, func):
+        counter = self._counter
+        every = self.every
+
+        @wraps(func)
+        def wrapper(*args):
+            if next(counter) % every or not self._busy.acquire(False):
+                return func(*args)
+            try:
+                return self._sample(func, args)
+            finally:
+                self._busy.release()
+
+        return wrapper
+
+    def _sample(self, func, args):
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        self._profile.enable()
+        try:
+            return func(*args)
+        finally:
+            self._profile.disable()
+            snapshot = tracemalloc.take_snapshot().filter_traces(_OWN_FRAMES)
+            if started:
+                tracemalloc.stop()
+            for stat in snapshot.statistics("lineno"):
+                frame = stat.traceback[0]
+                key = "%s:%d" % (frame.filename, frame.lineno)
+                totals = self._allocations.setdefault(key, [0, 0])
+                totals[0] += stat.size
+                totals[1] += stat.count
+            self.samples += 1
+            if self.samples % self.dump_every == 0:
+                self.dump()
+
+    def dump(self):
+        """Write the pstats file and allocation summary collected so far."""
+        self.dumps += 1
+        stem = os.path.join(self.directory, "numtowords-%d-%s-%04d" % (
+            os.getpid(), time.strftime("%Y%m%d%H%M%S"), self.dumps))
+        self._profile.dump_stats(stem + ".pstats")
+        ranked = sorted(self._allocations.items(), key=lambda kv: -kv[1][0])
+        with open(stem + ".alloc.txt", "w", encoding="utf-8") as f:
+            f.write("# %d sampled calls, bytes and blocks still allocated "
+                    "after each call, summed\n" % self.samples)
+            for key, (size, count) in ranked[:self.top]:
+                f.write("%12d B %8d blocks  %s\n" % (size, count, key))
+        return stem
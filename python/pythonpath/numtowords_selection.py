@@ -0,0 +1,59 @@
+# NumToWords static selection conversion
+# The work behind Tools > Add-Ons > Number to Words > Convert Selection: a
+# block of cell values as read with one getDataArray() call is turned into
+# the block written back with one setDataArray() call.  Numbers become
+# words; text (including the results of =NUMTOWORDS() formulas) is kept as
+# static text and empty cells stay empty.  No UNO imports.
+#   convert_block(rows, fmt, lang, chunk_size, progress, cancel) -> rows
+
+import numtowords_core
+
+DEFAULT_CHUNK_SIZE = 20000
+
+
+class Cancelled(Exception):
+    """The conversion was cancelled before it finished."""
+
+
+def _convert_chunk(values, fmt, lang):
+    try:
+        return numtowords_core.convert_many(values, fmt, lang)
+    except (ValueError, OverflowError):
+        pass                 # find the bad value(s) one by one
+    words = []
+    for value in values:
+        try:
+            words.append(numtowords_core.convert(value, fmt, lang))
+        except (ValueError, OverflowError, ArithmeticError) as e:
+            words.append("Error: " + str(e))
+    return words
+
+
+def convert_block(rows, fmt=0, lang="en", chunk_size=DEFAULT_CHUNK_SIZE,
+                  progress=None, cancel=None):
+    """Rows of words for a getDataArray() block (a sequence of rows).
+
+    Each distinct number is converted once, chunk_size distinct values at
+    a time.  After each chunk progress(done, total) is called, if given, and
+    cancel (anything with is_set(), e.g. a threading.Event) is checked;
+    Cancelled is raised once it is set.
+    """
+    words = {}
+    for row in rows:
+        for value in row:
+            if type(value) is float:
+                words[value] = None
+    values = list(words)
+    total = len(values)
+    for start in range(0, total, chunk_size):
+        if cancel is not None and cancel.is_set():
+            raise Cancelled()
+        chunk = values[start:start + chunk_size]
+        words.update(zip(chunk, _convert_chunk(chunk, fmt, lang)))
+        if progress is not None:
+            progress(min(start + chunk_size, total), total)
+    if cancel is not None and cancel.is_set():
+        raise Cancelled()
+    return tuple(tuple(words[value] if type(value) is float else value
+                       for value in row)
+                 for row in rows)
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+JSON-lines conversion server: the add-in's wording for other services.
+
+Each request is one line of JSON, each answer one line back, in the order
+the requests arrived on that connection:
+
+    {"id": 7, "value": 1234.5, "format": 2}
+    {"id": 7, "words": "one thousand two hundred and thirty-four dollars and fifty cents"}
+
+"format" (0/1/2 or cardinal/ordinal/currency) and "lang" are optional and
+"id" is echoed back when given.  Numbers may also be sent as strings, which
+are converted exactly.  A request that cannot be converted is answered with
+{"id": ..., "error": "..."}.  Values of more than --max-digits digits (before
+or after the point, exponent included) are refused before they are queued,
+so one request cannot hold up the others.
+
+Requests from all connections are gathered into micro-batches.  A batch is
+converted when it holds --max-batch distinct values or when its oldest
+request has waited --max-delay-ms, and each distinct value in it is
+converted once.  A {"stats": true} line is answered with the batcher's
+counters: requests, distinct values converted and batches.
+
+    python3 -m numtowords_server --unix /run/numtowords.sock
+    python3 -m numtowords_server --tcp 127.0.0.1:8765 --max-delay-ms 2
+
+Run with python/pythonpath on PYTHONPATH.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from decimal import Decimal, InvalidOperation
+
+from numtowords_cli import FORMAT_STYLES
+from numtowords_core import convert, convert_many
+
+DEFAULT_TCP = "127.0.0.1:8765"
+DEFAULT_MAX_DELAY = 0.002
+DEFAULT_MAX_BATCH = 1024
+DEFAULT_MAX_DIGITS = 1000   # about 10 KB of words
+LINE_LIMIT = 1 << 16
+_EXACT_FLOAT = 2 ** 53      # ints below this convert the same as floats
+_VECTOR_MIN = 32            # smaller groups are cheaper one convert() at a time
+
+
+def _reject_constant(name):
+    raise ValueError("%s is not a number" % name)
+
+
+def _convert_group(values, fmt, lang):
+    """Words, or the exception, for each value of one (fmt, lang) group."""
+    if len(values) >= _VECTOR_MIN and all(
+            type(v) is float or (type(v) is int and -_EXACT_FLOAT < v < _EXACT_FLOAT)
+            for v in values):
+        try:
+            return convert_many(values, fmt, lang)
+        except (ValueError, OverflowError):
+            pass             # find the bad value(s) one by one
+    results = []
+    for value in values:
+        try:
+            results.append(convert(value, fmt, lang))
+        except (TypeError, ValueError, OverflowError, ArithmeticError) as e:
+            results.append(e)
+    return results
+
+
+class MicroBatcher:
+    """Collects conversion requests and converts them a batch at a time."""
+
+    def __init__(self, max_delay=DEFAULT_MAX_DELAY, max_batch=DEFAULT_MAX_BATCH):
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.pending = {}    # (value, fmt, lang) -> future shared by its callers
+        self.timer = None
+        self.requests = 0
+        self.values = 0      # distinct values converted
+        self.batches = 0
+
+    def submit(self, value, fmt=0, lang="en"):
+        """Future for the words of value; it resolves to a str or an exception."""
+        self.requests += 1
+        key = (value, fmt, lang)
+        future = self.pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self.pending[key] = loop.create_future()
+            if len(self.pending) >= self.max_batch:
+                self.flush()
+            elif self.timer is None:
+                self.timer = loop.call_later(self.max_delay, self.flush)
+        return future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, {}
+        if not batch:
+            return
+        self.batches += 1
+        self.values += len(batch)
+        groups = {}
+        for key in batch:
+            groups.setdefault(key[1:], []).append(key[0])
+        for (fmt, lang), values in groups.items():
+            for value, result in zip(values, _convert_group(values, fmt, lang)):
+                future = batch[(value, fmt, lang)]
+                if not future.done():
+                    future.set_result(result)
+
+    def stats(self):
+        return {"requests": self.requests, "values": self.values,
+                "batches": self.batches}
+
+
+class _RequestError(ValueError):
+    """A bad request whose id is known, so the answer can carry it."""
+
+    def __init__(self, ident, message):
+        ValueError.__init__(self, message)
+        self.ident = ident
+
+
+def _parse(line):
+    """The request object on a line; raises ValueError."""
+    try:
+        request = json.loads(line, parse_constant=_reject_constant)
+    except ValueError as e:
+        raise ValueError("bad JSON: %s" % e) from None
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    return request
+
+
+def _too_long(value, max_digits):
+    """Whether value has more than max_digits digits either side of the point."""
+    if isinstance(value, int):
+        return abs(value) >= 10 ** max_digits
+    if not isinstance(value, str):
+        return False         # floats stop at 309 digits
+    if len(value) > max_digits + 32:
+        return True          # decided without parsing the whole line
+    try:
+        number = Decimal(value.strip())
+    except InvalidOperation:
+        return False         # convert() answers with the error
+    if not number.is_finite():
+        return False
+    return number.adjusted() >= max_digits or -number.as_tuple().exponent > max_digits
+
+
+def _fields(request, max_digits=DEFAULT_MAX_DIGITS):
+    """(id, value, fmt, lang) of a conversion request; raises _RequestError."""
+    ident = request.get("id")
+    if "value" not in request:
+        raise _RequestError(ident, "missing value")
+    value = request["value"]
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise _RequestError(ident, "value must be a number or numeric string")
+    if _too_long(value, max_digits):
+        raise _RequestError(ident, "value has more than %d digits" % max_digits)
+    fmt = request.get("format", 0)
+    if isinstance(fmt, str):
+        fmt = FORMAT_STYLES.get(fmt, fmt)
+    if isinstance(fmt, bool) or fmt not in (0, 1, 2):
+        raise _RequestError(ident, "format must be 0/1/2 or cardinal/ordinal/currency")
+    lang = request.get("lang", "en")
+    if not isinstance(lang, str):
+        raise _RequestError(ident, "lang must be a string")
+    return ident, value, fmt, lang
+
+
+class ConversionServer:
+    """Serves JSON-lines conversion requests through one MicroBatcher."""
+
+    def __init__(self, max_delay=DEFAULT_MAX_DELAY, max_batch=DEFAULT_MAX_BATCH,
+                 max_digits=DEFAULT_MAX_DIGITS):
+        self.batcher = MicroBatcher(max_delay, max_batch)
+        self.max_digits = max_digits
+
+    async def start(self, tcp=None, unix=None):
+        """Start listening on a "host:port" or a Unix socket path."""
+        if unix:
+            return await asyncio.start_unix_server(self.handle, unix, limit=LINE_LIMIT)
+        host, _, port = (tcp or DEFAULT_TCP).rpartition(":")
+        return await asyncio.start_server(self.handle, host or None, int(port),
+                                          limit=LINE_LIMIT)
+
+    async def handle(self, reader, writer):
+        # answers are queued in request order; the sender waits on each
+        queue = asyncio.Queue()
+        sender = asyncio.ensure_future(self._send(queue, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    queue.put_nowait((None, ValueError("request line too long")))
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    queue.put_nowait(self._request(line))
+        except ConnectionError:
+            pass
+        finally:
+            queue.put_nowait(None)
+            await sender
+            writer.close()
+
+    def _request(self, line):
+        try:
+            request = _parse(line)
+            if request.get("stats") is True:
+                # read when the answer is sent, after the requests before it
+                return request.get("id"), self.batcher.stats
+            ident, value, fmt, lang = _fields(request, self.max_digits)
+        except _RequestError as e:
+            return e.ident, e
+        except ValueError as e:
+            return None, e
+        return ident, self.batcher.submit(value, fmt, lang)
+
+    @staticmethod
+    async def _send(queue, writer):
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            ident, result = item
+            if isinstance(result, asyncio.Future):
+                result = await result
+            elif callable(result):
+                result = result()
+            if isinstance(result, str):
+                answer = {"id": ident, "words": result}
+            elif isinstance(result, dict):
+                answer = {"id": ident, "stats": result}
+            else:
+                answer = {"id": ident, "error": str(result)}
+            writer.write(json.dumps(answer, ensure_ascii=False).encode("utf-8") + b"\n")
+            if queue.empty():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+
+
+async def serve(tcp=None, unix=None, max_delay=DEFAULT_MAX_DELAY,
+                max_batch=DEFAULT_MAX_BATCH, ready=None, max_digits=DEFAULT_MAX_DIGITS):
+    server = await ConversionServer(max_delay, max_batch, max_digits).start(tcp, unix)
+    if ready is not None:
+        ready(server)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve number-to-words conversion as JSON lines.")
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--tcp", metavar="HOST:PORT",
+                       help="listen on TCP (default %s)" % DEFAULT_TCP)
+    where.add_argument("--unix", metavar="PATH", help="listen on a Unix socket")
+    parser.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help="longest a request waits for its batch (default 2)")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help="distinct values per batch (default %d)" % DEFAULT_MAX_BATCH)
+    parser.add_argument("--max-digits", type=int, default=DEFAULT_MAX_DIGITS,
+                        help="longest value accepted, in digits (default %d)"
+                        % DEFAULT_MAX_DIGITS)
+    args = parser.parse_args(argv)
+
+    def ready(server):
+        names = ", ".join(str(s.getsockname()) for s in server.sockets)
+        sys.stderr.write("numtowords_server listening on %s\n" % names)
+
+    try:
+        asyncio.run(serve(args.tcp, args.unix, args.max_delay_ms / 1000,
+                          args.max_batch, ready, args.max_digits))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,471 @@
+# NumToWords Soros rule files
+# Loads number-to-words rules in the Soros format of libnumbertext (.sor)
+# and compiles them once: every pattern into a regex, every replacement
+# into a tree of text, group references, recursive calls and optional
+# parts, and the rules into a dispatch table.  Soros evaluation is
+# recursive and keeps converting the same sub-numbers ("000", "21", ...),
+# so results are memoized per program.
+#   Program(source).run("1234")           -> "one thousand two hundred and thirty-four"
+#   load("en") or load(path)              -> Program, compiled once per file
+#   SorosPack(program, code)              -> LanguagePack for convert()
+#   rule_pack(code)                       -> pack for numtowords_lang/<code>.sor;
+#                                            language_pack() falls back to it
+#
+# The format, as supported here:
+#   pattern replacement     one rule per line (or per ";"); "#" starts a
+#                           comment; quote a pattern or replacement ("...")
+#                           to keep spaces in it; \; \# \" escape
+#   pattern                 a regex that must match the whole input; rules
+#                           are tried in order and the first match wins.
+#                           A leading ^ (trailing $) limits the rule to text
+#                           at the start (end) of the input: "^0 zero" spells
+#                           a lone 0 but not the "00" of "100"
+#   \1 .. \9                the text of a group
+#   $1 .. $9, $(...)        the rules applied to a group, or to the text
+#                           inside the parentheses (which may hold \n, $n
+#                           and further calls).  A group is at the start/end
+#                           of the input if it is at the start/end of the
+#                           text it came from; "$(name ...)" is a new input
+#   [...]                   optional: dropped when every call in it (if it
+#                           has none, every group) comes out empty, e.g.
+#                           "$1 hundred[ and $2]"
+#   == name ==              the patterns that follow match after "name ",
+#                           which is where their input starts; $(name \1)
+#                           calls them.  "== ==" ends the block
+#   __numbertext__          the standard first rule, deleting left zeros
+#                           (added at the top when a file leaves it out)
+# Input that no rule matches converts to "".
+
+import os
+import re
+import threading
+
+from numtowords_core import LanguagePack
+
+RULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "numtowords_lang")
+CACHE_MAX = 1 << 16          # memoized results per program and context; cleared when full
+MAX_DEPTH = 200              # recursive calls before a rule file is deemed looping
+
+# left zero deletion, after an optional function name: "ordinal 05" -> "ordinal 5"
+_NUMBERTEXT = r'"([a-z][-a-z]* )?0+(0|[1-9]\d*)" $(\1\2)'
+_META = set(".^$*+?{}[]\\|()")
+# contexts: whether an input is at the start/end of the text it came from
+_BEGIN, _END = 2, 1
+_WHOLE = _BEGIN | _END
+_CONTEXTS = 4
+_programs = {}
+_programs_lock = threading.Lock()
+
+
+class _Call:
+    """$n or $(...): the rules applied to the text the parts expand to."""
+
+    __slots__ = ("parts", "group", "fresh", "first", "last")
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.group = parts[0] if len(parts) == 1 and type(parts[0]) is int else None
+        self.fresh = not parts or type(parts[0]) is str     # "$(name ...)"
+        self.first = parts[0] if parts and type(parts[0]) is int else None
+        self.last = parts[-1] if parts and type(parts[-1]) is int else None
+
+
+class _Optional:
+    """[...]: kept only if a call (without calls: a group) in it is non-empty."""
+
+    __slots__ = ("parts", "calls")
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.calls = any(type(part) is _Call or type(part) is _Optional and part.calls
+                         for part in parts)
+
+
+class _Rule:
+    __slots__ = ("regex", "literal", "key", "begin", "end", "offset", "parts", "source")
+
+    def __init__(self, pattern, replacement, prefix=""):
+        self.source = pattern
+        if prefix:
+            caret = pattern.startswith("^")
+            pattern = "^" * caret + re.escape(prefix) + pattern[caret:]
+        self.offset = len(prefix)    # where the input starts, after "name "
+        self.begin = pattern.startswith("^")
+        self.end = pattern.endswith("$") and not pattern.endswith("\\$")
+        body = pattern[self.begin:len(pattern) - self.end]
+        try:
+            self.regex = re.compile(body)
+        except re.error as e:
+            raise ValueError("bad pattern %r: %s" % (pattern, e)) from None
+        self.literal = body if not _META.intersection(body) else None
+        # the "name " a pattern starts with, for dispatch; None if it may vary
+        prefix = _literal_prefix(body)
+        self.key = prefix[:prefix.index(" ") + 1] if " " in prefix else None
+        self.parts = _parse_replacement(replacement, pattern)
+
+    def applies(self, begin, end):
+        return (begin or not self.begin) and (end or not self.end)
+
+
+class _Dispatch:
+    """The regex rules that may match an input, in order, and (unless a
+    pattern refers to its own groups) all of them as one alternation:
+    "(p1)|(p2)|..." fullmatches with the first pi that fullmatches, and
+    lastindex tells which."""
+
+    __slots__ = ("rules", "regex")
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.regex = None
+        if len(rules) < 2 or any(_BACKREF.search(rule.regex.pattern) for rule in rules):
+            return
+        index = {}
+        group = 1
+        for rule in rules:
+            index[group] = rule
+            group += rule.regex.groups + 1
+        try:
+            self.regex = re.compile("|".join("(%s)" % rule.regex.pattern for rule in rules))
+        except re.error:         # e.g. inline flags, which only work at the start
+            return
+        self.rules = index
+
+
+_BACKREF = re.compile(r"\\[1-9]|\(\?P[=<]|\(\?[aiLmsux]")
+
+
+def _literal_prefix(body):
+    prefix = []
+    for c in body:
+        if c in _META:
+            if c in "*?{+" and prefix:
+                prefix.pop()         # the char before a quantifier may not be there
+            break
+        prefix.append(c)
+    return "".join(prefix)
+
+
+def _parse_replacement(text, pattern):
+    return _parse_parts(text, 0, "", pattern)[0]
+
+
+def _parse_parts(text, i, close, pattern):
+    """Parts up to the unescaped close character; returns (parts, index after it)."""
+    parts = []
+    literal = []
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == "\\" and i + 1 < n:
+            nxt = text[i + 1]
+            if nxt.isdigit():
+                if literal:
+                    parts.append("".join(literal))
+                    literal = []
+                parts.append(int(nxt))
+            else:
+                literal.append(nxt)
+            i += 2
+            continue
+        if c == "$" and i + 1 < n and (text[i + 1].isdigit() or text[i + 1] == "("):
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            if text[i + 1] == "(":
+                inner, i = _parse_parts(text, i + 2, ")", pattern)
+            else:
+                inner, i = [int(text[i + 1])], i + 2
+            parts.append(_Call(tuple(inner)))
+            continue
+        if c == "[":
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            inner, i = _parse_parts(text, i + 1, "]", pattern)
+            parts.append(_Optional(tuple(inner)))
+            continue
+        if close and c == close:
+            if literal:
+                parts.append("".join(literal))
+            return tuple(parts), i + 1
+        literal.append(c)
+        i += 1
+    if close:
+        raise ValueError("unclosed %r in the replacement of %r" % (close, pattern))
+    if literal:
+        parts.append("".join(literal))
+    return tuple(parts), i
+
+
+def _statements(source):
+    """(pattern, replacement) pairs and ("==", name) headers of a .sor text."""
+    for line in source.splitlines():
+        statement = []
+        i = 0
+        quoted = False
+        while i < len(line):
+            c = line[i]
+            if c == "\\" and i + 1 < len(line) and line[i + 1] in ';#"':
+                statement.append(line[i:i + 2])
+                i += 2
+                continue
+            if c == '"':
+                quoted = not quoted
+            elif not quoted and c == "#":
+                break
+            elif not quoted and c == ";":
+                yield from _statement("".join(statement))
+                statement = []
+                i += 1
+                continue
+            statement.append(c)
+            i += 1
+        yield from _statement("".join(statement))
+
+
+_HEADER = re.compile(r"\s*==\s*(.*?)\s*==\s*$")
+_STATEMENT = re.compile(r'\s*("(?:[^"\\]|\\.)*"|\S+)\s*(.*?)\s*$')
+
+
+def _unquote(text):
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        text = text[1:-1]
+    return text.replace('\\"', '"').replace("\\;", ";").replace("\\#", "#")
+
+
+def _statement(text):
+    if not text.strip():
+        return
+    header = _HEADER.match(text)
+    if header:
+        yield "==", header.group(1)
+        return
+    m = _STATEMENT.match(text)
+    yield _unquote(m.group(1)), _unquote(m.group(2))
+
+
+class Program:
+    """A compiled Soros program; run(text) gives the words for text.
+
+    Thread-safe: the compiled rules never change, and the memo cache and
+    dispatch table hold only final results, so a thread racing another's
+    store (or the clear of a full cache) at worst computes a result again.
+    """
+
+    def __init__(self, source, name="<rules>", cache_max=CACHE_MAX):
+        self.name = name
+        self.cache_max = cache_max
+        rules = []
+        prefix = ""
+        numbertext = False
+        for pattern, replacement in _statements(source):
+            if pattern == "==":
+                prefix = replacement + " " if replacement else ""
+                continue
+            if pattern == "__numbertext__":
+                rules.append(_Rule(*next(_statements(_NUMBERTEXT))))
+                numbertext = True
+            else:
+                rules.append(_Rule(pattern, replacement, prefix))
+        if not numbertext:
+            rules.insert(0, _Rule(*next(_statements(_NUMBERTEXT))))
+        self.rules = tuple(rules)
+        # exact-text rules are found by dict lookup, per context: literal
+        # text -> index of the first rule matching it
+        self._literals = []
+        for context in range(_CONTEXTS):
+            begin, end = context & _BEGIN, context & _END
+            table = {}
+            for rule in rules:
+                if rule.literal is None or rule.literal in table:
+                    continue
+                for index, first in enumerate(rules):
+                    if first.applies(begin, end) and first.regex.fullmatch(rule.literal):
+                        table[rule.literal] = index
+                        break
+            self._literals.append(table)
+        # per context: "name " of the input -> regex rules to try, and memo
+        self._candidates = tuple({} for _ in range(_CONTEXTS))
+        self._caches = tuple({} for _ in range(_CONTEXTS))
+
+    def run(self, text):
+        """The words for text (e.g. "1234" or "ordinal 21"); "" if no rule matches."""
+        text = str(text)
+        words = self._caches[_WHOLE].get(text)
+        if words is None:
+            words = self._eval(text, _WHOLE, 0)
+        return words
+
+    def _eval(self, text, context, depth):
+        # callers have looked in the cache already
+        if depth > MAX_DEPTH:
+            raise ValueError("%s: rules recurse too deep on %r" % (self.name, text))
+        index = self._literals[context].get(text)
+        if index is not None:
+            rule = self.rules[index]
+            words = self._expand(rule, rule.parts, rule.regex.fullmatch(text),
+                                 context, depth)
+        else:
+            rule, m = self._match(text, context)
+            words = "" if rule is None else self._expand(rule, rule.parts, m, context, depth)
+        cache = self._caches[context]
+        if len(cache) >= self.cache_max:
+            cache.clear()
+        cache[text] = words
+        return words
+
+    def _match(self, text, context):
+        """(first regex rule matching text, its match) or (None, None)."""
+        space = text.find(" ")
+        name = text[:space + 1] if space > 0 else ""
+        dispatch = self._candidates[context].get(name)
+        if dispatch is None:
+            begin, end = context & _BEGIN, context & _END
+            dispatch = self._candidates[context][name] = _Dispatch(
+                [rule for rule in self.rules
+                 if rule.literal is None and rule.applies(begin, end)
+                 and rule.key in (None, name)])
+        if dispatch.regex is not None:
+            # one pass over the alternatives in C; the rule's own regex
+            # then gives its groups
+            m = dispatch.regex.fullmatch(text)
+            if m is None:
+                return None, None
+            rule = dispatch.rules[m.lastindex]
+            return rule, rule.regex.fullmatch(text)
+        for rule in dispatch.rules:
+            m = rule.regex.fullmatch(text)
+            if m is not None:
+                return rule, m
+        return None, None
+
+    def _expand(self, rule, parts, m, context, depth):
+        out = []
+        for part in parts:
+            kind = type(part)
+            if kind is str:
+                out.append(part)
+            elif kind is int:
+                out.append(m.group(part) or "")
+            elif kind is _Call:
+                out.append(self._call(rule, part, m, context, depth))
+            else:
+                out.append(self._optional(rule, part, m, context, depth)[0])
+        return "".join(out)
+
+    def _optional(self, rule, optional, m, context, depth):
+        """(text or "", whether a call in it was non-empty, whether a group was)."""
+        out = []
+        called = grouped = False
+        for part in optional.parts:
+            kind = type(part)
+            if kind is str:
+                out.append(part)
+            elif kind is int:
+                group = m.group(part) or ""
+                grouped = grouped or bool(group)
+                out.append(group)
+            elif kind is _Call:
+                words = self._call(rule, part, m, context, depth)
+                called = called or bool(words)
+                out.append(words)
+            else:
+                text, inner_called, inner_grouped = self._optional(
+                    rule, part, m, context, depth)
+                out.append(text)
+                called = called or inner_called
+                grouped = grouped or inner_grouped
+        if not (called if optional.calls else grouped):
+            return "", False, False
+        return "".join(out), called, grouped
+
+    def _call(self, rule, call, m, context, depth):
+        # the callee's input starts (ends) where the caller's does if its
+        # first (last) part is a group starting (ending) there
+        n = call.group
+        if n is not None:
+            text = m.group(n) or ""
+            callee = 0
+            if context & _BEGIN and m.start(n) == rule.offset:
+                callee = _BEGIN
+            if context & _END and m.end(n) == len(m.string):
+                callee |= _END
+        else:
+            text = self._expand(rule, call.parts, m, context, depth)
+            if call.fresh:
+                callee = _WHOLE
+            else:
+                callee = 0
+                if (context & _BEGIN and call.first is not None
+                        and m.start(call.first) == rule.offset):
+                    callee = _BEGIN
+                if (context & _END and call.last is not None
+                        and m.end(call.last) == len(m.string)):
+                    callee |= _END
+        words = self._caches[callee].get(text)
+        if words is None:
+            words = self._eval(text, callee, depth + 1)
+        return words
+
+
+def load(name_or_path):
+    """The compiled Program for a rules file: a path, or a language code for
+    numtowords_lang/<code>.sor.  Each file is compiled once per process."""
+    path = name_or_path
+    if os.path.sep not in path and not path.endswith(".sor"):
+        path = os.path.join(RULES_DIR, path + ".sor")
+    program = _programs.get(path)
+    if program is None:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        with _programs_lock:
+            program = _programs.get(path)
+            if program is None:
+                program = _programs[path] = Program(source, os.path.basename(path))
+    return program
+
+
+def rule_pack(code):
+    """SorosPack for numtowords_lang/<code>.sor, or None if there is no such file."""
+    path = os.path.join(RULES_DIR, code + ".sor")
+    if not os.path.isfile(path):
+        return None
+    return SorosPack(load(path), code)
+
+
+class SorosPack(LanguagePack):
+    """A language pack whose words come from a Soros program.
+
+    Cardinals are the rules run on the number ("-12.5" included, as
+    libnumbertext does), ordinals on "ordinal <n>" and currency amounts on
+    "money <CODE> <amount>".
+    """
+
+    def __init__(self, program, code):
+        self.program = program
+        self.code = code
+
+    def cardinal(self, n):
+        return self.program.run(str(n))
+
+    def ordinal(self, n):
+        return self.program.run("ordinal %d" % n)
+
+    def words(self, negative, int_part, frac_cents, fmt, money=None):
+        sign = "-" if negative else ""
+        if fmt == 1:
+            text = "ordinal %s%d" % (sign, int_part)
+        elif fmt == 2:
+            code = money.code if money is not None else "USD"
+            digits = money.digits if money is not None else 2
+            amount = "%d.%0*d" % (int_part, digits, frac_cents) if digits else str(int_part)
+            text = "money %s %s%s" % (code, sign, amount)
+        else:
+            text = "%s%d" % (sign, int_part)
+            if frac_cents:
+                text += "." + ("%02d" % frac_cents).rstrip("0")
+        words = self.program.run(text)
+        if not words:
+            raise ValueError("%s: no rule for %r" % (self.program.name, text))
+        return words
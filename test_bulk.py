@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for process-pool bulk conversion and column files (numtowords_bulk).
+"""
+
+import struct
+import sys
+from array import array
+
+import pytest
+
+from numtowords_bulk import (
+    COLUMN_HEADER, WordsColumn, convert_file, convert_parallel, iter_parallel, main,
+)
+from numtowords_core import convert_many
+
+VALUES = [float(i) * 1.25 for i in range(-50, 950)]
+
+
+def test_parallel_preserves_order():
+    expected = convert_many(VALUES, 2)
+    assert convert_parallel(VALUES, 2, workers=2, chunk_size=37) == expected
+
+
+def test_single_worker_and_iterables():
+    expected = convert_many(VALUES, 1)
+    assert convert_parallel(iter(VALUES), 1, workers=1, chunk_size=100) == expected
+    chunks = list(iter_parallel(iter(VALUES), 1, workers=2, chunk_size=300))
+    assert [len(c) for c in chunks] == [300, 300, 300, 100]
+
+
+def test_float64_buffer():
+    raw = array("d", VALUES).tobytes()
+    assert convert_parallel(raw, 0, workers=2, chunk_size=250) == convert_many(VALUES, 0)
+
+
+def _column_file(tmp_path, values):
+    source = tmp_path / "column.f64"
+    data = array("d", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    source.write_bytes(data.tobytes())
+    return str(source), str(tmp_path / "out")
+
+
+def _read_column(output):
+    with WordsColumn(output) as column:
+        return [column[i] for i in range(len(column))]
+
+
+def test_convert_file(tmp_path):
+    source, output = _column_file(tmp_path, VALUES)
+    assert convert_file(source, output, 2, chunk_size=300) == len(VALUES)
+    expected = convert_many(VALUES, 2)
+    assert _read_column(output) == expected
+    with WordsColumn(output) as column:
+        assert column[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            column[len(VALUES)]
+    assert convert_file(source, output, 2, workers=2, chunk_size=300) == len(VALUES)
+    assert _read_column(output) == expected
+
+
+def test_convert_file_without_numpy(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)    # import numpy fails
+    source, output = _column_file(tmp_path, VALUES)
+    convert_file(source, output, 1, chunk_size=128)
+    assert _read_column(output) == convert_many(VALUES, 1)
+
+
+def test_convert_file_resume(tmp_path):
+    source, output = _column_file(tmp_path, VALUES)
+    convert_file(source, output, 0, chunk_size=300)
+    # interrupted in the third chunk: part of its offsets and words written
+    header = struct.calcsize(COLUMN_HEADER)
+    with open(output + ".idx", "r+b") as f:
+        f.truncate(header + 8 * (601 + 50) + 3)
+    with open(output + ".words", "ab") as f:
+        f.write(b"half a chunk")
+    assert convert_file(source, output, 0, chunk_size=300, resume=True) == len(VALUES) - 650
+    assert _read_column(output) == convert_many(VALUES, 0)
+    assert convert_file(source, output, 0, chunk_size=300, resume=True) == 0
+    with pytest.raises(ValueError):
+        convert_file(source, output, 2, resume=True)     # another format
+
+
+def test_convert_file_rejects_partial_values(tmp_path):
+    source = tmp_path / "bad.f64"
+    source.write_bytes(b"\0" * 12)
+    with pytest.raises(ValueError):
+        convert_file(str(source), str(tmp_path / "out"))
+
+
+def test_convert_file_non_finite_rows(tmp_path):
+    values = [1.0, float("nan"), 2.5, float("inf"), -float("inf"), 3.0] * 40
+    source, output = _column_file(tmp_path, values)
+    assert convert_file(source, output, 2, chunk_size=64) == len(values)
+    finite = [v for v in values if v == v and abs(v) != float("inf")]
+    words = iter(convert_many(finite, 2))
+    assert _read_column(output) == [next(words) if w in finite else "" for w in values]
+    assert main([source, str(tmp_path / "again"), "-f", "2", "-q", "-w", "2"]) == 0
+    assert _read_column(str(tmp_path / "again")) == _read_column(output)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming CSV/TSV converter (numtowords_cli).
+"""
+
+import io
+import os
+import subprocess
+import sys
+
+from numtowords_cli import convert_stream, main
+
+CSV_INPUT = "id,Amount,note\n1,1.5,a\n2,,b\n3,abc,c\n4,1.5,d\n5,21\n6,nan,e\n7,-inf,f\n8,1e400,g\n"
+
+
+def test_convert_stream_by_name():
+    out = io.StringIO()
+    rows, errors = convert_stream(io.StringIO(CSV_INPUT), out, "Amount", fmt=2,
+                                  chunk_size=2)
+    assert (rows, errors) == (8, 4)
+    assert out.getvalue().splitlines() == [
+        "id,Amount,note,Amount in words",
+        "1,1.5,a,one dollar and fifty cents",
+        "2,,b,",
+        "3,abc,c,",
+        "4,1.5,d,one dollar and fifty cents",
+        "5,21,,twenty-one dollars",
+        "6,nan,e,",
+        "7,-inf,f,",
+        "8,1e400,g,",
+    ]
+
+
+def test_convert_stream_by_number_without_header():
+    out = io.StringIO()
+    convert_stream(io.StringIO("a\t1\nb\t2\n"), out, "2", fmt=1,
+                   delimiter="\t", header=False)
+    assert out.getvalue() == "a\t1\tfirst\nb\t2\tsecond\n"
+    out = io.StringIO()
+    convert_stream(io.StringIO("1\n2,x\n\n"), out, "2", header=False)
+    assert out.getvalue() == "1,,\n2,x,\n,,\n"
+
+
+def test_main_files(tmp_path):
+    src = tmp_path / "in.csv"
+    dst = tmp_path / "out.csv"
+    src.write_text("n\n1000\n", encoding="utf-8")
+    assert main([str(src), "-o", str(dst), "-c", "n", "--output-column",
+                 "words", "-q"]) == 0
+    assert dst.read_text(encoding="utf-8") == "n,words\n1000,one thousand\n"
+
+
+def test_stdin_to_stdout():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run(
+        [sys.executable, "-m", "numtowords_cli", "--tsv", "-c", "x", "-f", "ordinal"],
+        input="x\n3\n", capture_output=True, text=True, env=env, check=True)
+    assert out.stdout == "x\tx in words\n3\tthird\n"
+    assert "rows/sec" in out.stderr
@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
 """
 Test script for number to words conversion logic.
-This tests the core conversion algorithms without requiring LibreOffice UNO.
+Loads the shipped add-in (python/numtowords.uno.py) with the stand-in UNO
+runtime from uno_stub, so no LibreOffice is needed.
 """
 
+import os
+import xml.etree.ElementTree as ET
+
+import uno_stub
+
+XCU = os.path.join(os.path.dirname(os.path.abspath(__file__)), "python", "CalcAddIns.xcu")
+OOR = "{http://openoffice.org/2001/registry}"
+
+
+def _addin():
+    return uno_stub.load_addin().NumToWords(None)
+
 
 def test_conversion_logic():
-    """Test the number conversion logic used in the add-in."""
+    """Test NUMTOWORDS as the add-in computes it."""
 
     # Test data: (input_number, format_style, expected_output)
     test_cases = [
@@ -44,132 +57,7 @@ def test_conversion_logic():
         (1100, 0, "one thousand one hundred"),
     ]
 
-    # Simplified conversion logic for testing
-    def simple_number_to_words(num, format_style=0):
-        """Simplified version of the conversion logic for testing."""
-        # Handle negative numbers
-        if num < 0:
-            return "minus " + simple_number_to_words(abs(num), format_style)
-
-        # Handle zero
-        if num == 0:
-            if format_style == 1:  # ordinal
-                return "zeroth"
-            return "zero"
-
-        # Basic number words (same as in numtowords.py)
-        ones = [
-            "",
-            "one",
-            "two",
-            "three",
-            "four",
-            "five",
-            "six",
-            "seven",
-            "eight",
-            "nine",
-        ]
-        teens = [
-            "ten",
-            "eleven",
-            "twelve",
-            "thirteen",
-            "fourteen",
-            "fifteen",
-            "sixteen",
-            "seventeen",
-            "eighteen",
-            "nineteen",
-        ]
-        tens = [
-            "",
-            "",
-            "twenty",
-            "thirty",
-            "forty",
-            "fifty",
-            "sixty",
-            "seventy",
-            "eighty",
-            "ninety",
-        ]
-
-        def convert_below_thousand(n):
-            """Convert numbers 0-999 to words."""
-            if n == 0:
-                return ""
-
-            result = ""
-
-            # Hundreds
-            if n >= 100:
-                result += ones[n // 100] + " hundred"
-                n %= 100
-                if n > 0:
-                    result += " and "
-
-            # Tens and ones
-            if n >= 20:
-                result += tens[n // 10]
-                n %= 10
-                if n > 0:
-                    result += "-" + ones[n]
-            elif n >= 10:
-                result += teens[n - 10]
-            elif n > 0:
-                result += ones[n]
-
-            return result
-
-        # Large number scales
-        scales = [
-            (10**12, "trillion"),
-            (10**9, "billion"),
-            (10**6, "million"),
-            (10**3, "thousand"),
-            (1, ""),
-        ]
-
-        # Convert integer part
-        integer_part = int(num)
-        if integer_part == 0:
-            words = "zero"
-        else:
-            parts = []
-            for scale_value, scale_name in scales:
-                if integer_part >= scale_value:
-                    scale_part = integer_part // scale_value
-                    integer_part %= scale_value
-
-                    if scale_part > 0:
-                        scale_words = convert_below_thousand(scale_part)
-                        if scale_words:
-                            if scale_name:
-                                parts.append(f"{scale_words} {scale_name}")
-                            else:
-                                parts.append(scale_words)
-
-            words = " ".join(parts)
-
-        # Handle format styles (simplified)
-        if format_style == 1:  # ordinal
-            if words.endswith("one"):
-                words = words[:-3] + "first"
-            elif words.endswith("two"):
-                words = words[:-3] + "second"
-            elif words.endswith("three"):
-                words = words[:-5] + "third"
-            elif words.endswith("ve"):
-                words = words[:-2] + "fth"
-            elif words.endswith("t"):
-                words += "h"
-            elif words.endswith("e"):
-                words = words[:-1] + "th"
-            else:
-                words += "th"
-
-        return words.strip()
+    addin = _addin()
 
     # Run tests
     print("Testing number to words conversion logic...")
@@ -179,8 +67,8 @@ def test_conversion_logic():
     failed = 0
 
     for i, (num, style, expected) in enumerate(test_cases, 1):
-        result = simple_number_to_words(num, style)
-        if result.lower() == expected.lower():
+        result = addin.numToWords(float(num), style)
+        if result == expected:
             print(f"✓ Test {i:2d}: {num:10} (style={style}) -> '{result}'")
             passed += 1
         else:
@@ -191,15 +79,63 @@ def test_conversion_logic():
 
     print("=" * 60)
     print(f"Results: {passed} passed, {failed} failed")
-
-    if failed == 0:
-        print("✅ All tests passed!")
-        return True
-    else:
-        print("❌ Some tests failed.")
-        return False
+    assert failed == 0
+
+
+def test_addin_entry_points():
+    module = uno_stub.load_addin()
+    assert "com.numbertext.converter.NumToWordsPy" in \
+        module.g_ImplementationHelper.implementations
+    addin = _addin()
+    assert addin.numToWords(1250.0, 2, "upper only") == \
+        "ONE THOUSAND TWO HUNDRED AND FIFTY DOLLARS ONLY"
+    assert addin.numToWords(7.0, None) == "seven"
+    assert addin.numToWordsRange(((1.0, ""), (2.0, 1.0)), 1) == \
+        (("first", ""), ("second", "first"))
+    addin.setLocale(uno_stub.Locale("es", "ES", ""))
+    assert addin.numToWords(21.0) == "veintiuno"
+    stats = {prop.Name: prop.Value for prop in addin.getCacheStats()}
+    assert stats["misses"] >= 4 and stats["maxsize"] == 4096
+    assert "document language" in addin.getFunctionDescription("numToWords")
+    assert "English" in addin.getFunctionDescription("wordsToNumber")
+
+
+def _xcu_prop(node, name):
+    prop = node.find("prop[@%sname=%r]" % (OOR, name))
+    return prop.find("value").text
+
+
+def test_wizard_texts_match_xcu():
+    addin = _addin()
+    functions = ET.parse(XCU).getroot().find(".//node[@%sname='AddInFunctions']" % OOR)
+    names = []
+    for function in functions:
+        name = function.get(OOR + "name")
+        names.append(name)
+        assert addin.getFunctionDescription(name) == _xcu_prop(function, "Description")
+        params = function.find("node[@%sname='Parameters']" % OOR)
+        for idx, param in enumerate(params):
+            assert addin.getDisplayArgumentName(name, idx) == \
+                _xcu_prop(param, "DisplayName"), (name, idx)
+            assert addin.getArgumentDescription(name, idx) == \
+                _xcu_prop(param, "Description"), (name, idx)
+        assert addin.getDisplayArgumentName(name, len(params)) == ""
+    assert addin.getDisplayArgumentName("numToWordsFmt", 1) == "Template"
+    assert sorted(names) == sorted(uno_stub.load_addin().FUNCTION_ARGUMENTS)
+
+
+def test_marshalling_proxy():
+    bridged = uno_stub.MarshallingProxy(_addin(), call_ns=0, item_ns=0)
+    assert bridged.numToWords(21.0, 1) == "twenty-first"
+    rows = bridged.numToWordsRange(((1.0,), (2.0,)), 0)
+    assert rows == (("one",), ("two",))
+    assert (bridged.calls, bridged.values) == (2, 2 + 1 + 3 + 2)
 
 
 if __name__ == "__main__":
-    success = test_conversion_logic()
-    exit(0 if success else 1)
+    try:
+        test_conversion_logic()
+    except AssertionError:
+        print("❌ Some tests failed.")
+        exit(1)
+    print("✅ All tests passed!")
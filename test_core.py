@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the UNO-free conversion engine (python/pythonpath/numtowords_core.py).
+"""
+
+import os
+import subprocess
+import sys
+
+import numtowords_core
+from numtowords_core import convert, convert_many, iter_words
+
+# Cold import of the engine must stay cheap: it is paid by the first
+# =NUMTOWORDS() cell after Calc starts.
+IMPORT_BUDGET_MS = 50
+
+# (input_number, format_style, expected_output)
+CASES = [
+    (0, 0, "zero"),
+    (21, 0, "twenty-one"),
+    (1234567, 0,
+     "one million two hundred and thirty-four thousand five hundred and sixty-seven"),
+    (12.34, 0, "twelve point three four"),
+    (-5, 0, "minus five"),
+    (0, 1, "zeroth"),
+    (12, 1, "twelfth"),
+    (21, 1, "twenty-first"),
+    (1000, 1, "one thousandth"),
+    (1001, 1, "one thousand first"),
+    (2000000, 1, "two millionth"),
+    (1, 2, "one dollar"),
+    (99.99, 2, "ninety-nine dollars and ninety-nine cents"),
+    (2.01, 2, "two dollars and one cent"),
+    (-1234.5, 2,
+     "minus one thousand two hundred and thirty-four dollars and fifty cents"),
+    (10 ** 12, 0, "one trillion"),
+    (10 ** 15, 0, "one quadrillion"),
+    (2 * 10 ** 15 + 1, 0, "two quadrillion one"),
+    (10 ** 33, 0, "one decillion"),
+    (15 * 10 ** 35, 0, "one thousand five hundred decillion"),
+    (10 ** 66 + 10 ** 33, 0, "one decillion decillion one decillion"),
+    (10 ** 21, 1, "one sextillionth"),
+    (10 ** 20 + 3, 1, "one hundred quintillion third"),
+]
+
+
+def test_convert():
+    for number, style, expected in CASES:
+        assert convert(number, style) == expected, (number, style)
+
+
+def test_exact_inputs():
+    from decimal import Decimal
+
+    big = "98765432109876543210987654321"
+    assert convert(big, 0) == convert(int(big), 0)
+    assert convert(Decimal(big + ".07"), 2) == convert(int(big), 2) + " and seven cents"
+    assert convert(" 42 ", 1) == "forty-second"
+    assert convert(big + "005", 1, style="title") == \
+        convert(int(big + "005"), 1, style="title")
+    assert convert("9" * 20 + ".6", 2, currency="JPY") == convert(10 ** 20, 2, currency="JPY")
+    for bad in ("forty-two", "nan", "-inf", "Infinity", Decimal("sNaN"),
+                float("nan"), float("inf"), "1e1000000", "1e-1000000"):
+        try:
+            convert(bad, 0)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError for %r" % (bad,))
+
+
+def test_rounding_carries():
+    from decimal import Decimal
+
+    # a fraction that rounds to 100 cents is a whole unit more
+    for text, words in (("1.995", "two"), ("0.999", "one"), ("9.995", "ten")):
+        assert convert(text, 0) == words
+        assert convert(Decimal(text), 0) == words
+        assert convert(text, 2) == words + (" dollar" if words == "one" else " dollars")
+        assert convert("-" + text, 0) == "minus " + words
+    assert convert("1.995", 1) == "first"
+    assert convert("9.6", 2, currency="JPY") == "ten yen"
+    assert convert(5.997, 0) == "six"
+    assert convert(0.999, 2) == "one dollar"
+    assert convert(1.999, 2, currency="EUR") == "two euros"
+
+
+def test_long_exact_inputs():
+    import time
+    from decimal import Decimal
+
+    # split from the digits: linear time, and past the 4300-digit int limit
+    digits = "123456789" * 5000
+    start = time.perf_counter()
+    words = convert(digits, 0)
+    assert time.perf_counter() - start < 2
+    assert words.startswith("one hundred and twenty-three ") and words.endswith(
+        " seven hundred and eighty-nine")
+    assert convert(Decimal(digits + ".5"), 2).endswith(" dollars and fifty cents")
+    assert convert("1e45", 0) == convert(10 ** 45, 0)
+    try:
+        convert("1" * (numtowords_core.EXACT_DIGITS_MAX + 1), 0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_digit_path_matches_divmod_path():
+    import random
+
+    rng = random.Random(7)
+    for _ in range(2000):
+        n = rng.randint(0, 10 ** 15 - 1)
+        assert numtowords_core._cardinal_digits(str(n)) == numtowords_core._cardinal(n)
+
+
+def test_convert_many_matches_convert():
+    values = [case[0] for case in CASES] + [0.5, 0.999, 5.997, -1.9999, 1e14 + 7, -0.0]
+    for style in (0, 1, 2):
+        expected = [convert(float(v), style) for v in values]
+        assert convert_many(values, style) == expected
+        assert numtowords_core._convert_many_py(values, style) == expected
+
+
+def test_convert_many_buffer():
+    from array import array
+
+    values = array("d", [1.0, 2.25, 1.0])
+    expected = ["one", "two point two five", "one"]
+    assert convert_many(values, 0) == expected
+    assert convert_many(values.tobytes(), 0) == expected
+
+
+def test_iter_words_matches_convert():
+    # block edges, a million, the divmod/digit path edge, decillions
+    runs = [(-1003, 1002), (998, 2003), (999_990, 1_001_010),
+            (10 ** 15 - 5, 10 ** 15 + 1003), (10 ** 36 - 3, 10 ** 36 + 2), (7, 3)]
+    for fmt in (0, 1, 2):
+        for start, stop in runs:
+            expected = [convert(n, fmt) for n in range(start, stop)]
+            assert list(iter_words(start, stop, fmt)) == expected
+    assert list(iter_words(0, 3, 2, currency="JPY")) == ["zero yen", "one yen", "two yen"]
+    assert list(iter_words(20, 22, 1, "es")) == [convert(20, 1, "es"), convert(21, 1, "es")]
+
+
+def test_import_budget():
+    code = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); "
+        "t = time.perf_counter(); import numtowords_core; "
+        "print((time.perf_counter() - t) * 1000)"
+    )
+    path = os.path.dirname(numtowords_core.__file__)
+    out = subprocess.run([sys.executable, "-c", code, path],
+                         capture_output=True, text=True, check=True)
+    assert float(out.stdout) < IMPORT_BUDGET_MS
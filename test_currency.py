@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the currency registry and the cheque batch mode.
+"""
+
+import io
+import random
+from decimal import Decimal
+
+import pytest
+
+import numtowords_cheque
+from numtowords_cheque import cheque_lines
+from numtowords_core import convert, convert_many, currency_table
+
+# (number, currency, lang, expected_words)
+CASES = [
+    (1234.56, "EUR", "en", "one thousand two hundred and thirty-four euros and fifty-six cents"),
+    (1.01, "GBP", "en", "one pound and one penny"),
+    (2.02, "gbp", "en", "two pounds and two pence"),
+    (2.5, "PHP", "en", "two pesos and fifty centavos"),
+    (1500.4, "JPY", "en", "one thousand five hundred yen"),
+    (1499.6, "JPY", "en", "one thousand five hundred yen"),
+    (1, "USD", "en", "one dollar"),
+    (21.21, "EUR", "es", "veintiún euros con veintiún céntimos"),
+    (2000000, "EUR", "fr", "deux millions d'euros"),
+    (1.01, "GBP", "de", "ein Pfund und ein Penny"),
+]
+
+
+def test_currencies():
+    for number, code, lang, expected in CASES:
+        assert convert(number, 2, lang, currency=code) == expected, (number, code, lang)
+
+
+def test_unknown_currency():
+    with pytest.raises(ValueError):
+        currency_table("XXX")
+    with pytest.raises(ValueError):
+        convert(1, 2, "es", currency="GBP")      # no Spanish wording yet
+    assert convert(5, 0, currency="XXX") == "five"   # only fmt 2 uses it
+
+
+def test_convert_many_matches_convert():
+    rng = random.Random(20)
+    values = [round(rng.uniform(-10 ** 7, 10 ** 7), 2) for _ in range(3000)] + [0.995, 1.0]
+    for code in ("USD", "EUR", "GBP", "PHP", "JPY"):
+        for style in ("", "upper only"):
+            assert convert_many(values, 2, style=style, currency=code) == \
+                [convert(v, 2, "en", style, code) for v in values], (code, style)
+
+
+def test_cheque_lines():
+    lines = cheque_lines([(1234.5, "USD"), ("7", "JPY"), (1234.5, "USD")], width=40)
+    assert lines[0] == (
+        "ONE THOUSAND TWO HUNDRED AND THIRTY-FOUR",
+        "DOLLARS AND FIFTY CENTS ONLY************",
+    )
+    assert lines[1] == ("SEVEN YEN ONLY" + "*" * 26, "*" * 40)
+    assert lines[2] is lines[0]
+    assert all(len(line) == 40 for cheque in lines for line in cheque)
+    with pytest.raises(ValueError):
+        cheque_lines([(1234567.89, "EUR")], width=20, lines=2)
+
+
+def test_cheque_main(tmp_path, capsys):
+    src = tmp_path / "payments.csv"
+    src.write_text("12,EUR\n\n3.5\n", encoding="utf-8")
+    assert numtowords_cheque.main([str(src), "-w", "40", "-l", "1", "--fill", "-"]) == 0
+    assert capsys.readouterr().out == (
+        "TWELVE EUROS ONLY-----------------------\n"
+        "THREE DOLLARS AND FIFTY CENTS ONLY------\n")
+
+
+def test_cheque_amounts_parsed(monkeypatch):
+    rows = "12.5,EUR\n7\n1e3\n12345678901234567.89\n0.125\n"
+    pairs = list(numtowords_cheque._read_pairs(io.StringIO(rows)))
+    assert [type(a) for a, _ in pairs] == [float, float, float, Decimal, Decimal]
+    calls = []
+    real = numtowords_cheque.convert_many
+    monkeypatch.setattr(numtowords_cheque, "convert_many",
+                        lambda values, *args: calls.append(values) or real(values, *args))
+    lines = cheque_lines(pairs[:3], width=200, lines=1)
+    assert calls == [[12.5], [7.0, 1000.0]]
+    assert lines[2] == ("ONE THOUSAND DOLLARS ONLY".ljust(200, "*"),)
+    assert cheque_lines(pairs[3:], width=200, lines=2)[0][0].startswith(
+        "TWELVE QUADRILLION")
+
+
+def test_cheque_bad_amounts(tmp_path, capsys):
+    for amount in ("nan", "inf", "-Infinity", "12 dollars"):
+        src = tmp_path / "payments.csv"
+        src.write_text("1\n%s,EUR\n" % amount, encoding="utf-8")
+        with pytest.raises(SystemExit) as e:
+            numtowords_cheque.main([str(src)])
+        assert e.value.code == 1
+        assert "line 2: %r is not an amount" % amount in capsys.readouterr().err
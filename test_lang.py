@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-locale language packs (numtowords_lang).
+"""
+
+import numtowords_core
+from numtowords_core import convert, convert_many, language_pack
+
+# (lang, number, formatStyle, expected_words)
+CASES = [
+    ("es", 21, 0, "veintiuno"),
+    ("es", 21000, 0, "veintiún mil"),
+    ("es", 1000000, 2, "un millón de dólares"),
+    ("es", 21.21, 2, "veintiún dólares con veintiún centavos"),
+    ("es", 115, 1, "centésimo decimoquinto"),
+    ("es", -12.05, 0, "menos doce coma cero cinco"),
+    ("fr", 71, 0, "soixante et onze"),
+    ("fr", 80, 0, "quatre-vingts"),
+    ("fr", 80000, 0, "quatre-vingt mille"),
+    ("fr", 200, 0, "deux cents"),
+    ("fr", 1, 1, "premier"),
+    ("fr", 21, 1, "vingt et unième"),
+    ("fr", 1.01, 2, "un dollar et un cent"),
+    ("de", 101, 0, "einhunderteins"),
+    ("de", 2324, 0, "zweitausenddreihundertvierundzwanzig"),
+    ("de", 2000000, 0, "zwei Millionen"),
+    ("de", 1, 2, "ein Dollar"),
+    ("de", 3, 1, "dritte"),
+    ("de", 21, 1, "einundzwanzigste"),
+    ("de", 12.5, 0, "zwölf Komma fünf"),
+]
+
+
+def test_language_packs():
+    for lang, number, style, expected in CASES:
+        assert convert(number, style, lang) == expected, (lang, number, style)
+
+
+def test_locale_tags_and_fallback():
+    assert language_pack("fr-CA") is language_pack("fr")
+    assert language_pack("de_AT") is language_pack("DE")
+    assert convert(12, 0, "xx") == convert(12, 0) == "twelve"
+
+
+def test_packs_load_once():
+    pack = language_pack("es")
+    assert language_pack("es-MX") is pack
+    assert numtowords_core._packs["es"] is pack
+
+
+def test_convert_many_lang():
+    values = [0, 1, 21.5, 1000, -3]
+    for lang in ("es", "fr", "de"):
+        assert convert_many(values, 2, lang) == [convert(v, 2, lang) for v in values]
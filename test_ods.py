@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming .ods rewriter (numtowords_ods).
+"""
+
+import zipfile
+
+import pytest
+
+import numtowords_ods
+from numtowords_ods import column_index, rewrite
+
+HEAD = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<office:document-content'
+        ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"'
+        ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">'
+        '<office:body><office:spreadsheet>')
+TAIL = '</office:spreadsheet></office:body></office:document-content>'
+
+
+def cell(value=None, text=None, repeat=1):
+    repeated = ' table:number-columns-repeated="%d"' % repeat if repeat > 1 else ""
+    if value is not None:
+        return ('<table:table-cell office:value-type="float" office:value="%s"%s>'
+                '<text:p>%s</text:p></table:table-cell>' % (value, repeated, value))
+    if text is not None:
+        return ('<table:table-cell office:value-type="string"%s>'
+                '<text:p>%s</text:p></table:table-cell>' % (repeated, text))
+    return '<table:table-cell%s/>' % repeated
+
+
+def words(text):
+    return ('<table:table-cell office:value-type="string"><text:p>%s</text:p>'
+            '</table:table-cell>' % text)
+
+
+def row(*cells):
+    return "<table:table-row>" + "".join(cells) + "</table:table-row>"
+
+
+def table(name, *rows, columns='<table:table-column table:number-columns-repeated="3"/>'):
+    return '<table:table table:name="%s">%s%s</table:table>' % (name, columns, "".join(rows))
+
+
+def make_ods(path, *tables):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("mimetype", "application/vnd.oasis.opendocument.spreadsheet")
+        z.writestr("content.xml", HEAD + "".join(tables) + TAIL, zipfile.ZIP_DEFLATED)
+        z.writestr("META-INF/manifest.xml", "<manifest/>", zipfile.ZIP_DEFLATED)
+
+
+def content(path):
+    with zipfile.ZipFile(path) as z:
+        return z.read("content.xml").decode("utf-8")
+
+
+SHEET = table(
+    "Sheet1",
+    row(cell(text="id"), cell(text="Amount &amp; tax"), cell(repeat=1022)),
+    row(cell(text="a"), cell(21.5), cell(text="x")),
+    row(cell(7, repeat=3)),
+    row(cell(text="b"), cell(text=" 12 ")),
+    row(cell(text="c"), cell(text="n/a")),
+    row(cell()),
+)
+
+# the words go after the last used column (C), so no cell moves
+EXPECTED = table(
+    "Sheet1",
+    row(cell(text="id"), cell(text="Amount &amp; tax"), cell(),
+        words("Amount &amp; tax in words"), cell(repeat=1020)),
+    row(cell(text="a"), cell(21.5), cell(text="x"),
+        words("twenty-one dollars and fifty cents")),
+    row(cell(7, repeat=3), words("seven dollars")),
+    row(cell(text="b"), cell(text=" 12 "), cell(), words("twelve dollars")),
+    row(cell(text="c"), cell(text="n/a")),
+    row(cell()),
+    columns='<table:table-column table:number-columns-repeated="3"/>'
+            '<table:table-column/>',
+)
+
+
+def test_rewrite(tmp_path):
+    src, dst = tmp_path / "in.ods", tmp_path / "out.ods"
+    other = table("Other", row(cell(1), cell(2)))
+    make_ods(src, SHEET, other)
+    assert rewrite(str(src), str(dst), 1, fmt=2) == (6, 1)
+    assert content(dst) == HEAD + EXPECTED + other + TAIL
+    with zipfile.ZipFile(dst) as z:
+        first = z.infolist()[0]
+        assert (first.filename, first.compress_type) == ("mimetype", zipfile.ZIP_STORED)
+        assert z.read("META-INF/manifest.xml") == b"<manifest/>"
+
+
+def test_mimetype_entry_has_no_extra_field(tmp_path):
+    src, dst = tmp_path / "in.ods", tmp_path / "out.ods"
+    make_ods(src, SHEET)
+    rewrite(str(src), str(dst), 1)
+    data = dst.read_bytes()
+    # first local header: name length at 26, extra length at 28, name at 30
+    assert data[:4] == b"PK\x03\x04"
+    assert int.from_bytes(data[26:28], "little") == len(b"mimetype")
+    assert int.from_bytes(data[28:30], "little") == 0
+    assert data[30:38] == b"mimetype"
+    assert data[38:84] == b"application/vnd.oasis.opendocument.spreadsheet"
+
+
+def test_chunk_boundaries(tmp_path, monkeypatch):
+    src = tmp_path / "in.ods"
+    make_ods(src, SHEET)
+    for size in (1, 5, 17):
+        monkeypatch.setattr(numtowords_ods, "READ_SIZE", size)
+        dst = tmp_path / ("out%d.ods" % size)
+        rewrite(str(src), str(dst), 1, fmt=2)
+        assert content(dst) == HEAD + EXPECTED + TAIL
+
+
+def test_sheet_and_no_header(tmp_path):
+    src, dst = tmp_path / "in.ods", tmp_path / "out.ods"
+    make_ods(src, table("First", row(cell(1))), table("Second", row(cell(3))))
+    assert rewrite(str(src), str(dst), 0, fmt=1, sheet="Second", header=False) == (1, 0)
+    assert content(dst) == (HEAD + table("First", row(cell(1)))
+                            + table("Second", row(cell(3), words("third"))) + TAIL)
+    with pytest.raises(ValueError):
+        rewrite(str(src), str(dst), 0, sheet="Missing")
+
+
+def test_column_index():
+    assert [column_index(c) for c in ("A", "b", "Z", "AA", "3")] == [0, 1, 25, 26, 2]
+    with pytest.raises(ValueError):
+        column_index("0")
+
+
+def test_used_area_and_columns(tmp_path):
+    src, dst = tmp_path / "in.ods", tmp_path / "out.ods"
+    formula = ('<table:table-cell table:formula="of:=[.A2]*2"'
+               ' table:style-name="ce1"/>')
+    styled = '<table:table-cell table:style-name="ce2" table:number-columns-repeated="9"/>'
+    make_ods(src, table(
+        "Sheet1",
+        row(cell(text="n"), styled),
+        row(cell(4), cell(repeat=3), formula, styled),
+        columns='<table:table-columns><table:table-column/></table:table-columns>'))
+    assert rewrite(str(src), str(dst), 0, header=False) == (2, 1)
+    assert content(dst) == HEAD + table(
+        "Sheet1",
+        row(cell(text="n"), styled),
+        row(cell(4), cell(repeat=3), formula, words("four"),
+            '<table:table-cell table:style-name="ce2"'
+            ' table:number-columns-repeated="8"/>'),
+        columns='<table:table-columns><table:table-column/>'
+                '<table:table-column table:number-columns-repeated="5"/>'
+                '</table:table-columns>') + TAIL
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the words-to-number parser (numtowords_parse).
+"""
+
+import random
+
+import pytest
+
+import uno_stub
+from numtowords_core import CURRENCIES, convert
+from numtowords_parse import words_to_number
+
+# (words, expected_number)
+CASES = [
+    ("zero", 0),
+    ("zeroth", 0),
+    ("twenty-one", 21),
+    ("One Hundred and Twenty-Third", 123),
+    ("one thousandth", 1000),
+    ("minus five", -5),
+    ("twelve point three four", 12.34),
+    ("twelve point  five", 12.05),
+    ("one dollar", 1),
+    ("ninety-nine dollars and ninety-nine cents", 99.99),
+    ("fifty cents", 0.5),
+    ("one thousand five hundred decillion", 15 * 10 ** 35),
+    ("one decillion decillion one decillion", 10 ** 66 + 10 ** 33),
+    ("one hundred and five", 105),
+    ("one million two thousand and three", 1002003),
+    ("twelve euros and one cent", 12.01),
+    ("two pounds and two pence", 2.02),
+    ("one penny", 0.01),
+    ("one thousand five hundred yen", 1500),
+    ("two pesos and fifty centavos", 2.5),
+    ("one point five five five", 1.555),
+    ("five dollars and one hundred cents", 6.0),
+    ("one hundred cents", 1.0),
+]
+
+# text convert() never writes, each an error rather than a number
+JUNK = [
+    "and", "dollars", "cents", "and and",
+    "first hundred", "one hundred and first thousand", "second dollars",
+    "one million thousand two", "thousand", "hundred", "one thousand hundred",
+    "decillion", "fifth fifth",
+]
+
+
+def test_words_to_number():
+    for words, expected in CASES:
+        assert words_to_number(words) == expected, words
+
+
+def test_minor_amount_carries():
+    for value, code in ((5.997, "USD"), (0.999, "USD"), (9.995, "EUR"), (2.999, "GBP")):
+        words = convert(value, 2, "en", "", code)
+        assert words_to_number(words) == round(value, 2), words
+
+
+def test_rejects_junk():
+    for text in JUNK:
+        with pytest.raises(ValueError):
+            words_to_number(text)
+    addin = uno_stub.load_addin().NumToWords(None)
+    for text in JUNK:
+        with pytest.raises(uno_stub.IllegalArgumentException):
+            addin.wordsToNumber(text)
+
+
+def test_round_trip():
+    rng = random.Random(11)
+    values = [rng.randint(0, 10 ** 15) for _ in range(2000)]
+    values += [round(rng.uniform(-10 ** 6, 10 ** 6), 2) for _ in range(2000)]
+    for value in values:
+        for style in (0, 1, 2):
+            words = convert(value, style)
+            assert convert(words_to_number(words), style) == words, (value, style)
+    for n in (10 ** 40 + 7, 10 ** 99 + 10 ** 33 + 12):
+        assert words_to_number(convert(n, 0)) == n
+        assert words_to_number(convert(n, 1)) == n
+
+
+def test_currency_round_trip():
+    rng = random.Random(20)
+    values = [round(rng.uniform(0, 10 ** 6), 2) for _ in range(500)] + [0.01, 1, 1.01]
+    for code in CURRENCIES:
+        for value in values:
+            words = convert(value, 2, "en", "", code)
+            assert convert(words_to_number(words), 2, "en", "", code) == words, (code, value)
+
+
+def test_rejects_unknown_words():
+    for text in ("twenty-won", "", "one dollar and a bit"):
+        try:
+            words_to_number(text)
+        except ValueError:
+            continue
+        raise AssertionError("expected ValueError for %r" % text)
+
+
+def test_rejects_words_out_of_order():
+    for text in ("five five", "one hundred hundred", "twenty thirty", "twenty-eleven",
+                 "fifteen five", "twelve hundred", "one thousand one million",
+                 "one thousand two thousand", "one decillion one decillion",
+                 "one decillion two decillion decillion", "zero five", "five zero",
+                 "five cents two dollars", "one dollar two dollars",
+                 "one cent and two cents"):
+        try:
+            words_to_number(text)
+        except ValueError:
+            continue
+        raise AssertionError("expected ValueError for %r" % text)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Tests for the opt-in sampling profiler (numtowords_profile).
+"""
+
+import glob
+import os
+import pstats
+
+from numtowords_core import convert
+from numtowords_profile import SamplingProfiler
+
+
+def test_samples_every_nth_call_and_dumps(tmp_path):
+    profiler = SamplingProfiler(str(tmp_path), every=5, dump_every=4)
+    wrapped = profiler.wrap(convert)
+    results = [wrapped(n, 2) for n in range(40)]
+
+    assert results == [convert(n, 2) for n in range(40)]
+    assert profiler.samples == 8
+    assert profiler.dumps == 2
+    stats_files = sorted(glob.glob(os.path.join(str(tmp_path), "*.pstats")))
+    assert len(stats_files) == 2
+    functions = {func for _, _, func in pstats.Stats(stats_files[-1]).stats}
+    assert "convert" in functions
+    assert glob.glob(os.path.join(str(tmp_path), "*.alloc.txt"))
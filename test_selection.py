@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the static "Convert Selection to Words" block conversion.
+"""
+
+import threading
+import time
+
+import pytest
+
+import uno_stub
+from numtowords_core import convert
+from numtowords_selection import Cancelled, convert_block
+
+
+def test_block_keeps_shape_text_and_empty_cells():
+    rows = ((1.0, "one", ""), (2.5, 1.0, "=formula result"))
+    assert convert_block(rows, 2) == (
+        ("one dollar", "one", ""),
+        ("two dollars and fifty cents", "one dollar", "=formula result"),
+    )
+    assert convert_block((), 0) == ()
+
+
+def test_chunks_and_progress():
+    rows = tuple((float(n % 250), float(n)) for n in range(1000))
+    calls = []
+    out = convert_block(rows, 1, chunk_size=100, progress=lambda *a: calls.append(a))
+    assert out[999] == (convert(249, 1), convert(999, 1))
+    assert calls == [(n, 1000) for n in range(100, 1001, 100)]
+
+
+def test_language_and_error_cells():
+    assert convert_block(((21.0, float("inf")),), 0, "es")[0][0] == "veintiuno"
+    assert convert_block(((float("nan"),),), 0)[0][0].startswith("Error: ")
+
+
+def test_cancel():
+    cancel = threading.Event()
+    rows = tuple((float(n),) for n in range(1000))
+
+    def progress(done, total):
+        if done >= 300:
+            cancel.set()
+
+    with pytest.raises(Cancelled):
+        convert_block(rows, 0, chunk_size=100, progress=progress, cancel=cancel)
+
+
+class _Office:
+    """Just enough of a Calc document and service manager for the job.
+
+    Every document call records the thread it came from; callbacks posted
+    to the main thread wait in a queue until run_main_thread().
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.threads = set()
+        self.queue = []
+        self.undo = []
+        self.ServiceManager = self
+        self.CharLocale = uno_stub.Locale("en")
+
+    def _called(self):
+        self.threads.add(threading.get_ident())
+
+    def createInstanceWithContext(self, name, ctx):
+        return self
+
+    def addCallback(self, callback, data):
+        self.queue.append(callback)
+
+    def run_main_thread(self, module):
+        deadline = time.monotonic() + 10
+        while module._running is not None:
+            assert time.monotonic() < deadline
+            while self.queue:
+                self.queue.pop(0).notify(None)
+            time.sleep(0.001)
+
+    # Desktop, document, selection and undo manager in one
+    def getCurrentComponent(self):
+        return self
+
+    def getSheets(self):
+        return None
+
+    def getCurrentSelection(self):
+        return self
+
+    def getCurrentController(self):
+        raise RuntimeError("no frame")       # runs without a status bar
+
+    def getDataArray(self):
+        self._called()
+        return self.rows
+
+    def setDataArray(self, rows):
+        self._called()
+        self.rows = rows
+
+    def getUndoManager(self):
+        self._called()
+        return self
+
+    def enterUndoContext(self, title):
+        self.undo.append(title)
+
+    def leaveUndoContext(self):
+        pass
+
+    def lockControllers(self):
+        self._called()
+
+    def unlockControllers(self):
+        self._called()
+
+
+def test_selection_job_uses_document_on_main_thread():
+    module = uno_stub.load_addin()
+    office = _Office(((1.0, "x"), (2.0, "")))
+    module.ConvertSelectionJob(office).trigger("2")
+    office.run_main_thread(module)
+    assert office.rows == (("one dollar", "x"), ("two dollars", ""))
+    assert office.undo == ["Convert to Words"]
+    assert office.threads == {threading.get_ident()}
+
+
+def test_selection_job_keeps_edits_made_meanwhile():
+    module = uno_stub.load_addin()
+    office = _Office(((1.0,),))
+    module.ConvertSelectionJob(office).trigger("0")
+    office.rows = ((5.0,),)              # the user types while it converts
+    office.run_main_thread(module)
+    assert office.rows == ((5.0,),)
+    assert office.undo == []
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON-lines conversion server (numtowords_server).
+"""
+
+import asyncio
+import json
+import time
+
+from numtowords_core import convert
+from numtowords_server import ConversionServer, MicroBatcher
+
+
+async def _exchange(server, lines):
+    """Send all lines on one connection; return the decoded answers."""
+    listener = await server.start(tcp="127.0.0.1:0")
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(line + "\n" for line in lines).encode())
+    writer.write_eof()
+    answers = [json.loads(line) async for line in reader]
+    writer.close()
+    listener.close()
+    await listener.wait_closed()
+    return answers
+
+
+def test_answers_in_order():
+    server = ConversionServer(max_delay=0.01)
+    answers = asyncio.run(_exchange(server, [
+        '{"id": 1, "value": 21.5, "format": 2}',
+        '{"id": 2, "value": 7, "format": "ordinal"}',
+        '{"id": 3, "value": 21.5, "format": "currency"}',
+        '{"id": 4, "value": "12345678901234567890.25"}',
+        '{"id": 5, "value": 3, "lang": "de"}',
+        '{"stats": true}',
+    ]))
+    assert answers == [
+        {"id": 1, "words": "twenty-one dollars and fifty cents"},
+        {"id": 2, "words": "seventh"},
+        {"id": 3, "words": "twenty-one dollars and fifty cents"},
+        {"id": 4, "words": convert("12345678901234567890.25", 0)},
+        {"id": 5, "words": "drei"},
+        {"id": None, "stats": {"requests": 5, "values": 4, "batches": 1}},
+    ]
+
+
+def test_errors():
+    answers = asyncio.run(_exchange(ConversionServer(), [
+        'not json',
+        '[1]',
+        '{"id": 3}',
+        '{"id": 4, "value": true}',
+        '{"id": 5, "value": 1, "format": 9}',
+        '{"id": 6, "value": 1e400}',
+        '{"id": 7, "value": "abc"}',
+        '{"id": 8, "value": 1}',
+    ]))
+    assert [a["id"] for a in answers] == [None, None, 3, 4, 5, 6, 7, 8]
+    assert all("error" in a for a in answers[:-1])
+    assert answers[-1]["words"] == "one"
+
+
+def test_long_values_refused_before_queueing():
+    start = time.perf_counter()
+    answers = asyncio.run(_exchange(ConversionServer(max_digits=50), [
+        '{"id": 1, "value": "1e1000000"}',
+        '{"id": 2, "value": "1e-51"}',
+        '{"id": 3, "value": "%s"}' % ("9" * 51),
+        '{"id": 4, "value": %s}' % ("9" * 51),
+        '{"id": 5, "value": "%s"}' % ("1" * 5000),
+        '{"id": 6, "value": "nan"}',
+        '{"id": 7, "value": "%s.5"}' % ("9" * 50),
+    ]))
+    assert time.perf_counter() - start < 5
+    assert [a["error"] for a in answers[:5]] == ["value has more than 50 digits"] * 5
+    assert "error" in answers[5]
+    assert answers[6]["words"] == convert("9" * 50 + ".5", 0)
+
+
+def test_batches_dedupe_and_size_limit():
+    async def run():
+        batcher = MicroBatcher(max_delay=1, max_batch=4)
+        full = [batcher.submit(n, 0) for n in (1, 2, 1, 3, 4)]
+        # the fourth distinct value fills the batch: converted at once
+        assert all(f.done() for f in full)
+        waiting = [batcher.submit(n, 1) for n in (5, 5, 5)]
+        assert not any(f.done() for f in waiting)
+        batcher.flush()
+        return batcher, [f.result() for f in full + waiting]
+
+    batcher, words = asyncio.run(run())
+    assert words == ["one", "two", "one", "three", "four", "fifth", "fifth", "fifth"]
+    assert batcher.stats() == {"requests": 8, "values": 5, "batches": 2}
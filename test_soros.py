@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the Soros rule-file compiler (numtowords_soros).  The shipped
+en.sor must word every number like the built-in English.
+"""
+
+import os
+import random
+
+import pytest
+
+import numtowords_core
+import numtowords_soros
+from numtowords_core import convert
+from numtowords_soros import Program, SorosPack, load
+
+
+def _numbers():
+    rng = random.Random(25)
+    return (list(range(2100)) + [10 ** k for k in range(1, 110)]
+            + [rng.randrange(10 ** rng.randrange(1, 110)) for _ in range(2000)])
+
+
+def test_en_rules_match_engine():
+    program = load("en")
+    for n in _numbers():
+        assert program.run(str(n)) == convert(n, 0), n
+        assert program.run("ordinal %d" % n) == convert(n, 1), n
+
+
+def test_en_pack_matches_engine():
+    pack = SorosPack(load("en"), "en")
+    rng = random.Random(7)
+    for number in [0, 1, 0.01, 1.01, 21.5, -12.05] + [
+            round(rng.uniform(-10 ** 9, 10 ** 9), 2) for _ in range(500)]:
+        negative = number < 0
+        int_part = int(abs(number))
+        cents = round((abs(number) - int_part) * 100)
+        assert pack.words(negative, int_part, cents, 2) == convert(number, 2), number
+        assert pack.words(negative, int_part, 0, 1) == convert(int(number), 1), number
+    assert pack.words(True, 12, 5, 0) == "minus twelve point zero five"
+    with pytest.raises(ValueError, match="no rule"):
+        pack.words(False, 5, 0, 2, numtowords_core.currency_table("EUR"))
+
+
+def test_rule_syntax():
+    program = Program(r'''
+        # comment; not a rule
+        ^0 zero;  1 one;  2 two     # several rules on a line
+        "1\;2"  semi\;colon
+        (\d)(\d)  $1 \2 [and $2]
+        "x (.*)"  $(y \1)
+        == y ==
+        (\d)  why \1
+        == ==
+        "(.+)-(.+)"  [<$1>][<\2>]
+    ''')
+    assert program.run("0") == "zero"
+    assert program.run("1;2") == "semi;colon"
+    assert program.run("12") == "one 2 and two"
+    assert program.run("20") == "two 0 "            # "0" is not at the start: no rule
+    assert program.run("x 7") == "why 7"
+    assert program.run("y 7") == "why 7"
+    assert program.run("2-q") == "<two><q>"         # no call for q: its group counts
+    assert program.run("q-q") == "<q>"
+    assert program.run("007") == ""                 # left zeros deleted, then no rule
+    assert program.run("nothing") == ""
+
+
+def test_dispatch_keeps_rule_order():
+    # a literal rule after a regex rule that matches it never applies
+    program = Program(r'''
+        (\d)  digit \1
+        5     five
+        "f (\d)"  f$1
+        f 6   six
+    ''')
+    assert program.run("5") == "digit 5"
+    assert program.run("f 6") == "fdigit 6"
+    assert program.run("f 7") == "fdigit 7"
+
+
+def test_bad_rules():
+    for source in ("(\\d  x", "1 $(2", "1 [x"):
+        with pytest.raises(ValueError):
+            Program(source)
+    with pytest.raises(ValueError, match="too deep"):
+        Program("(.*) $(\\1)").run("1")
+
+
+def test_memo_cache_is_bounded():
+    with open(os.path.join(numtowords_soros.RULES_DIR, "en.sor"), encoding="utf-8") as f:
+        program = Program(f.read(), cache_max=50)
+    for n in range(1000, 1200):
+        assert program.run(str(n)) == convert(n, 0)
+    assert all(len(cache) <= 50 for cache in program._caches)
+
+
+def test_language_pack_uses_rule_file(tmp_path, monkeypatch):
+    (tmp_path / "qq.sor").write_text("^0 nul\n1 een\n(\\d)(\\d) $2 en $1\n",
+                                     encoding="utf-8")
+    monkeypatch.setattr(numtowords_soros, "RULES_DIR", str(tmp_path))
+    monkeypatch.setattr(numtowords_core, "_packs", {"en": numtowords_core._ENGLISH, "": numtowords_core._ENGLISH})
+    assert isinstance(numtowords_core.language_pack("qq-BE"), SorosPack)
+    assert convert(11, 0, "qq") == "een en een"
+    assert convert(0, 0, "qq", "upper") == "NUL"
+    assert numtowords_core.language_pack("yy") is numtowords_core.language_pack("en")
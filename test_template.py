@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for output templates (NUMTOWORDS.FMT).
+"""
+
+import pytest
+
+import numtowords_core
+import uno_stub
+from numtowords_core import compile_template, convert, format_words
+
+# (number, template, lang, currency, expected)
+CASES = [
+    (1250.05, "*** {words:upper} ONLY ***", "en", "USD",
+     "*** ONE THOUSAND TWO HUNDRED AND FIFTY DOLLARS AND FIVE CENTS ONLY ***"),
+    (1250.05, "{int:title} and {cents}/100 {unit:title}", "en", "USD",
+     "One Thousand Two Hundred and Fifty and 05/100 Dollars"),
+    (-21.01, "{sign}{int} {unit} and {minor} {minorunit}", "en", "GBP",
+     "minus twenty-one pounds and one penny"),
+    (21, "{ordinal:title} of {cardinal}", "en", "USD", "Twenty-First of twenty-one"),
+    (1500.4, "{words} [{cents}]", "en", "jpy", "one thousand five hundred yen []"),
+    (1.5, "{int:title} {unit}, {minor} {minorunit}", "de", "EUR", "Ein Euro, fünfzig Cent"),
+    (3, "{{{int}}}", "en", "USD", "{three}"),
+]
+
+
+def test_templates():
+    for number, template, lang, currency, expected in CASES:
+        assert format_words(number, template, lang, currency) == expected
+
+
+def test_fields_match_convert():
+    for number in (0, 1, 12.05, -1234.5, 10 ** 15 + 0.25):
+        for lang in ("en", "es", "de"):
+            assert format_words(number, "{words}|{cardinal}|{ordinal}", lang) == "|".join(
+                convert(number, fmt, lang) for fmt in (2, 0, 1))
+
+
+def test_bad_templates():
+    for template in ("{foo}", "{words:shout}", "{words!r}", "{", "{}", "{0}"):
+        with pytest.raises(ValueError):
+            compile_template(template)
+
+
+def test_template_cache_is_bounded():
+    first = compile_template("{int} first")
+    assert compile_template("{int} first") is first
+    for i in range(numtowords_core.TEMPLATES_MAX):
+        compile_template("{int} %d" % i)
+    assert len(numtowords_core._templates) <= numtowords_core.TEMPLATES_MAX
+    assert compile_template("{int} first") is not first     # evicted, parsed again
+
+
+def test_addin_fmt():
+    addin = uno_stub.load_addin().NumToWords(None)
+    assert addin.numToWordsFmt(1250.0, "*** {words:upper} ONLY ***") == \
+        "*** ONE THOUSAND TWO HUNDRED AND FIFTY DOLLARS ONLY ***"
+    assert addin.numToWordsFmt(2.0, "{int} {unit}", "gbp") == "two pounds"
+    assert addin.numToWordsFmt(2.0, "{int} {unit}", "gbp") == "two pounds"   # cached
+    assert addin.numToWordsFmt(1.0, "{nope}").startswith("Error: unknown template field")
+    addin.setLocale(uno_stub.Locale("es", "ES", ""))
+    assert addin.numToWordsFmt(21.0, "{int:upper} {unit:upper}", "EUR") == \
+        "VEINTIÚN EUROS"
+    assert addin.numToWordsStats("calls.template") >= 5
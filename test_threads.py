@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Stress tests for calling the add-in and the engine from several threads,
+as Calc does with threaded formula calculation.  Every thread's results
+must match the single-threaded ones and no counter may lose an update.
+"""
+
+import random
+import sys
+import threading
+
+import pytest
+
+import numtowords_core
+import uno_stub
+from numtowords_core import Currency, render
+
+THREADS = 8
+CALLS = 3000
+FORMATS = (0, 1, 2)
+STYLES = (None, "upper", "title noand", "upper only", "noand only")
+CURRENCIES = (None, "EUR", "gbp", "JPY")
+LOCALES = (("en", "US", ""), ("de", "DE", ""))
+
+
+def _run_threads(target, count=THREADS):
+    """Run target(index) on count threads at once; re-raise the first failure."""
+    failures = []
+    barrier = threading.Barrier(count)
+
+    def run(index):
+        try:
+            barrier.wait()
+            target(index)
+        except BaseException as e:
+            failures.append(e)
+
+    old = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)     # switch threads as often as possible
+    try:
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(old)
+    if failures:
+        raise failures[0]
+
+
+def _cache_stats(addin):
+    return {prop.Name: prop.Value for prop in addin.getCacheStats()}
+
+
+def _calls(seed):
+    rng = random.Random(seed)
+    values = [round(rng.uniform(-10 ** 6, 10 ** 6), 2) for _ in range(200)]
+    return [(rng.choice(values), rng.choice(FORMATS), rng.choice(STYLES),
+             rng.choice(CURRENCIES)) for _ in range(CALLS)]
+
+
+def test_addin_threads_match_single_thread():
+    module = uno_stub.load_addin()
+    workload = [_calls(seed) for seed in range(THREADS)]
+    expected = {}
+    for locale in LOCALES:
+        reference = module.NumToWords(None)
+        reference.setLocale(uno_stub.Locale(*locale))
+        for calls in workload:
+            for call in calls:
+                expected[locale + call] = reference.numToWords(*call)
+
+    addins = []
+    for locale in LOCALES:
+        addin = module.NumToWords(None)
+        addin.setLocale(uno_stub.Locale(*locale))
+        addins.append((locale, addin))
+    addins[0][1].resetStats()
+    wrong = []
+
+    def work(index):
+        locale, addin = addins[index % len(addins)]
+        for call in workload[index]:
+            words = addin.numToWords(*call)
+            if words != expected[locale + call]:
+                wrong.append((locale, call, words))
+
+    _run_threads(work)
+    assert wrong == []
+    assert addins[0][1].numToWordsStats("calls") == THREADS * CALLS
+    for _, addin in addins:
+        stats = _cache_stats(addin)
+        # every lookup counted once; two threads missing one key store it twice
+        assert stats["hits"] + stats["misses"] == THREADS // len(addins) * CALLS
+        assert stats["size"] <= stats["misses"] - stats["evictions"]
+
+
+def test_small_cache_threads():
+    module = uno_stub.load_addin()
+    addin = module.NumToWords(None)
+    addin._cache = module._LRUCache(37)     # constant eviction, uneven shards
+    calls = _calls(99)
+    expected = [module.NumToWords(None).numToWords(*call) for call in calls]
+
+    def work(index):
+        assert [addin.numToWords(*call) for call in calls] == expected
+
+    _run_threads(work)
+    stats = _cache_stats(addin)
+    assert stats["size"] <= 37
+    assert stats["hits"] + stats["misses"] == THREADS * CALLS
+
+
+class _PublishCheck(dict):
+    """Token ids, published only once the old spelling tables are gone."""
+
+    def __setitem__(self, key, tid):
+        assert not numtowords_core._spellings, "stale spelling table"
+        dict.__setitem__(self, key, tid)
+
+
+@pytest.fixture
+def scratch_vocabulary(monkeypatch):
+    # tokens interned by the test are dropped again afterwards
+    numtowords_core._tables()
+    known = len(numtowords_core._vocabulary)
+    monkeypatch.setattr(numtowords_core, "_token_ids",
+                        _PublishCheck(numtowords_core._token_ids))
+    yield
+    with numtowords_core._token_lock:
+        for key in numtowords_core._vocabulary[known:]:
+            numtowords_core._token_ids.pop(key, None)
+        del numtowords_core._vocabulary[known:]
+        numtowords_core._spellings.clear()
+
+
+def test_render_while_interning(scratch_vocabulary):
+    # new tokens (here: made-up currency names) may be interned on one
+    # thread while another builds a spelling table; no thread may see a
+    # table that is missing a token it holds
+    def work(index):
+        rng = random.Random(index)
+        for i in range(50):
+            name = "zorkmid%d_%d" % (index, i)
+            money = Currency("Z%d" % index, name, name + "s", "groat", "groats", 2)
+            ids = numtowords_core._tokens(False, 21, 1, 2, money)
+            style = rng.choice(STYLES[1:]) + " " * rng.randrange(40)   # new spec strings
+            words = render(ids, style)
+            assert words.lower().startswith("twenty-one " + name + "s and one groat")
+
+    _run_threads(work)
+    assert len(numtowords_core._vocabulary) >= THREADS * 50 * 2
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the token-stream output and styling options (tokens / render).
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from numtowords_core import convert, parse_style, render, tokens
+
+# (number, formatStyle, style, expected_words)
+CASES = [
+    (1234.56, 2, "upper only",
+     "ONE THOUSAND TWO HUNDRED AND THIRTY-FOUR DOLLARS AND FIFTY-SIX CENTS ONLY"),
+    (1234.56, 2, "Title",
+     "One Thousand Two Hundred and Thirty-Four Dollars and Fifty-Six Cents"),
+    (1234.56, 2, "title, noand, only",
+     "One Thousand Two Hundred Thirty-Four Dollars and Fifty-Six Cents Only"),
+    (101, 0, "noand", "one hundred one"),
+    (1, 2, "only", "one dollar only"),
+    (21, 1, "title", "Twenty-First"),
+    (2000, 1, "title", "Two Thousandth"),
+    (-12.05, 0, "upper", "MINUS TWELVE POINT  FIVE"),
+    (0, 0, "", "zero"),
+]
+
+
+def test_styles():
+    for number, fmt, style, expected in CASES:
+        assert render(tokens(number, fmt), style) == expected, (number, fmt, style)
+        assert convert(number, fmt, "en", style) == expected, (number, fmt, style)
+
+
+def test_plain_render_matches_convert():
+    rng = random.Random(17)
+    values = [rng.randrange(10 ** rng.randrange(1, 40)) for _ in range(2000)]
+    values += [round(rng.uniform(-10 ** 9, 10 ** 9), 2) for _ in range(2000)]
+    values += [Decimal("0.995"), "123456789012345678901234567890.5", 10 ** 36, 10 ** 66]
+    for value in values:
+        for fmt in (0, 1, 2):
+            if fmt == 1 and not isinstance(value, int):
+                continue
+            assert render(tokens(value, fmt)) == convert(value, fmt), (value, fmt)
+
+
+def test_parse_style():
+    assert parse_style("") == frozenset()
+    assert parse_style("UPPER+Only") == {"upper", "only"}
+    with pytest.raises(ValueError):
+        parse_style("bold")
+
+
+def test_other_languages_take_case_options():
+    assert convert(21.21, 2, "es", "title") == "Veintiún Dólares con Veintiún Centavos"
+    assert convert(2000000, 0, "de", "upper") == "ZWEI MILLIONEN"
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Stand-in UNO runtime for loading the shipped add-in headless.
+
+python/numtowords.uno.py imports uno, unohelper, a few com.sun.star types
+and the NumToWordsConverter interface from NumToWords.rdb, all of which
+only exist inside LibreOffice.  install() puts minimal stand-ins for them in
+sys.modules so the real component can be imported and called from plain
+CPython by the tests and benchmarks:
+
+    import uno_stub
+    addin = uno_stub.load_addin().NumToWords(None)
+    addin.numToWords(1234.5, 2)
+
+MarshallingProxy wraps a component so that every call pays a simulated
+bridge cost: argument and result sequences are copied, as the UNO bridge
+converts them, and a fixed per-call and per-value delay is spun.  The delays are assumptions, not
+measurements; pass figures measured on your LibreOffice to compare
+per-cell calls with the batch entry points.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+from time import perf_counter_ns
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ADDIN_PATH = os.path.join(HERE, "python", "numtowords.uno.py")
+DEFAULT_CALL_NS = 5000     # assumed cost of one bridged call
+DEFAULT_ITEM_NS = 100      # assumed cost per value converted to or from UNO
+
+
+class Base:
+    """unohelper.Base: the common base of Python UNO objects."""
+
+
+class ImplementationHelper:
+    """unohelper.ImplementationHelper; records the registered implementations."""
+
+    def __init__(self):
+        self.implementations = {}   # implementation name -> (constructor, services)
+
+    def addImplementation(self, ctor, implementationName, serviceNames):
+        self.implementations[implementationName] = (ctor, tuple(serviceNames))
+
+
+class Locale:
+    """com.sun.star.lang.Locale."""
+
+    def __init__(self, Language="", Country="", Variant=""):
+        self.Language = Language
+        self.Country = Country
+        self.Variant = Variant
+
+    def __eq__(self, other):
+        return (isinstance(other, Locale) and (self.Language, self.Country, self.Variant)
+                == (other.Language, other.Country, other.Variant))
+
+    def __repr__(self):
+        return "Locale(%r, %r, %r)" % (self.Language, self.Country, self.Variant)
+
+
+class PropertyValue:
+    """com.sun.star.beans.PropertyValue."""
+
+    def __init__(self, Name="", Value=None):
+        self.Name = Name
+        self.Value = Value
+
+
+class IllegalArgumentException(Exception):
+    """com.sun.star.lang.IllegalArgumentException."""
+
+    def __init__(self, Message="", Context=None, ArgumentPosition=0):
+        Exception.__init__(self, Message)
+        self.Message = Message
+        self.Context = Context
+        self.ArgumentPosition = ArgumentPosition
+
+
+def _interface(name):
+    return type(name, (), {"__doc__": "Stand-in for the %s UNO interface." % name})
+
+
+def install():
+    """Register the stand-in modules; names already imported are left alone."""
+    modules = {
+        "uno": {},
+        "unohelper": {"Base": Base, "ImplementationHelper": ImplementationHelper},
+        "com": {},
+        "com.sun": {},
+        "com.sun.star": {},
+        "com.sun.star.awt": {"XCallback": _interface("XCallback")},
+        "com.sun.star.beans": {"PropertyValue": PropertyValue},
+        "com.sun.star.lang": {
+            "Locale": Locale,
+            "IllegalArgumentException": IllegalArgumentException,
+            "XServiceInfo": _interface("XServiceInfo"),
+            "XLocalizable": _interface("XLocalizable"),
+        },
+        "com.sun.star.sheet": {"XAddIn": _interface("XAddIn")},
+        "com.sun.star.task": {"XJobExecutor": _interface("XJobExecutor")},
+        "com.numbertext": {},
+        "com.numbertext.converter": {
+            "NumToWordsConverter": _interface("NumToWordsConverter")},
+    }
+    for name, attributes in modules.items():
+        if name not in sys.modules:
+            module = types.ModuleType(name)
+            module.__dict__.update(attributes)
+            sys.modules[name] = module
+
+
+def load_addin(path=ADDIN_PATH):
+    """Import the add-in component (numtowords.uno.py) once; returns the module."""
+    module = sys.modules.get("numtowords_uno")
+    if module is not None:
+        return module
+    install()
+    pythonpath = os.path.join(os.path.dirname(path), "pythonpath")
+    if pythonpath not in sys.path:
+        sys.path.insert(0, pythonpath)    # as LibreOffice does for the extension
+    spec = importlib.util.spec_from_file_location("numtowords_uno", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["numtowords_uno"] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules["numtowords_uno"]
+        raise
+    return module
+
+
+def _marshal(value):
+    """A bridged copy of value and the number of values in it.
+
+    Sequences are rebuilt as tuples (the add-in's IDL nests them at most
+    two deep); the per-value cost itself is the proxy's item_ns.
+    """
+    if isinstance(value, (tuple, list)):
+        if value and isinstance(value[0], (tuple, list)):
+            rows = tuple(map(tuple, value))
+            return rows, sum(map(len, rows))
+        return tuple(value), len(value)
+    if isinstance(value, dict):
+        return dict(value), len(value)
+    return value, 1
+
+
+class MarshallingProxy:
+    """Calls a component as if through the UNO bridge; see the module docstring.
+
+    calls and values count what has crossed the simulated bridge.
+    """
+
+    def __init__(self, component, call_ns=DEFAULT_CALL_NS, item_ns=DEFAULT_ITEM_NS):
+        self._component = component
+        self.call_ns = call_ns
+        self.item_ns = item_ns
+        self.calls = 0
+        self.values = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._component, name)
+        if not callable(attr):
+            return attr
+
+        def bridged(*args):
+            n_in = 0
+            copies = []
+            for arg in args:
+                arg, n = _marshal(arg)
+                copies.append(arg)
+                n_in += n
+            n_out = 0        # an exception crosses back without a result
+            try:
+                result, n_out = _marshal(attr(*copies))
+                return result
+            finally:
+                self.calls += 1
+                self.values += n_in + n_out
+                deadline = (perf_counter_ns() + self.call_ns
+                            + self.item_ns * (n_in + n_out))
+                while perf_counter_ns() < deadline:
+                    pass
+
+        bridged.__name__ = name
+        self.__dict__[name] = bridged     # later calls skip __getattr__
+        return bridged